@@ -0,0 +1,31 @@
+"""add posts created_at id index
+
+Revision ID: 3f1b6c2d9a7e
+Revises: 629abe4f0c51
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3f1b6c2d9a7e"
+down_revision: Union[str, None] = "629abe4f0c51"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_posts_created_at_id", "posts", ["created_at", "id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_posts_created_at_id", table_name="posts")
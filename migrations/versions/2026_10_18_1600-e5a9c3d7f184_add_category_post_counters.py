@@ -0,0 +1,144 @@
+"""add category post counters
+
+Revision ID: e5a9c3d7f184
+Revises: d41c8e9f2b63
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e5a9c3d7f184"
+down_revision: Union[str, None] = "d41c8e9f2b63"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Триггеры уровня оператора с таблицами переходов: пачка COPY-импорта или
+# каскадное удаление обновляет каждую категорию один раз, а не на каждую строку.
+# last_post_at после удаления и переноса пересчитывается по индексу
+# (category_id, created_at) - это один шаг по индексу с конца
+TRIGGERS_SQL = [
+    """
+CREATE FUNCTION post_categories_count_inserted() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    UPDATE post_categories AS c
+    SET post_count = c.post_count + d.n,
+        last_post_at = GREATEST(c.last_post_at, d.last_post_at)
+    FROM (
+        SELECT category_id, count(*) AS n, max(created_at) AS last_post_at
+        FROM inserted_posts
+        GROUP BY category_id
+    ) AS d
+    WHERE c.id = d.category_id;
+    RETURN NULL;
+END
+$$
+""",
+    """
+CREATE FUNCTION post_categories_count_deleted() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    UPDATE post_categories AS c
+    SET post_count = c.post_count - d.n,
+        last_post_at = (
+            SELECT max(p.created_at) FROM posts AS p WHERE p.category_id = c.id
+        )
+    FROM (
+        SELECT category_id, count(*) AS n FROM deleted_posts GROUP BY category_id
+    ) AS d
+    WHERE c.id = d.category_id;
+    RETURN NULL;
+END
+$$
+""",
+    """
+CREATE FUNCTION post_categories_count_updated() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    UPDATE post_categories AS c
+    SET post_count = c.post_count + d.n,
+        last_post_at = (
+            SELECT max(p.created_at) FROM posts AS p WHERE p.category_id = c.id
+        )
+    FROM (
+        SELECT delta.category_id, sum(delta.n) AS n
+        FROM old_posts AS before_row
+        JOIN new_posts AS after_row ON after_row.id = before_row.id
+        CROSS JOIN LATERAL (
+            VALUES (before_row.category_id, -1), (after_row.category_id, 1)
+        ) AS delta (category_id, n)
+        WHERE before_row.category_id <> after_row.category_id
+            OR before_row.created_at IS DISTINCT FROM after_row.created_at
+        GROUP BY delta.category_id
+    ) AS d
+    WHERE c.id = d.category_id;
+    RETURN NULL;
+END
+$$
+""",
+    """
+CREATE TRIGGER posts_count_inserted
+AFTER INSERT ON posts REFERENCING NEW TABLE AS inserted_posts
+FOR EACH STATEMENT EXECUTE FUNCTION post_categories_count_inserted()
+""",
+    """
+CREATE TRIGGER posts_count_deleted
+AFTER DELETE ON posts REFERENCING OLD TABLE AS deleted_posts
+FOR EACH STATEMENT EXECUTE FUNCTION post_categories_count_deleted()
+""",
+    """
+CREATE TRIGGER posts_count_updated
+AFTER UPDATE ON posts REFERENCING OLD TABLE AS old_posts NEW TABLE AS new_posts
+FOR EACH STATEMENT EXECUTE FUNCTION post_categories_count_updated()
+""",
+]
+
+BACKFILL_SQL = """
+UPDATE post_categories AS c
+SET post_count = d.n, last_post_at = d.last_post_at
+FROM (
+    SELECT category_id, count(*) AS n, max(created_at) AS last_post_at
+    FROM posts
+    GROUP BY category_id
+) AS d
+WHERE c.id = d.category_id
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "post_categories",
+        sa.Column("post_count", sa.Integer(), server_default="0", nullable=False),
+    )
+    op.add_column(
+        "post_categories", sa.Column("last_post_at", sa.DateTime(), nullable=True)
+    )
+    op.create_index(
+        "ix_posts_category_id_created_at",
+        "posts",
+        ["category_id", "created_at"],
+        unique=False,
+    )
+    # Посты не должны меняться между подсчётом и установкой триггеров
+    op.execute("LOCK TABLE posts IN SHARE MODE")
+    op.execute(BACKFILL_SQL)
+    for statement in TRIGGERS_SQL:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for event in ("inserted", "deleted", "updated"):
+        op.execute(f"DROP TRIGGER posts_count_{event} ON posts")
+        op.execute(f"DROP FUNCTION post_categories_count_{event}()")
+    op.drop_index("ix_posts_category_id_created_at", table_name="posts")
+    op.drop_column("post_categories", "last_post_at")
+    op.drop_column("post_categories", "post_count")
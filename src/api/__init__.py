@@ -1,13 +1,22 @@
 from api.admin.categories import router as category_router
+from api.admin.exports import router as export_router
+from api.admin.metrics import router as metrics_router
 from api.admin.posts import router as post_router
 from api.admin.users import router as user_router
 from api.public.auth import router as auth_router
+from api.public.autocomplete import router as autocomplete_router
 from api.public.categories import router as categories_router
 from api.public.health import router as health_router
 from api.public.posts import router as posts_router
 from api.public.users import router as profile_router
 
-admin_routers = [user_router, post_router, category_router]
+admin_routers = [
+    user_router,
+    post_router,
+    category_router,
+    metrics_router,
+    export_router,
+]
 
 public_routers = [
     health_router,
@@ -15,4 +24,5 @@ public_routers = [
     profile_router,
     posts_router,
     categories_router,
+    autocomplete_router,
 ]
@@ -5,13 +5,14 @@ from fastapi import APIRouter, Depends, Form, Query, Request, Response, status
 from api.admin.schemas import CategoryPut
 from api.permissions.is_admin import is_admin
 from application.use_cases.categories.create import CategoryCreateUseCase
+from application.use_cases.categories.recount import CategoryRecountUseCase
 from application.use_cases.categories.update import CategoryUpdateUseCase
 from application.use_cases.common.create import ModelObjectCreateUseCase
 from application.use_cases.common.delete import ModelObjectDeleteUseCase
 from application.use_cases.common.list import ModelObjectListUseCase
 from application.use_cases.common.retrieve import ModelObjectRetrieveUseCase
 from application.use_cases.common.update import ModelObjectUpdateUseCase
-from application.use_cases.dto import CreateCategoryDTO
+from application.use_cases.dto import CategoryRecountResultDTO, CreateCategoryDTO
 from application.use_cases.posts.create import PostCreateUseCase
 from config.containers import Container
 from domain.entities.category import Category
@@ -42,6 +43,17 @@ async def list_categories(
     )
 
 
+@router.post("/recount", status_code=status.HTTP_200_OK)
+@inject
+async def recount_categories(
+    use_case: CategoryRecountUseCase = Depends(
+        Provide[Container.category_recount_use_case]
+    ),
+) -> CategoryRecountResultDTO:
+    """Пересчитать post_count и last_post_at категорий по постам"""
+    return await use_case.execute()
+
+
 @router.get(
     "/{category_id}", response_model=CategoryRead, status_code=status.HTTP_200_OK
 )
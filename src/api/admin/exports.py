@@ -0,0 +1,90 @@
+from datetime import UTC, datetime
+from typing import AsyncIterator, Optional
+
+from dependency_injector.wiring import Provide, inject
+from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import StreamingResponse
+
+from api.permissions.is_admin import is_admin
+from application.use_cases.common.export import ModelObjectExportUseCase
+from config.containers import Container
+from config.settings import Settings
+from domain.entities.enums import ModelType
+from infrastructure.managers.dto import ExportFileDTO
+from infrastructure.managers.stream_writer import gzip_chunks, write_file
+from infrastructure.repositories.enum import CopyFormat
+
+router = APIRouter(
+    tags=["Exports"], prefix="/exports", dependencies=[Depends(is_admin)]
+)
+
+MEDIA_TYPES = {
+    CopyFormat.CSV: "text/csv",
+    CopyFormat.BINARY: "application/octet-stream",
+}
+EXTENSIONS = {CopyFormat.CSV: "csv", CopyFormat.BINARY: "pgcopy"}
+
+
+class Export:
+    __slots__ = ("chunks", "filename", "media_type")
+
+    def __init__(
+        self, chunks: AsyncIterator[bytes], filename: str, media_type: str
+    ) -> None:
+        self.chunks = chunks
+        self.filename = filename
+        self.media_type = media_type
+
+
+@inject
+async def export_table(
+    model_type: ModelType,
+    columns: Optional[str] = Query(
+        None, description="Колонки через запятую; по умолчанию все"
+    ),
+    updated_from: Optional[datetime] = Query(
+        None, description="updated_at >= (только для таблиц с updated_at)"
+    ),
+    updated_to: Optional[datetime] = Query(None, description="updated_at <"),
+    format_: CopyFormat = Query(CopyFormat.CSV, alias="format"),
+    gzip: bool = Query(False, description="Сжимать gzip на лету"),
+    use_case: ModelObjectExportUseCase = Depends(
+        Provide[Container.object_export_use_case]
+    ),
+) -> Export:
+    chunks = await use_case.execute(
+        model_type,
+        columns=[name.strip() for name in columns.split(",")] if columns else None,
+        updated_from=updated_from,
+        updated_to=updated_to,
+        format=format_,
+    )
+    filename = (
+        f"{model_type.value}-{datetime.now(UTC):%Y%m%dT%H%M%S}.{EXTENSIONS[format_]}"
+    )
+    if gzip:
+        return Export(gzip_chunks(chunks), f"{filename}.gz", "application/gzip")
+    return Export(chunks, filename, MEDIA_TYPES[format_])
+
+
+@router.get("/{model_type}", status_code=status.HTTP_200_OK)
+async def download_table(export: Export = Depends(export_table)) -> StreamingResponse:
+    """Выгрузить таблицу потоком через COPY, без ORM-объектов"""
+    return StreamingResponse(
+        export.chunks,
+        media_type=export.media_type,
+        headers={"Content-Disposition": f'attachment; filename="{export.filename}"'},
+    )
+
+
+@router.post("/{model_type}/backup", status_code=status.HTTP_201_CREATED)
+@inject
+async def backup_table(
+    export: Export = Depends(export_table),
+    settings: Settings = Depends(Provide[Container.settings]),
+) -> ExportFileDTO:
+    """Снимок таблицы в файл каталога выгрузок"""
+    size = await write_file(
+        export.chunks, settings.export.directory / export.filename
+    )
+    return ExportFileDTO(path=export.filename, size=size)
@@ -0,0 +1,81 @@
+from dependency_injector.wiring import Provide, inject
+from fastapi import APIRouter, Depends, status
+
+from api.permissions.is_admin import is_admin
+from config.containers import Container
+from infrastructure.managers.autocomplete import AutocompleteIndex
+from infrastructure.managers.cache import TTLCache
+from infrastructure.managers.dto import (
+    AutocompleteStatsDTO,
+    CacheStatsDTO,
+    PasswordHashingStatsDTO,
+    ResponseCacheStatsDTO,
+)
+from infrastructure.managers.password_hasher import PasswordHasher
+from infrastructure.managers.response_cache import ResponseCache
+from infrastructure.repositories.alchemy.db import Database
+from infrastructure.repositories.alchemy.dto import PoolStatusDTO, ReplicaStatusDTO
+
+router = APIRouter(
+    tags=["Metrics"], prefix="/metrics", dependencies=[Depends(is_admin)]
+)
+
+
+@router.get("/caches", status_code=status.HTTP_200_OK)
+@inject
+async def cache_stats(
+    principal_cache: TTLCache = Depends(Provide[Container.principal_cache]),
+    token_cache: TTLCache = Depends(Provide[Container.token_cache]),
+) -> dict[str, CacheStatsDTO]:
+    """Статистика попаданий in-process кэшей"""
+    return {
+        "principal": principal_cache.stats(),
+        "token": token_cache.stats(),
+    }
+
+
+@router.get("/response-cache", status_code=status.HTTP_200_OK)
+@inject
+async def response_cache_stats(
+    response_cache: ResponseCache = Depends(Provide[Container.response_cache]),
+) -> ResponseCacheStatsDTO:
+    """Попадания кэша публичных ответов и время ответа из кэша и без него"""
+    return response_cache.stats()
+
+
+@router.get("/autocomplete", status_code=status.HTTP_200_OK)
+@inject
+async def autocomplete_stats(
+    index: AutocompleteIndex = Depends(Provide[Container.autocomplete]),
+) -> AutocompleteStatsDTO:
+    """Размер индекса подсказок, занятая им память и время последней сборки"""
+    return index.stats()
+
+
+@router.get("/password-hashing", status_code=status.HTTP_200_OK)
+@inject
+async def password_hashing_stats(
+    password_hasher: PasswordHasher = Depends(Provide[Container.password_hasher]),
+) -> PasswordHashingStatsDTO:
+    """Параметры argon2 после калибровки и загрузка пула хеширования"""
+    return password_hasher.stats()
+
+
+@router.get("/db-pool", status_code=status.HTTP_200_OK)
+@inject
+async def db_pool_status(
+    database: Database = Depends(Provide[Container.db.db]),
+) -> PoolStatusDTO:
+    """Состояние единственного пула соединений процесса"""
+    return database.pool_status()
+
+
+@router.get("/db-replicas", status_code=status.HTTP_200_OK)
+@inject
+async def db_replicas_status(
+    database: Database = Depends(Provide[Container.db.db]),
+) -> list[ReplicaStatusDTO]:
+    """Реплики для чтения: доступность по последней проверке и занятые соединения"""
+    if database.replicas is None:
+        return []
+    return database.replicas.status()
@@ -1,21 +1,25 @@
 from typing import Optional
 
 from common.dto import PostRead
+from common.exceptions import APIException
 from dependency_injector.wiring import Provide, inject
 from fastapi import APIRouter, Depends, Form, Query, Request, Response, status
 
 from api.admin.schemas import PostPut
 from api.permissions.is_admin import is_admin
+from api.utils import StreamFormat, stream_format, streaming_response
 from application.use_cases.common.delete import ModelObjectDeleteUseCase
 from application.use_cases.common.list import ModelObjectListUseCase
 from application.use_cases.common.retrieve import ModelObjectRetrieveUseCase
 from application.use_cases.common.update import ModelObjectUpdateUseCase
-from application.use_cases.dto import CreatePostDTO
+from application.use_cases.dto import CreatePostDTO, PostImportResultDTO
 from application.use_cases.posts.create import PostCreateUseCase
+from application.use_cases.posts.import_posts import PostImportUseCase
 from application.use_cases.posts.update import PostUpdateUseCase
 from config.containers import Container
 from domain.entities.enums import ModelType
 from domain.validators.dto import PaginatedResponse
+from infrastructure.managers.stream_reader import read_csv, read_ndjson
 
 router = APIRouter(tags=["Posts"], prefix="/posts", dependencies=[Depends(is_admin)])
 
@@ -28,15 +32,24 @@ async def list_posts(
     request: Request,
     page: int = Query(1, ge=1),
     page_size: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Курсор из next_cursor"),
+    format_: Optional[StreamFormat] = Query(
+        None, alias="format", description="Выгрузить все посты потоком"
+    ),
     use_case: ModelObjectListUseCase = Depends(Provide[Container.object_list_use_case]),
 ) -> PaginatedResponse[PostRead]:
-    """Получить список постов"""
+    """Получить список постов (или все посты потоком NDJSON/CSV)"""
+    if streaming := stream_format(request, format_):
+        return streaming_response(
+            use_case.stream(ModelType.POSTS, PostRead), PostRead, streaming
+        )
     return await use_case.execute(
         request=request,
         ObjectDTO=PostRead,
         model_type=ModelType.POSTS,
         page=page,
         page_size=page_size,
+        cursor=cursor,
     )
 
 
@@ -73,6 +86,29 @@ async def create_post(
     return await use_case.execute(data=data)
 
 
+@router.post("/import", status_code=status.HTTP_200_OK)
+@inject
+async def import_posts(
+    request: Request,
+    use_case: PostImportUseCase = Depends(Provide[Container.post_import_use_case]),
+) -> PostImportResultDTO:
+    """
+    Массовый импорт постов: тело - NDJSON (application/x-ndjson) или CSV
+    (text/csv) с полями title, body, category, author_email.
+    Тело читается потоком, ошибочные строки перечисляются в ответе
+    """
+    content_type = request.headers.get("content-type", "")
+    if content_type.startswith("text/csv"):
+        records = read_csv(request.stream())
+    elif content_type.startswith(("application/x-ndjson", "application/jsonl")):
+        records = read_ndjson(request.stream())
+    else:
+        raise APIException(
+            code=415, message="Ожидается application/x-ndjson или text/csv"
+        )
+    return await use_case.execute(records)
+
+
 @router.delete("/{post_id}", status_code=status.HTTP_204_NO_CONTENT)
 @inject
 async def delete_post(
@@ -1,8 +1,11 @@
+from typing import Optional
+
 from dependency_injector.wiring import Provide, inject
 from fastapi import APIRouter, Depends, Query, Request, status
 
 from api.admin.schemas import ChangeUserRoleDTO
 from api.permissions.is_admin import is_admin
+from api.utils import StreamFormat, stream_format, streaming_response
 from application.use_cases.users.dto import UserDTO
 from application.use_cases.users.list import UsersListUseCase
 from application.use_cases.users.retrieve import UserRetrieveUseCase
@@ -21,9 +24,14 @@ async def list_users(
     request: Request,
     page: int = Query(1, ge=1),
     page_size: int = Query(10, ge=1, le=100),
+    format_: Optional[StreamFormat] = Query(
+        None, alias="format", description="Выгрузить всех пользователей потоком"
+    ),
     use_case: UsersListUseCase = Depends(Provide[Container.users_list_use_case]),
 ) -> PaginatedResponse[UserDTO]:
-    """Получить список пользователей с пагинацией"""
+    """Получить список пользователей с пагинацией (или всех потоком NDJSON/CSV)"""
+    if streaming := stream_format(request, format_):
+        return streaming_response(use_case.stream(), UserDTO, streaming)
     return await use_case.execute(request=request, page=page, page_size=page_size)
 
 
@@ -0,0 +1,80 @@
+from functools import wraps
+from time import perf_counter
+from typing import Any, Callable
+
+from fastapi import Request, Response, status
+from pydantic import BaseModel
+
+from api.conditional import is_not_modified, not_modified
+from api.utils import canonical_url as cache_key
+from domain.entities.enums import ModelType
+
+VALIDATOR_HEADERS = ("ETag", "Last-Modified")
+
+
+def cache_response(
+    *depends_on: ModelType, ttl: float | None = None
+) -> Callable[[Callable], Callable]:
+    """
+    Кэширует сериализованный ответ публичного GET-эндпоинта.
+    depends_on - модели, от которых зависит ответ: запись сбрасывается,
+    когда use case коммитит изменения любой из них
+    """
+    tags = tuple(model_type.value for model_type in depends_on)
+
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            request: Request = kwargs["request"]
+            container = request.app.container
+            if not container.settings().cache.response_enabled:
+                return await func(*args, **kwargs)
+
+            cache = container.response_cache()
+            key = cache_key(request)
+            started = perf_counter()
+
+            cached = cache.get(key)
+            if cached is not None:
+                # Запись сбрасывается при изменениях, поэтому её валидаторы актуальны
+                if is_not_modified(request, cached.headers):
+                    response = not_modified(cached.headers)
+                else:
+                    response = Response(
+                        cached.body,
+                        media_type=cached.media_type,
+                        headers=cached.headers,
+                    )
+                response.headers["X-Cache"] = "HIT"
+                cache.record(hit=True, seconds=perf_counter() - started)
+                return response
+
+            result = await func(*args, **kwargs)
+            if isinstance(result, BaseModel):
+                body = result.model_dump_json(by_alias=True).encode()
+                headers = {}
+            elif (
+                isinstance(result, Response)
+                and result.status_code == status.HTTP_200_OK
+            ):
+                # Ответ conditional_get: кэшируем вместе с ETag/Last-Modified
+                body = bytes(result.body)
+                headers = {
+                    name: result.headers[name]
+                    for name in VALIDATOR_HEADERS
+                    if name in result.headers
+                }
+            else:
+                return result
+
+            cache.set(key, body, tags, ttl=ttl, headers=headers)
+            cache.record(hit=False, seconds=perf_counter() - started)
+            return Response(
+                body,
+                media_type="application/json",
+                headers={**headers, "X-Cache": "MISS"},
+            )
+
+        return wrapper
+
+    return decorator
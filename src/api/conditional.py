@@ -0,0 +1,107 @@
+from datetime import timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from functools import wraps
+from hashlib import sha256
+from typing import Any, Awaitable, Callable, Mapping
+
+from fastapi import Request, Response, status
+from pydantic import BaseModel
+
+from api.utils import canonical_url
+from domain.validators.dto import ResourceVersion
+
+VersionGetter = Callable[[dict[str, Any]], Awaitable[ResourceVersion | None]]
+
+
+def make_validators(request: Request, version: ResourceVersion) -> dict[str, str]:
+    """
+    ETag и Last-Modified по версии ресурса.
+    URL входит в хеш, поэтому разные страницы одной выборки не совпадают.
+    ETag слабый: имя автора или категории в теле может смениться без смены версии
+    """
+    raw = "|".join(
+        map(
+            str,
+            (
+                canonical_url(request),
+                version.count,
+                version.last_modified,
+                version.fingerprint,
+            ),
+        )
+    )
+    headers = {"ETag": f'W/"{sha256(raw.encode()).hexdigest()[:32]}"'}
+    if version.last_modified is not None:
+        # Колонки без часового пояса заполняются в UTC
+        headers["Last-Modified"] = format_datetime(
+            version.last_modified.replace(tzinfo=timezone.utc, microsecond=0),
+            usegmt=True,
+        )
+    return headers
+
+
+def is_not_modified(request: Request, validators: Mapping[str, str]) -> bool:
+    """If-None-Match важнее If-Modified-Since (RFC 9110, 13.2.2)"""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        etag = validators.get("ETag")
+        if etag is None:
+            return False
+        if if_none_match.strip() == "*":
+            return True
+        # Слабое сравнение: W/ не учитывается
+        candidates = {
+            tag.strip().removeprefix("W/") for tag in if_none_match.split(",")
+        }
+        return etag.removeprefix("W/") in candidates
+
+    if_modified_since = request.headers.get("if-modified-since")
+    last_modified = validators.get("Last-Modified")
+    if if_modified_since is None or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    return parsedate_to_datetime(last_modified) <= since
+
+
+def not_modified(validators: Mapping[str, str]) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=dict(validators))
+
+
+def conditional_get(get_version: VersionGetter) -> Callable[[Callable], Callable]:
+    """
+    Условный GET: версия ресурса считается отдельным дешёвым запросом,
+    и при совпадении валидаторов клиент получает 304 без выборки и сериализации.
+    get_version получает аргументы эндпоинта и возвращает None,
+    если ресурса нет, - тогда ошибку отдаёт сам эндпоинт
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            request: Request = kwargs["request"]
+            version = await get_version(kwargs)
+            if version is None:
+                return await func(*args, **kwargs)
+
+            validators = make_validators(request, version)
+            if is_not_modified(request, validators):
+                return not_modified(validators)
+
+            result = await func(*args, **kwargs)
+            if not isinstance(result, BaseModel):
+                return result
+
+            return Response(
+                result.model_dump_json(by_alias=True),
+                media_type="application/json",
+                headers=validators,
+            )
+
+        return wrapper
+
+    return decorator
@@ -9,3 +9,17 @@ class UserIsNotAuthenticatedError(DomainException):
 class UserIsNotAdminError(DomainException):
     code = 10402
     message = "User has no admin permissions."
+
+
+class AuthenticationError(DomainException):
+    code = 10001
+    message = "Authentication token is invalid."
+    detail = "The provided token is malformed, missing, or failed verification."
+
+
+class TokenExpiredError(DomainException):
+    code = 10002
+    message = "Authentication token has expired."
+    detail = (
+        "The token expired at the expected expiration time. Please re-authenticate."
+    )
@@ -1,10 +1,11 @@
 from fastapi import Request
 
 from api.permissions.exceptions import UserIsNotAdminError
+from api.permissions.principal import get_current_user
 from infrastructure.enum import RoleEnum
 
 
 async def is_admin(request: Request):
-    user = getattr(request.state, "user", None)
+    user = await get_current_user(request)
     if not user or not getattr(user, "role", False) == RoleEnum.ADMIN:
         raise UserIsNotAdminError
@@ -4,13 +4,14 @@ from typing import Any, Callable
 from fastapi import Request
 
 from api.permissions.exceptions import UserIsNotAuthenticatedError
+from api.permissions.principal import get_current_user
 
 
 def is_authenticated(func: Callable) -> Callable:
     @wraps(func)
     async def wrapper(*args: Any, **kwargs: Any) -> Any:
         request = kwargs.get("request")
-        if request and request.state.user:
+        if request and await get_current_user(request):
             return await func(*args, **kwargs)
         raise UserIsNotAuthenticatedError()
 
@@ -18,6 +19,6 @@ def is_authenticated(func: Callable) -> Callable:
 
 
 async def is_user(request: Request):
-    user = getattr(request.state, "user", None)
+    user = await get_current_user(request)
     if not user:
         raise UserIsNotAuthenticatedError
@@ -0,0 +1,181 @@
+from datetime import datetime, timezone
+
+import jwt
+from fastapi import Request
+from jwt import ExpiredSignatureError
+from pydantic import ValidationError
+
+from api.permissions.exceptions import AuthenticationError, TokenExpiredError
+from api.schemas import UserDTO
+from domain.entities.user import User
+from infrastructure.managers.cache import TTLCache
+from infrastructure.managers.jwt_manager import JWTManager
+from infrastructure.managers.revocation import TokenRevocationList
+from infrastructure.managers.token_versions import TokenVersionRegistry
+from infrastructure.repositories.alchemy.db import Database
+from infrastructure.repositories.alchemy.users import SqlAlchemyUsersRepository
+
+
+async def get_current_user(request: Request) -> User | None:
+    """
+    Пользователь запроса, определяется лениво и один раз на запрос:
+    JWT и БД трогают только маршруты, которым нужен пользователь
+    """
+    if hasattr(request.state, "user"):
+        return request.state.user
+
+    container = request.app.container
+    resolver = JwtTokenUserResolver(
+        jwt_manager=container.jwt_manager(),
+        principal_cache=container.principal_cache(),
+        database=container.db.db(),
+        token_versions=container.token_versions(),
+        revocations=container.token_revocations(),
+        trust_claims=container.settings().jwt.trust_claims,
+    )
+    request.state.user = await resolver.resolve(request)
+    return request.state.user
+
+
+class JwtTokenUserResolver:
+    def __init__(
+        self,
+        jwt_manager: JWTManager,
+        principal_cache: TTLCache[int, User],
+        database: Database,
+        token_versions: TokenVersionRegistry,
+        revocations: TokenRevocationList,
+        trust_claims: bool = False,
+    ) -> None:
+        self.jwt_manager = jwt_manager
+        self.principal_cache = principal_cache
+        self.database = database
+        self.token_versions = token_versions
+        self.revocations = revocations
+        self.trust_claims = trust_claims
+
+    async def resolve(self, request: Request) -> User | None:
+        authorization = request.headers.get("Authorization")
+        if not authorization:
+            return None
+
+        try:
+            scheme, token = authorization.split()
+        except ValueError:
+            raise AuthenticationError(detail="Malformed Authorization header.")
+
+        if scheme.lower() != "bearer":
+            raise AuthenticationError(detail="Expected 'Bearer' authentication scheme.")
+
+        payload = self._decode_token(token)
+
+        if request.url.path.endswith("/refresh"):
+            expected_type = "refresh"
+        else:
+            expected_type = "access"
+
+        self._validate_token_type(payload, expected_type)
+        self._validate_expiration_time(payload)
+        validated = self._validate_payload(payload)
+
+        if await self.revocations.is_revoked(
+            self.jwt_manager.get_token_id(token, payload)
+        ):
+            raise AuthenticationError(detail="Token has been revoked.")
+        request.state.token = token
+
+        # Отзыв всех сессий (смена роли, повтор refresh) касается обоих путей:
+        # пользователь из кэша может быть старше bump версии
+        version = payload.get("ver", 0)
+        if await self.token_versions.is_revoked(validated.id, version):
+            raise AuthenticationError(detail="Token has been revoked.")
+
+        # Токены, выданные до появления профиля в claims, идут обычным путём
+        if self.trust_claims and "first_name" in payload:
+            return self._user_from_claims(payload, validated)
+
+        user = self.principal_cache.get(validated.id)
+        if not user:
+            # Общий с unit of work пул соединений процесса
+            async with self.database.session_factory() as session:
+                user = await SqlAlchemyUsersRepository(session).get_identity(
+                    validated.id
+                )
+            if not user:
+                raise AuthenticationError(detail="User not found in DB.")
+            self.principal_cache.set(validated.id, user)
+
+        # Версия из БД точнее реестра, который перечитывается периодически
+        if version < user.token_version:
+            raise AuthenticationError(detail="Token has been revoked.")
+        return user
+
+    def _user_from_claims(self, payload: dict, validated: UserDTO) -> User:
+        registration_date = payload.get("registration_date")
+        return User(
+            id=validated.id,
+            email=validated.email,
+            role=validated.role,
+            first_name=payload["first_name"],
+            last_name=payload.get("last_name"),
+            registration_date=(
+                datetime.fromisoformat(registration_date) if registration_date else None
+            ),
+            token_version=payload.get("ver", 0),
+        )
+
+    def _decode_token(self, token: str) -> dict:
+        try:
+            # Подпись проверяется один раз на токен, тип и срок - на каждый запрос
+            return self.jwt_manager.decode_token(token)
+        except ExpiredSignatureError:
+            raise TokenExpiredError(
+                detail="Token expired at timestamp: {}", *["{}".format(datetime.now())]
+            )
+        except jwt.PyJWTError as e:
+            raise AuthenticationError(detail="JWT decoding failed: {}", *[str(e)])
+
+    def _validate_token_type(
+        self, payload: dict, expected_type: str = "access"
+    ) -> None:
+        token_type = payload.get("token_type")
+        if token_type != expected_type:
+            raise AuthenticationError(
+                detail=f"Token type must be '{expected_type}', got '{token_type}'"
+            )
+
+    # todo пофиксить ошибку времени жизни у токена
+    def _validate_expiration_time(self, payload: dict) -> None:
+        try:
+            exp = payload.get("exp")
+            if exp is None:
+                return
+
+            if isinstance(exp, str):
+                try:
+                    exp = float(exp)
+                except ValueError:
+                    return
+
+            if exp > 1e12:
+                exp /= 1000
+
+            try:
+                expiration_time = datetime.fromtimestamp(exp, tz=timezone.utc)
+            except (OSError, OverflowError, ValueError):
+                return
+
+            current_time = datetime.now(tz=timezone.utc)
+            if expiration_time < current_time:
+                raise TokenExpiredError(
+                    detail=f"Token expired at: {expiration_time.isoformat()}"
+                )
+
+        except Exception:
+            return
+
+    def _validate_payload(self, payload: dict) -> UserDTO:
+        try:
+            return UserDTO(**payload)
+        except ValidationError as e:
+            raise AuthenticationError(detail="Invalid token payload: {}", *[str(e)])
@@ -1,12 +1,22 @@
+from typing import Optional
+
 from dependency_injector.wiring import Provide, inject
 from fastapi import APIRouter, Depends, Request, status
 
+from api.permissions.is_authenticated import is_authenticated
 from application.use_cases.auth.dto import TokenDTO
 from application.use_cases.auth.login import LoginUseCase
+from application.use_cases.auth.logout import LogoutUseCase
 from application.use_cases.auth.refresh import RefreshTokenUseCase
 from application.use_cases.auth.register import RegisterUserUseCase
 from config.containers import Container
-from domain.validators.base import RefreshTokenDTO, UserLoginDTO, UserRegisterDTO
+from domain.validators.base import (
+    LogoutDTO,
+    RefreshTokenDTO,
+    UserLoginDTO,
+    UserRegisterDTO,
+)
+from infrastructure.managers.rate_limiter import AuthRateLimiter
 
 router = APIRouter(tags=["Authorization"], prefix="/auth")
 
@@ -14,18 +24,24 @@ router = APIRouter(tags=["Authorization"], prefix="/auth")
 @router.post("/register", status_code=status.HTTP_200_OK)
 @inject
 async def register(
+    request: Request,
     data: UserRegisterDTO = Depends(),
+    rate_limiter: AuthRateLimiter = Depends(Provide[Container.auth_rate_limiter]),
     use_case: RegisterUserUseCase = Depends(Provide[Container.register_use_case]),
 ) -> TokenDTO:
+    rate_limiter.check(request.client and request.client.host, data.email)
     return await use_case.execute(data)
 
 
 @router.post("/login", status_code=status.HTTP_200_OK)
 @inject
 async def login(
+    request: Request,
     data: UserLoginDTO = Depends(),
+    rate_limiter: AuthRateLimiter = Depends(Provide[Container.auth_rate_limiter]),
     use_case: LoginUseCase = Depends(Provide[Container.login_use_case]),
 ) -> TokenDTO:
+    rate_limiter.check(request.client and request.client.host, data.email)
     return await use_case.execute(data)
 
 
@@ -47,3 +63,16 @@ async def refresh_token(
     refresh_token = auth_header.split(" ", 1)[1].strip()
     data = RefreshTokenDTO(refresh_token=refresh_token)
     return await use_case.execute(data)
+
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+@inject
+@is_authenticated
+async def logout(
+    request: Request,
+    data: Optional[LogoutDTO] = None,
+    use_case: LogoutUseCase = Depends(Provide[Container.logout_use_case]),
+) -> None:
+    await use_case.execute(
+        request.state.user.id, request.state.token, data or LogoutDTO()
+    )
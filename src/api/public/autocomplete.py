@@ -0,0 +1,19 @@
+from dependency_injector.wiring import Provide, inject
+from fastapi import APIRouter, Depends, Query, status
+
+from config.containers import Container
+from infrastructure.managers.autocomplete import AutocompleteIndex
+from infrastructure.managers.dto import AutocompleteDTO
+
+router = APIRouter(tags=["Autocomplete"], prefix="/autocomplete")
+
+
+@router.get("/", status_code=status.HTTP_200_OK)
+@inject
+async def autocomplete(
+    q: str = Query(..., max_length=255, description="Начало заголовка или названия"),
+    limit: int = Query(10, ge=1, le=50),
+    index: AutocompleteIndex = Depends(Provide[Container.autocomplete]),
+) -> AutocompleteDTO:
+    """Подсказки по началу заголовков постов и названий категорий, без запросов к БД"""
+    return await index.suggest(q, limit)
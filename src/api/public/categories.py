@@ -1,7 +1,11 @@
+from typing import Optional
+
 from common.dto import CategoryRead, PostRead
 from dependency_injector.wiring import Provide, inject
 from fastapi import APIRouter, Depends, Query, Request, status
 
+from api.cache import cache_response
+from api.conditional import conditional_get
 from application.use_cases.categories.list_posts import PostByCategoryUseCase
 from application.use_cases.common.list import ModelObjectListUseCase
 from config.containers import Container
@@ -15,6 +19,9 @@ router = APIRouter(tags=["Public Category"], prefix="/categories")
     "/", response_model=PaginatedResponse[CategoryRead], status_code=status.HTTP_200_OK
 )
 @inject
+# В ответе счётчики постов - запись сбрасывается и при изменении постов
+@cache_response(ModelType.CATEGORIES, ModelType.POSTS, ttl=300)
+@conditional_get(lambda kwargs: kwargs["use_case"].get_version(ModelType.CATEGORIES))
 async def list_categories(
     request: Request,
     page: int = Query(1, ge=1),
@@ -36,9 +43,14 @@ async def list_categories(
     status_code=status.HTTP_200_OK,
 )
 @inject
+@cache_response(ModelType.POSTS, ModelType.CATEGORIES, ModelType.USERS)
+@conditional_get(lambda kwargs: kwargs["use_case"].get_version(kwargs["title_slug"]))
 async def list_posts_by_category(
     title_slug: str,
     request: Request,
+    page: int = Query(1, ge=1),
+    page_size: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Курсор из next_cursor"),
     use_case: PostByCategoryUseCase = Depends(
         Provide[Container.post_by_category_use_case]
     ),
@@ -46,4 +58,7 @@ async def list_posts_by_category(
     return await use_case.execute(
         request=request,
         category_name=title_slug,
+        page=page,
+        page_size=page_size,
+        cursor=cursor,
     )
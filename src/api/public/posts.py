@@ -1,9 +1,14 @@
-from common.dto import PostRead
+from typing import Optional
+
+from common.dto import PostRead, PostSearchHit
 from dependency_injector.wiring import Provide, inject
 from fastapi import APIRouter, Depends, Query, Request, status
 
+from api.cache import cache_response
+from api.conditional import conditional_get
 from application.use_cases.common.list import ModelObjectListUseCase
 from application.use_cases.posts.retrieve import PostRetriveUseCase
+from application.use_cases.posts.search import PostSearchUseCase
 from config.containers import Container
 from domain.entities.enums import ModelType
 from domain.validators.dto import PaginatedResponse
@@ -15,10 +20,13 @@ router = APIRouter(tags=["Public Post"], prefix="/posts")
     "/", response_model=PaginatedResponse[PostRead], status_code=status.HTTP_200_OK
 )
 @inject
+@cache_response(ModelType.POSTS, ModelType.CATEGORIES, ModelType.USERS)
+@conditional_get(lambda kwargs: kwargs["use_case"].get_version(ModelType.POSTS))
 async def list_posts(
     request: Request,
     page: int = Query(1, ge=1),
     page_size: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Курсор из next_cursor"),
     use_case: ModelObjectListUseCase = Depends(Provide[Container.object_list_use_case]),
 ) -> PaginatedResponse[PostRead]:
     """Получить список постов"""
@@ -28,11 +36,36 @@ async def list_posts(
         model_type=ModelType.POSTS,
         page=page,
         page_size=page_size,
+        cursor=cursor,
+    )
+
+
+@router.get(
+    "/search",
+    response_model=PaginatedResponse[PostSearchHit],
+    status_code=status.HTTP_200_OK,
+)
+@inject
+@cache_response(ModelType.POSTS, ModelType.CATEGORIES, ModelType.USERS)
+async def search_posts(
+    request: Request,
+    q: str = Query(
+        ..., min_length=1, max_length=200, description='"фраза", or, -исключить'
+    ),
+    page_size: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Курсор из next_cursor"),
+    use_case: PostSearchUseCase = Depends(Provide[Container.post_search_use_case]),
+) -> PaginatedResponse[PostSearchHit]:
+    """Полнотекстовый поиск по заголовку и тексту, лучшие совпадения первыми"""
+    return await use_case.execute(
+        request=request, query=q, page_size=page_size, cursor=cursor
     )
 
 
 @router.get("/{title_slug}", response_model=PostRead, status_code=status.HTTP_200_OK)
 @inject
+@cache_response(ModelType.POSTS, ModelType.CATEGORIES, ModelType.USERS, ttl=60)
+@conditional_get(lambda kwargs: kwargs["use_case"].get_version(kwargs["title_slug"]))
 async def retrieve_post(
     title_slug: str,
     request: Request,
@@ -20,4 +20,4 @@ async def me(
 ) -> UserDTO:
     user = request.state.user
 
-    return await use_case.execute(user.id)
+    return await use_case.execute(user.id, principal=user)
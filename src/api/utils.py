@@ -0,0 +1,34 @@
+from typing import AsyncIterator, Literal, Type
+from urllib.parse import urlencode
+
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+from infrastructure.managers.stream_writer import MEDIA_TYPES, write_csv, write_ndjson
+
+StreamFormat = Literal["ndjson", "csv"]
+
+
+def canonical_url(request: Request) -> str:
+    """URL с отсортированными query-параметрами: ?b=1&a=2 и ?a=2&b=1 совпадают"""
+    query = urlencode(sorted(request.query_params.multi_items()))
+    return str(request.url.replace(query=query))
+
+
+def stream_format(request: Request, format: StreamFormat | None) -> StreamFormat | None:
+    """Потоковый формат из ?format= или заголовка Accept; None - обычный JSON"""
+    if format is not None:
+        return format
+    accept = request.headers.get("accept", "")
+    for name, media_type in MEDIA_TYPES.items():
+        if media_type in accept:
+            return name  # type: ignore[return-value]
+    return None
+
+
+def streaming_response(
+    items: AsyncIterator[BaseModel], schema: Type[BaseModel], format: StreamFormat
+) -> StreamingResponse:
+    body = write_csv(items, schema) if format == "csv" else write_ndjson(items)
+    return StreamingResponse(body, media_type=MEDIA_TYPES[format])
@@ -41,6 +41,11 @@ class PostTitleAlreadyExists(DomainException):
     message = "Post with that title already exists."
 
 
+class TokenRevokedError(DomainException):
+    code = 10413
+    message = "Token has been revoked."
+
+
 class InvalidEmailError(DomainException):
     code = 10412
     message = "Enter valid email."
@@ -1,4 +1,4 @@
-from passlib.hash import argon2
+from common.exceptions import APIException
 
 from application.exceptions import UserDoesNotExistError, WrongPasswordError
 from application.use_cases.auth.dto import TokenDTO
@@ -7,14 +7,21 @@ from domain.entities.user import User
 from domain.validators.base import UserLoginDTO
 from infrastructure.managers.dto import UserCreateDTO
 from infrastructure.managers.jwt_manager import JWTManager
+from infrastructure.managers.password_hasher import PasswordHasher
 from infrastructure.uow.base import UnitOfWork
 
 
 class LoginUseCase(UseCase):
 
-    def __init__(self, uow: UnitOfWork, jwt_manager: JWTManager) -> None:
+    def __init__(
+        self,
+        uow: UnitOfWork,
+        jwt_manager: JWTManager,
+        password_hasher: PasswordHasher,
+    ) -> None:
         self._uow = uow
         self._jwt_manager = jwt_manager
+        self._password_hasher = password_hasher
 
     async def execute(self, data: UserLoginDTO) -> TokenDTO:
         async with self._uow(autocommit=True):
@@ -22,13 +29,21 @@ class LoginUseCase(UseCase):
             if not user:
                 raise UserDoesNotExistError("Неверный email или пароль")
 
-            if not argon2.verify(data.password, user.password):
-                raise WrongPasswordError("Неверный email или пароль")
+        # Проверяем пароль уже после возврата соединения в пул
+        if not await self._password_hasher.verify(data.password, user.password):
+            raise WrongPasswordError("Неверный email или пароль")
+
+        if self._password_hasher.needs_update(user.password):
+            await self._rehash_password(user, data.password)
 
         user_data = UserCreateDTO(
             user_id=user.id,
             email=user.email,
             role=user.role,
+            first_name=user.first_name,
+            last_name=user.last_name,
+            registration_date=user.registration_date,
+            token_version=user.token_version,
         )
 
         access_token = self._jwt_manager.create_access_token(user_data)
@@ -39,3 +54,14 @@ class LoginUseCase(UseCase):
             refresh_token=refresh_token,
             user_id=user.id,
         )
+
+    async def _rehash_password(self, user: User, password: str) -> None:
+        """Перехеширует пароль с текущими параметрами argon2, пока он известен"""
+        try:
+            password_hash = await self._password_hasher.hash(password)
+        except APIException:
+            # Пул перегружен: логин важнее, перехешируем при следующем входе
+            return
+
+        async with self._uow(autocommit=True):
+            await self._uow.users.update_password(user.id, password_hash)
@@ -0,0 +1,46 @@
+from common.exceptions import APIException
+
+from application.use_cases.base import UseCase
+from domain.validators.base import LogoutDTO
+from infrastructure.managers.jwt_manager import JWTManager
+from infrastructure.managers.revocation import TokenRevocationList
+from infrastructure.uow.base import UnitOfWork
+
+
+class LogoutUseCase(UseCase):
+    """Отзывает access-токен запроса и, если передан, refresh-токен той же сессии"""
+
+    def __init__(
+        self,
+        uow: UnitOfWork,
+        jwt_manager: JWTManager,
+        revocations: TokenRevocationList,
+    ) -> None:
+        self._uow = uow
+        self._jwt_manager = jwt_manager
+        self._revocations = revocations
+
+    async def execute(self, user_id: int, access_token: str, data: LogoutDTO) -> None:
+        tokens = [(access_token, self._jwt_manager.verify_token(access_token))]
+        if data.refresh_token:
+            try:
+                payload = self._jwt_manager.decode_refresh_token(data.refresh_token)
+            except ValueError as e:
+                raise APIException(code=400, message=str(e))
+            if payload.get("user_id") != user_id:
+                raise APIException(
+                    code=400, message="Refresh-токен выдан другому пользователю"
+                )
+            tokens.append((data.refresh_token, payload))
+
+        jtis = []
+        async with self._uow(autocommit=True):
+            for token, payload in tokens:
+                jti = self._jwt_manager.get_token_id(token, payload)
+                await self._uow.revoked_tokens.add(
+                    jti, user_id, self._jwt_manager.get_expiration(payload)
+                )
+                jtis.append(jti)
+
+        for jti in jtis:
+            self._revocations.add(jti)
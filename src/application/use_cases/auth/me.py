@@ -1,17 +1,25 @@
 from application.exceptions import UserDoesNotExistError
 from application.use_cases.base import UseCase
 from application.use_cases.users.dto import UserDTO
+from domain.entities.user import User
 from infrastructure.managers.jwt_manager import JWTManager
 from infrastructure.uow.base import UnitOfWork
 
 
 class GetCurrentUserUseCase(UseCase):
-    def __init__(self, uow: UnitOfWork, jwt_manager: JWTManager) -> None:
+    def __init__(
+        self, uow: UnitOfWork, jwt_manager: JWTManager, trust_claims: bool = False
+    ) -> None:
         self._uow = uow
         self._jwt_manager = jwt_manager
+        self._trust_claims = trust_claims
 
-    async def execute(self, user_id: int) -> UserDTO:
-        async with self._uow(autocommit=False):
+    async def execute(self, user_id: int, principal: User | None = None) -> UserDTO:
+        # В режиме trust_claims профиль уже есть в проверенном токене
+        if self._trust_claims and principal and principal.first_name:
+            return UserDTO.model_validate(principal)
+
+        async with self._uow(readonly=True):
             if not await self._uow.users.exists(id=user_id):
                 raise UserDoesNotExistError()
 
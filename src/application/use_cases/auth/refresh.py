@@ -1,28 +1,65 @@
-from application.exceptions import UserDoesNotExistError
+from application.exceptions import TokenRevokedError, UserDoesNotExistError
 from application.use_cases.auth.dto import TokenDTO
 from application.use_cases.base import UseCase
 from domain.validators.base import RefreshTokenDTO
 from infrastructure.managers.dto import UserCreateDTO
 from infrastructure.managers.jwt_manager import JWTManager
+from infrastructure.managers.revocation import TokenRevocationList
+from infrastructure.managers.token_versions import TokenVersionRegistry
 from infrastructure.uow.base import UnitOfWork
 
 
 class RefreshTokenUseCase(UseCase):
-    def __init__(self, uow: UnitOfWork, jwt_manager: JWTManager) -> None:
+    """
+    Ротация: refresh-токен обменивается один раз и сразу отзывается.
+    Повторное предъявление означает утечку - отзываются все сессии пользователя
+    """
+
+    def __init__(
+        self,
+        uow: UnitOfWork,
+        jwt_manager: JWTManager,
+        revocations: TokenRevocationList,
+        token_versions: TokenVersionRegistry,
+    ) -> None:
         self._jwt_manager = jwt_manager
         self._uow = uow
+        self._revocations = revocations
+        self._token_versions = token_versions
 
     async def execute(self, data: RefreshTokenDTO) -> TokenDTO:
         payload = self._jwt_manager.decode_refresh_token(data.refresh_token)
+        jti = self._jwt_manager.get_token_id(data.refresh_token, payload)
 
         async with self._uow(autocommit=True):
-            if not await self._uow.users.exists(email=payload["email"]):
+            user = await self._uow.users.get_identity(payload["user_id"])
+            if not user:
                 raise UserDoesNotExistError()
 
+            if payload.get("ver", 0) < user.token_version:
+                raise TokenRevokedError()
+
+            rotated = await self._uow.revoked_tokens.add(
+                jti, user.id, self._jwt_manager.get_expiration(payload)
+            )
+            if not rotated:
+                user.revoke_tokens()
+                await self._uow.users.update(user)
+
+        self._revocations.add(jti)
+        if not rotated:
+            self._token_versions.bump(user.id, user.token_version)
+            raise TokenRevokedError()
+
+        # Новые токены несут актуальные роль и профиль, а не копию старых claims
         user_data = UserCreateDTO(
-            user_id=payload["user_id"],
-            email=payload["email"],
-            role=payload["role"],
+            user_id=user.id,
+            email=user.email,
+            role=user.role,
+            first_name=user.first_name,
+            last_name=user.last_name,
+            registration_date=user.registration_date,
+            token_version=user.token_version,
         )
 
         new_access_token = self._jwt_manager.create_access_token(user_data)
@@ -31,5 +68,5 @@ class RefreshTokenUseCase(UseCase):
         return TokenDTO(
             access_token=new_access_token,
             refresh_token=new_refresh_token,
-            user_id=payload["user_id"],
+            user_id=user.id,
         )
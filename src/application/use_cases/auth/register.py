@@ -1,22 +1,30 @@
-from passlib.hash import argon2
-
 from application.exceptions import UserWithEmailAlreadyExistsError
 from application.use_cases.auth.dto import TokenDTO
 from application.use_cases.base import UseCase
-from application.use_cases.users.dto import UserCreateDTO
 from domain.entities.user import User
 from domain.validators.base import UserRegisterDTO
+from infrastructure.managers.dto import UserCreateDTO
 from infrastructure.managers.jwt_manager import JWTManager
+from infrastructure.managers.password_hasher import PasswordHasher
 from infrastructure.uow.base import UnitOfWork
 
 
 class RegisterUserUseCase(UseCase):
 
-    def __init__(self, uow: UnitOfWork, jwt_manager: JWTManager) -> None:
+    def __init__(
+        self,
+        uow: UnitOfWork,
+        jwt_manager: JWTManager,
+        password_hasher: PasswordHasher,
+    ) -> None:
         self._uow = uow
         self._jwt_manager = jwt_manager
+        self._password_hasher = password_hasher
 
     async def execute(self, data: UserRegisterDTO) -> TokenDTO:
+        # Хешируем до открытия транзакции, чтобы не держать соединение
+        password_hash = await self._password_hasher.hash(data.password)
+
         async with self._uow(autocommit=True):
             if await self._uow.users.exists(email=data.email):
                 raise UserWithEmailAlreadyExistsError()
@@ -26,11 +34,19 @@ class RegisterUserUseCase(UseCase):
                     email=data.email,
                     first_name=data.first_name,
                     last_name=data.last_name,
-                    password=self._hash_password(data.password),
+                    password=password_hash,
                 )
             )
 
-        dto = UserCreateDTO(user_id=user.id, email=user.email, role=user.role)
+        dto = UserCreateDTO(
+            user_id=user.id,
+            email=user.email,
+            role=user.role,
+            first_name=user.first_name,
+            last_name=user.last_name,
+            registration_date=user.registration_date,
+            token_version=user.token_version,
+        )
         access_token = self._jwt_manager.create_access_token(dto)
         refresh_token = self._jwt_manager.create_refresh_token(dto)
 
@@ -39,6 +55,3 @@ class RegisterUserUseCase(UseCase):
             refresh_token=refresh_token,
             user_id=user.id,
         )
-
-    def _hash_password(self, password: str) -> str:
-        return argon2.hash(password)
@@ -8,17 +8,29 @@ from application.exceptions import (
 from application.use_cases.base import UseCase
 from application.use_cases.dto import CreateCategoryDTO, CreatePostDTO
 from domain.entities.category import Category
+from domain.entities.enums import ModelType
+from infrastructure.managers.autocomplete import AutocompleteIndex
+from infrastructure.managers.response_cache import ResponseCache
 from infrastructure.uow.base import UnitOfWork
 
 
 class CategoryCreateUseCase(UseCase):
 
-    def __init__(self, uow: UnitOfWork) -> None:
+    def __init__(
+        self,
+        uow: UnitOfWork,
+        response_cache: ResponseCache,
+        autocomplete: AutocompleteIndex,
+    ) -> None:
         self._uow = uow
+        self._response_cache = response_cache
+        self._autocomplete = autocomplete
 
     async def execute(self, data: CreateCategoryDTO) -> CategoryRead:
         async with self._uow(autocommit=True):
             category = await self._create_category(data)
+        self._response_cache.invalidate_tags(ModelType.CATEGORIES.value)
+        self._autocomplete.add(ModelType.CATEGORIES, category.name)
         return CategoryRead.model_validate(category)
 
     async def _create_category(self, data: CreateCategoryDTO) -> Category:
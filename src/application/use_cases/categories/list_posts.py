@@ -2,7 +2,7 @@ from common.dto import PostRead
 from fastapi import Request
 
 from application.use_cases.base import UseCase
-from domain.validators.dto import PaginatedResponse
+from domain.validators.dto import PaginatedResponse, ResourceVersion
 from infrastructure.managers.paginator import Paginator
 from infrastructure.uow.base import UnitOfWork
 
@@ -15,10 +15,27 @@ class PostByCategoryUseCase(UseCase):
         self._uow = uow
 
     async def execute(
-        self, request: Request, category_name: str, page: int = 1, page_size: int = 10
+        self,
+        request: Request,
+        category_name: str,
+        page: int = 1,
+        page_size: int = 10,
+        cursor: str | None = None,
     ) -> PaginatedResponse[PostRead]:
-        async with self._uow(autocommit=True):
+        async with self._uow(readonly=True, replica=True):
             category = await self._uow.categories.get_by_name(category_name)
-            result = await self._uow.posts.get_list_models(category_id=category.id)
+            stmt = self._uow.posts.get_list_models(category_id=category.id)
+
+            if cursor:
+                return await Paginator(PostRead).paginate_by_cursor(
+                    self._uow.posts, stmt, request, cursor, page_size
+                )
+            return await Paginator(PostRead).paginate(
+                self._uow.posts, stmt, request, page, page_size
+            )
 
-        return await Paginator(PostRead).paginate(result, request, page, page_size)
+    async def get_version(self, category_name: str) -> ResourceVersion:
+        async with self._uow(readonly=True, replica=True):
+            category = await self._uow.categories.get_by_name(category_name)
+            stmt = self._uow.posts.get_list_models(category_id=category.id)
+            return await self._uow.posts.get_version(stmt)
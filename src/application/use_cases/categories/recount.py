@@ -0,0 +1,21 @@
+from application.use_cases.base import UseCase
+from application.use_cases.dto import CategoryRecountResultDTO
+from domain.entities.enums import ModelType
+from infrastructure.managers.response_cache import ResponseCache
+from infrastructure.uow.base import UnitOfWork
+
+
+class CategoryRecountUseCase(UseCase):
+    """Сверка денормализованных счётчиков категорий с таблицей posts"""
+
+    def __init__(self, uow: UnitOfWork, response_cache: ResponseCache) -> None:
+        self._uow = uow
+        self._response_cache = response_cache
+
+    async def execute(self) -> CategoryRecountResultDTO:
+        async with self._uow(autocommit=True):
+            fixed = await self._uow.categories.recount()
+
+        if fixed:
+            self._response_cache.invalidate_tags(ModelType.CATEGORIES.value)
+        return CategoryRecountResultDTO(fixed=fixed)
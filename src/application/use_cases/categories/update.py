@@ -3,12 +3,22 @@ from common.dto import CategoryRead
 from application.exceptions import CategoryAlreadyExists, CategoryDoesNotExist
 from application.use_cases.base import UseCase
 from application.use_cases.dto import CategoryPut
+from domain.entities.enums import ModelType
+from infrastructure.managers.autocomplete import AutocompleteIndex
+from infrastructure.managers.response_cache import ResponseCache
 from infrastructure.uow.base import UnitOfWork
 
 
 class CategoryUpdateUseCase(UseCase):
-    def __init__(self, uow: UnitOfWork) -> None:
+    def __init__(
+        self,
+        uow: UnitOfWork,
+        response_cache: ResponseCache,
+        autocomplete: AutocompleteIndex,
+    ) -> None:
         self._uow = uow
+        self._response_cache = response_cache
+        self._autocomplete = autocomplete
 
     async def execute(self, category_id: int, data: CategoryPut) -> CategoryRead:
         async with self._uow(autocommit=True):
@@ -19,6 +29,7 @@ class CategoryUpdateUseCase(UseCase):
                 raise CategoryAlreadyExists()
 
             category = await self._uow.categories.get_by_id(category_id)
+            old_name = category.name
 
             update_data = data.model_dump()
 
@@ -28,4 +39,6 @@ class CategoryUpdateUseCase(UseCase):
             await self._uow.categories.update(category)
             category = await self._uow.categories.get_by_id(category.id)
 
+        self._response_cache.invalidate_tags(ModelType.CATEGORIES.value)
+        self._autocomplete.replace(ModelType.CATEGORIES, old_name, category.name)
         return CategoryRead.model_validate(category)
@@ -3,6 +3,8 @@ from pydantic import BaseModel
 from application.use_cases.base import UseCase
 from domain.entities.entity import Entity
 from domain.entities.enums import ModelType
+from infrastructure.managers.autocomplete import AutocompleteIndex
+from infrastructure.managers.response_cache import ResponseCache
 from infrastructure.uow import UnitOfWork
 
 
@@ -11,8 +13,15 @@ class ModelObjectCreateUseCase(UseCase):
     Create a new object of the given model type.
     """
 
-    def __init__(self, uow: UnitOfWork) -> None:
+    def __init__(
+        self,
+        uow: UnitOfWork,
+        response_cache: ResponseCache,
+        autocomplete: AutocompleteIndex,
+    ) -> None:
         self._uow = uow
+        self._response_cache = response_cache
+        self._autocomplete = autocomplete
 
     async def execute(
         self,
@@ -25,4 +34,8 @@ class ModelObjectCreateUseCase(UseCase):
             repository = self._uow.get_model_repository(model_type)
             instance = await repository.create(EntityCls(**data.model_dump()))
 
+        self._response_cache.invalidate_tags(model_type.value)
+        self._autocomplete.add(
+            model_type, self._autocomplete.label(model_type, instance)
+        )
         return ObjectDTO.model_validate(instance)
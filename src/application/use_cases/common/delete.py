@@ -2,6 +2,11 @@ from common.exceptions import APIException
 
 from application.use_cases.base import UseCase
 from domain.entities.enums import ModelType
+from domain.entities.user import User
+from infrastructure.managers.autocomplete import AutocompleteIndex
+from infrastructure.managers.cache import TTLCache
+from infrastructure.managers.response_cache import ResponseCache
+from infrastructure.managers.token_versions import TokenVersionRegistry
 from infrastructure.uow import UnitOfWork
 
 
@@ -10,8 +15,19 @@ class ModelObjectDeleteUseCase(UseCase):
     Use case for deleting an object by its ID and model type.
     """
 
-    def __init__(self, uow: UnitOfWork) -> None:
+    def __init__(
+        self,
+        uow: UnitOfWork,
+        principal_cache: TTLCache[int, User],
+        token_versions: TokenVersionRegistry,
+        response_cache: ResponseCache,
+        autocomplete: AutocompleteIndex,
+    ) -> None:
         self._uow = uow
+        self._response_cache = response_cache
+        self._autocomplete = autocomplete
+        self._principal_cache = principal_cache
+        self._token_versions = token_versions
 
     async def execute(
         self,
@@ -28,6 +44,21 @@ class ModelObjectDeleteUseCase(UseCase):
                     message=f"Объект {model_type.value} с id '{obj_id}' не существует",
                 )
 
+            label = None
+            if model_type == ModelType.POSTS:
+                post = await repository.get_by_id(obj_id)
+                label = self._autocomplete.label(model_type, post)
             await repository.delete_by_id(obj_id)
 
+        # Удаление категории или автора каскадно удаляет посты: индекс
+        # подсказок перестраивается целиком
+        self._response_cache.invalidate_tags(model_type.value, ModelType.POSTS.value)
+        if label is not None:
+            self._autocomplete.remove(model_type, label)
+        else:
+            self._autocomplete.invalidate()
+        if model_type == ModelType.USERS:
+            self._principal_cache.invalidate(obj_id)
+            self._token_versions.revoke(obj_id)
+
         return True
@@ -0,0 +1,84 @@
+import asyncio
+from contextlib import suppress
+from datetime import datetime
+from typing import AsyncIterator
+
+from application.use_cases.base import UseCase
+from domain.entities.enums import ModelType
+from infrastructure.repositories.enum import CopyFormat
+from infrastructure.repositories.interfaces.base import ModelRepository
+from infrastructure.uow import UnitOfWork
+
+
+class ModelObjectExportUseCase(UseCase):
+    """
+    Выгрузка таблицы целиком через COPY в поток байт.
+    COPY пишет в очередь из отдельной задачи: пока получатель не забрал
+    queue_size кусков, чтение из соединения стоит, память не растёт
+    """
+
+    def __init__(self, uow: UnitOfWork, queue_size: int = 16) -> None:
+        self._uow = uow
+        self._queue_size = queue_size
+
+    async def execute(
+        self,
+        model_type: ModelType,
+        columns: list[str] | None = None,
+        updated_from: datetime | None = None,
+        updated_to: datetime | None = None,
+        format: CopyFormat = CopyFormat.CSV,
+    ) -> AsyncIterator[bytes]:
+        """Ошибки запроса (колонки, фильтр) поднимаются до первого байта ответа"""
+        chunks = self._copy(
+            model_type,
+            columns=columns,
+            updated_from=updated_from,
+            updated_to=updated_to,
+            format=format,
+        )
+        first = await anext(chunks, b"")
+        return self._prepend(first, chunks)
+
+    @staticmethod
+    async def _prepend(
+        first: bytes, chunks: AsyncIterator[bytes]
+    ) -> AsyncIterator[bytes]:
+        yield first
+        async for chunk in chunks:
+            yield chunk
+
+    async def _copy(
+        self, model_type: ModelType, **options: object
+    ) -> AsyncIterator[bytes]:
+        # Одна команда COPY видит согласованный снимок, транзакция не нужна
+        async with self._uow(readonly=True, replica=True):
+            repository = self._uow.get_model_repository(model_type)
+            queue: asyncio.Queue[bytes | None] = asyncio.Queue(self._queue_size)
+            task = asyncio.create_task(self._produce(repository, queue, options))
+            try:
+                while (chunk := await queue.get()) is not None:
+                    yield chunk
+                await task
+            finally:
+                # Получатель ушёл раньше конца: COPY прерывается до закрытия сессии
+                task.cancel()
+                with suppress(asyncio.CancelledError):
+                    await task
+
+    @staticmethod
+    async def _produce(
+        repository: ModelRepository,
+        queue: asyncio.Queue[bytes | None],
+        options: dict,
+    ) -> None:
+        async def put(data: bytes) -> None:
+            await queue.put(bytes(data))
+
+        try:
+            await repository.copy_to(put, **options)
+        except Exception:
+            # Конец потока, ошибку получатель заберёт из задачи
+            await queue.put(None)
+            raise
+        await queue.put(None)
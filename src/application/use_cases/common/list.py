@@ -1,11 +1,11 @@
-from typing import Type
+from typing import AsyncIterator, Type
 
 from fastapi import Request
 from pydantic import BaseModel
 
 from application.use_cases.base import UseCase
 from domain.entities.enums import ModelType
-from domain.validators.dto import PaginatedResponse
+from domain.validators.dto import PaginatedResponse, ResourceVersion
 from infrastructure.managers.paginator import Paginator
 from infrastructure.uow import UnitOfWork
 
@@ -26,9 +26,38 @@ class ModelObjectListUseCase(UseCase):
         page: int = 1,
         page_size: int = 100,
         filters: dict = {},
+        cursor: str | None = None,
     ) -> PaginatedResponse:
-        async with self._uow(autocommit=True):
+        async with self._uow(readonly=True, replica=True):
             repository = self._uow.get_model_repository(model_type)
-            result = await repository.get_list_models(**filters)
+            stmt = repository.get_list_models(**filters)
 
-        return await Paginator(ObjectDTO).paginate(result, request, page, page_size)
+            if cursor:
+                return await Paginator(ObjectDTO).paginate_by_cursor(
+                    repository, stmt, request, cursor, page_size
+                )
+            return await Paginator(ObjectDTO).paginate(
+                repository, stmt, request, page, page_size
+            )
+
+    async def stream(
+        self, model_type: ModelType, ObjectDTO: Type[BaseModel], filters: dict = {}
+    ) -> AsyncIterator[BaseModel]:
+        """
+        Все объекты выборки по мере чтения из курсора, для потоковой выгрузки.
+        Серверному курсору нужна транзакция - один read-only снимок на выгрузку
+        """
+        async with self._uow(readonly=True, deferrable=True, replica=True):
+            repository = self._uow.get_model_repository(model_type)
+            stmt = repository.get_list_models(**filters)
+            async for obj in repository.stream(stmt):
+                yield ObjectDTO.model_validate(obj)
+
+    async def get_version(
+        self, model_type: ModelType, filters: dict = {}
+    ) -> ResourceVersion:
+        """Версия всей выборки: страница учитывается в ETag через URL запроса"""
+        async with self._uow(readonly=True, replica=True):
+            repository = self._uow.get_model_repository(model_type)
+            stmt = repository.get_list_models(**filters)
+            return await repository.get_version(stmt)
@@ -17,7 +17,7 @@ class ModelObjectRetrieveUseCase(UseCase):
     async def execute(
         self, obj_id: int, model_type: ModelType, ObjectDTO: type[BaseModel]
     ) -> BaseModel:
-        async with self._uow(autocommit=True):
+        async with self._uow(readonly=True, replica=True):
             repository = self._uow.get_model_repository(model_type)
             instance = await repository.get_by_id(obj_id)
             if instance is None:
@@ -3,6 +3,8 @@ from pydantic import BaseModel
 
 from application.use_cases.base import UseCase
 from domain.entities.enums import ModelType
+from infrastructure.managers.autocomplete import AutocompleteIndex
+from infrastructure.managers.response_cache import ResponseCache
 from infrastructure.uow.base import UnitOfWork
 
 
@@ -11,8 +13,15 @@ class ModelObjectUpdateUseCase(UseCase):
     Full update object (PUT).
     """
 
-    def __init__(self, uow: UnitOfWork) -> None:
+    def __init__(
+        self,
+        uow: UnitOfWork,
+        response_cache: ResponseCache,
+        autocomplete: AutocompleteIndex,
+    ) -> None:
         self._uow = uow
+        self._response_cache = response_cache
+        self._autocomplete = autocomplete
 
     async def execute(
         self,
@@ -28,6 +37,7 @@ class ModelObjectUpdateUseCase(UseCase):
                 raise APIException(
                     code=404, message=f"Объект с id '{obj_id}' не существует"
                 )
+            old_label = self._autocomplete.label(model_type, entity)
 
             update_data = data.model_dump()
             for key, value in update_data.items():
@@ -36,4 +46,8 @@ class ModelObjectUpdateUseCase(UseCase):
             await repository.update(entity)
             entity = await repository.get_by_id(entity.id)
 
+        self._response_cache.invalidate_tags(model_type.value)
+        self._autocomplete.replace(
+            model_type, old_label, self._autocomplete.label(model_type, entity)
+        )
         return ObjectDTO.model_validate(entity)
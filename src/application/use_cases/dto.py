@@ -1,4 +1,4 @@
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class CreatePostDTO(BaseModel):
@@ -35,3 +35,28 @@ class PostPut(BaseModel):
 
 class CategoryPut(BaseModel):
     name: str
+
+
+class PostImportRow(BaseModel):
+    """Строка импорта: категория и автор - по имени и email"""
+
+    title: str = Field(min_length=1, max_length=255)
+    body: str
+    category: str
+    author_email: str
+
+
+class PostImportErrorDTO(BaseModel):
+    line: int
+    message: str
+
+
+class PostImportResultDTO(BaseModel):
+    imported: int = 0
+    failed: int = 0
+    errors: list[PostImportErrorDTO] = []
+
+
+class CategoryRecountResultDTO(BaseModel):
+    # Категорий, у которых счётчики разошлись с posts
+    fixed: int
@@ -3,18 +3,30 @@ from common.dto import PostRead
 from application.exceptions import CategoryDoesNotExist, PostTitleAlreadyExists
 from application.use_cases.base import UseCase
 from application.use_cases.dto import CreatePostDTO
+from domain.entities.enums import ModelType
 from domain.entities.post import Post
+from infrastructure.managers.autocomplete import AutocompleteIndex
+from infrastructure.managers.response_cache import ResponseCache
 from infrastructure.uow.base import UnitOfWork
 
 
 class PostCreateUseCase(UseCase):
 
-    def __init__(self, uow: UnitOfWork) -> None:
+    def __init__(
+        self,
+        uow: UnitOfWork,
+        response_cache: ResponseCache,
+        autocomplete: AutocompleteIndex,
+    ) -> None:
         self._uow = uow
+        self._response_cache = response_cache
+        self._autocomplete = autocomplete
 
     async def execute(self, data: CreatePostDTO) -> PostRead:
         async with self._uow(autocommit=True):
             post = await self._create_post(data)
+        self._response_cache.invalidate_tags(ModelType.POSTS.value)
+        self._autocomplete.add(ModelType.POSTS, post.title)
         return PostRead.model_validate(post)
 
     async def _create_post(self, data: CreatePostDTO) -> Post:
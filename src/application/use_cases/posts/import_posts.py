@@ -0,0 +1,114 @@
+from typing import AsyncIterator
+
+from pydantic import ValidationError
+
+from application.use_cases.base import UseCase
+from application.use_cases.dto import (
+    PostImportErrorDTO,
+    PostImportResultDTO,
+    PostImportRow,
+)
+from domain.entities.enums import ModelType
+from infrastructure.managers.autocomplete import AutocompleteIndex
+from infrastructure.managers.response_cache import ResponseCache
+from infrastructure.managers.stream_reader import Record
+from infrastructure.uow.base import UnitOfWork
+
+
+class PostImportUseCase(UseCase):
+    """
+    Массовый импорт постов из потока записей.
+    Строки проверяются по одной и копятся пачками по batch_size: авторы
+    и категории пачки находятся двумя запросами, пачка грузится через COPY
+    в своей транзакции. Ошибочные строки не прерывают импорт, в отчёт
+    попадают первые max_errors из них
+    """
+
+    def __init__(
+        self,
+        uow: UnitOfWork,
+        response_cache: ResponseCache,
+        autocomplete: AutocompleteIndex,
+        batch_size: int = 5000,
+        max_errors: int = 1000,
+    ) -> None:
+        self._uow = uow
+        self._response_cache = response_cache
+        self._autocomplete = autocomplete
+        self._batch_size = batch_size
+        self._max_errors = max_errors
+
+    async def execute(self, records: AsyncIterator[Record]) -> PostImportResultDTO:
+        result = PostImportResultDTO()
+        batch: list[tuple[int, PostImportRow]] = []
+        try:
+            async for line, data, error in records:
+                if error is None:
+                    try:
+                        batch.append((line, PostImportRow.model_validate(data)))
+                    except ValidationError as exc:
+                        error = "; ".join(
+                            f"{'.'.join(map(str, item['loc']))}: {item['msg']}"
+                            for item in exc.errors()
+                        )
+                if error is not None:
+                    self._fail(result, line, error)
+
+                if len(batch) >= self._batch_size:
+                    await self._load(batch, result)
+                    batch = []
+
+            if batch:
+                await self._load(batch, result)
+        finally:
+            if result.imported:
+                self._response_cache.invalidate_tags(ModelType.POSTS.value)
+
+        return result
+
+    async def _load(
+        self, batch: list[tuple[int, PostImportRow]], result: PostImportResultDTO
+    ) -> None:
+        records: list[tuple[str, str, int, int]] = []
+        lines_by_title: dict[str, int] = {}
+        async with self._uow(autocommit=True):
+            categories = await self._uow.categories.get_ids_by_names(
+                {row.category for _, row in batch}
+            )
+            authors = await self._uow.users.get_ids_by_emails(
+                {row.author_email for _, row in batch}
+            )
+
+            for line, row in batch:
+                if row.category not in categories:
+                    self._fail(result, line, f"Категория '{row.category}' не найдена")
+                elif row.author_email not in authors:
+                    self._fail(result, line, f"Автор '{row.author_email}' не найден")
+                elif row.title in lines_by_title:
+                    self._fail(result, line, "Заголовок повторяется в пачке импорта")
+                else:
+                    lines_by_title[row.title] = line
+                    records.append(
+                        (
+                            row.title,
+                            row.body,
+                            authors[row.author_email],
+                            categories[row.category],
+                        )
+                    )
+
+            inserted = (
+                await self._uow.posts.copy_from_records(records) if records else set()
+            )
+
+        result.imported += len(inserted)
+        for title in inserted:
+            self._autocomplete.add(ModelType.POSTS, title)
+        for title, line in lines_by_title.items():
+            if title not in inserted:
+                self._fail(result, line, "Пост с таким заголовком уже существует")
+
+    def _fail(self, result: PostImportResultDTO, line: int, message: str) -> None:
+        result.failed += 1
+        if len(result.errors) < self._max_errors:
+            result.errors.append(PostImportErrorDTO(line=line, message=message))
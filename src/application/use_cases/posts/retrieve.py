@@ -1,6 +1,7 @@
 from common.dto import PostRead
 
 from application.use_cases.base import UseCase
+from domain.validators.dto import ResourceVersion
 from infrastructure.uow.base import UnitOfWork
 
 
@@ -12,7 +13,11 @@ class PostRetriveUseCase(UseCase):
         self._uow = uow
 
     async def execute(self, title: str) -> PostRead:
-        async with self._uow(autocommit=True):
+        async with self._uow(readonly=True, replica=True):
             post = await self._uow.posts.get_by_title(title)
 
         return PostRead.model_validate(post)
+
+    async def get_version(self, title: str) -> ResourceVersion | None:
+        async with self._uow(readonly=True, replica=True):
+            return await self._uow.posts.get_version_by_title(title)
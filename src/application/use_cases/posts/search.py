@@ -0,0 +1,45 @@
+from common.dto import PostRead, PostSearchHit
+from fastapi import Request
+
+from application.use_cases.base import UseCase
+from domain.validators.dto import PaginatedResponse
+from infrastructure.managers.paginator import cursor_url, decode_cursor, encode_cursor
+from infrastructure.uow.base import UnitOfWork
+
+
+class PostSearchUseCase(UseCase):
+    """Полнотекстовый поиск постов с keyset-пагинацией по (rank, id)"""
+
+    def __init__(self, uow: UnitOfWork) -> None:
+        self._uow = uow
+
+    async def execute(
+        self,
+        request: Request,
+        query: str,
+        page_size: int = 10,
+        cursor: str | None = None,
+    ) -> PaginatedResponse[PostSearchHit]:
+        after = decode_cursor(cursor, (float, int)) if cursor else None
+        async with self._uow(readonly=True, replica=True):
+            rows = await self._uow.posts.search(
+                query, limit=page_size + 1, after=after  # type: ignore[arg-type]
+            )
+
+        next_cursor = None
+        if len(rows) > page_size:
+            rows = rows[:page_size]
+            post, rank, _ = rows[-1]
+            next_cursor = encode_cursor((rank, post.id))
+
+        return PaginatedResponse[PostSearchHit](
+            data=[
+                PostSearchHit(
+                    post=PostRead.model_validate(post), rank=rank, snippet=snippet
+                )
+                for post, rank, snippet in rows
+            ],
+            page_size=page_size,
+            next=cursor_url(request, next_cursor, page_size) if next_cursor else None,
+            next_cursor=next_cursor,
+        )
@@ -3,12 +3,22 @@ from common.dto import PostRead
 from application.exceptions import CategoryDoesNotExist
 from application.use_cases.base import UseCase
 from application.use_cases.dto import PostPut
+from domain.entities.enums import ModelType
+from infrastructure.managers.autocomplete import AutocompleteIndex
+from infrastructure.managers.response_cache import ResponseCache
 from infrastructure.uow.base import UnitOfWork
 
 
 class PostUpdateUseCase(UseCase):
-    def __init__(self, uow: UnitOfWork) -> None:
+    def __init__(
+        self,
+        uow: UnitOfWork,
+        response_cache: ResponseCache,
+        autocomplete: AutocompleteIndex,
+    ) -> None:
         self._uow = uow
+        self._response_cache = response_cache
+        self._autocomplete = autocomplete
 
     async def execute(self, post_id: int, data: PostPut) -> PostRead:
         async with self._uow(autocommit=True):
@@ -16,12 +26,16 @@ class PostUpdateUseCase(UseCase):
                 raise CategoryDoesNotExist()
 
             post = await self._uow.posts.get_by_id(post_id)
+            old_title = post.title
 
             update_data = data.model_dump()
 
             for key, value in update_data.items():
                 setattr(post, key, value)
 
+            await self._uow.posts.update(post)
             post = await self._uow.posts.get_by_id(post_id)
 
+        self._response_cache.invalidate_tags(ModelType.POSTS.value)
+        self._autocomplete.replace(ModelType.POSTS, old_title, post.title)
         return PostRead.model_validate(post)
@@ -1,3 +1,5 @@
+from typing import AsyncIterator
+
 from fastapi import Request
 
 from application.use_cases.base import UseCase
@@ -19,7 +21,15 @@ class UsersListUseCase(UseCase):
     async def execute(
         self, request: Request, page: int = 1, page_size: int = 10
     ) -> PaginatedResponse[UserDTO]:
-        async with self._uow(autocommit=True):
-            result = await self._uow.users.get_list_models()
+        async with self._uow(readonly=True, replica=True):
+            stmt = self._uow.users.get_list_models()
+
+            return await self.paginator.paginate(
+                self._uow.users, stmt, request, page, page_size
+            )
 
-        return await self.paginator.paginate(result, request, page, page_size)
+    async def stream(self) -> AsyncIterator[UserDTO]:
+        async with self._uow(readonly=True, deferrable=True, replica=True):
+            stmt = self._uow.users.get_list_models()
+            async for user in self._uow.users.stream(stmt):
+                yield UserDTO.model_validate(user)
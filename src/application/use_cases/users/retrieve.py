@@ -14,7 +14,7 @@ class UserRetrieveUseCase(UseCase):
         self._uow = uow
 
     async def execute(self, user_id: int) -> UserDTO:
-        async with self._uow(autocommit=True):
+        async with self._uow(readonly=True):
             try:
                 user = await self._uow.users.get_by_id(user_id)
             except ValueError:
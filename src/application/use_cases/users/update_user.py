@@ -4,6 +4,8 @@ from application.exceptions import UserNotFound
 from application.use_cases.base import UseCase
 from application.use_cases.users.dto import ChangeUserRoleDTO, UserDTO
 from domain.entities.user import User
+from infrastructure.managers.cache import TTLCache
+from infrastructure.managers.token_versions import TokenVersionRegistry
 from infrastructure.uow.base import UnitOfWork
 
 
@@ -15,8 +17,12 @@ class UserUpdateUseCase(UseCase):
     def __init__(
         self,
         uow: UnitOfWork,
+        principal_cache: TTLCache[int, User],
+        token_versions: TokenVersionRegistry,
     ) -> None:
         self._uow = uow
+        self._principal_cache = principal_cache
+        self._token_versions = token_versions
 
     async def execute(self, data: ChangeUserRoleDTO) -> UserDTO:
         async with self._uow(autocommit=True):
@@ -34,4 +40,6 @@ class UserUpdateUseCase(UseCase):
             user.change_role(data.role)
             await self._uow.users.update(user)
 
+        self._principal_cache.invalidate(user.id)
+        self._token_versions.bump(user.id, user.token_version)
         return UserDTO.model_validate(user)
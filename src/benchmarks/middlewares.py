@@ -0,0 +1,140 @@
+"""
+Накладные расходы middleware на запрос: прежний стек (JWT и санитайзер на
+BaseHTTPMiddleware) против текущего (ленивый principal, pure ASGI санитайзер).
+
+Запуск из каталога src:
+    python -m benchmarks.middlewares --requests 3000
+
+Эндпоинты не ходят в БД, поэтому разница между приложениями -
+это стоимость самих middleware.
+"""
+
+import argparse
+import asyncio
+from datetime import datetime
+from statistics import mean, quantiles
+from time import perf_counter
+from typing import Any
+
+from fastapi import FastAPI, Request
+from httpx import ASGITransport, AsyncClient
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.responses import Response
+
+from api.permissions.exceptions import AuthenticationError, TokenExpiredError
+from api.permissions.principal import JwtTokenUserResolver
+from config.containers import Container
+from config.exceptions import authentication_exception_handler
+from infrastructure.middleware.sanitize_html import SanitizeHTMLMiddleware
+
+POSTS_PAGE = {
+    "data": [
+        {
+            "id": index,
+            "category_id": 1,
+            "title": f"Post {index}",
+            "body": "Lorem ipsum " * 20,
+            "author_id": 1,
+            "created_at": datetime(2025, 1, 1).isoformat(),
+            "updated_at": datetime(2025, 1, 1).isoformat(),
+        }
+        for index in range(10)
+    ],
+    "count": 10,
+    "page": 1,
+    "page_size": 10,
+    "total_pages": 1,
+}
+
+
+class LegacyJwtTokenUserMiddleware(BaseHTTPMiddleware):
+    """
+    Прежний JWT-middleware: через BaseHTTPMiddleware и на каждом запросе сразу
+    определяет пользователя. Логика та же, что теперь лениво выполняет
+    api.permissions.principal, ошибка токена - тот же ответ 401
+    """
+
+    def __init__(self, app: Any, container: Container) -> None:
+        super().__init__(app)
+        self._resolver = JwtTokenUserResolver(
+            jwt_manager=container.jwt_manager(),
+            principal_cache=container.principal_cache(),
+            database=container.db.db(),
+            token_versions=container.token_versions(),
+            revocations=container.token_revocations(),
+            trust_claims=container.settings().jwt.trust_claims,
+        )
+
+    async def dispatch(
+        self, request: Request, call_next: RequestResponseEndpoint
+    ) -> Response:
+        try:
+            request.state.user = await self._resolver.resolve(request)
+        except (AuthenticationError, TokenExpiredError) as error:
+            return await authentication_exception_handler(request, error)
+        return await call_next(request)
+
+
+class LegacySanitizeHTMLMiddleware(BaseHTTPMiddleware):
+    """Прежний санитайзер на GET без JSON-тела только передавал запрос дальше"""
+
+    async def dispatch(
+        self, request: Request, call_next: RequestResponseEndpoint
+    ) -> Response:
+        return await call_next(request)
+
+
+def create_app(mode: str, container: Container) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/health")
+    async def health() -> dict:
+        return {"status": "ok"}
+
+    @app.get("/posts")
+    async def posts() -> dict:
+        return POSTS_PAGE
+
+    if mode == "legacy":
+        app.add_middleware(LegacyJwtTokenUserMiddleware, container=container)
+        app.add_middleware(LegacySanitizeHTMLMiddleware)
+    elif mode == "asgi":
+        # Пользователь определяется лениво и только там, где нужен: JWT-middleware нет
+        app.add_middleware(SanitizeHTMLMiddleware)
+    return app
+
+
+async def measure(app: FastAPI, path: str, requests: int) -> list[float]:
+    timings = []
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://bench"
+    ) as client:
+        for _ in range(requests // 10):
+            await client.get(path)
+
+        for _ in range(requests):
+            started = perf_counter()
+            response = await client.get(path)
+            timings.append((perf_counter() - started) * 1_000_000)
+            assert response.status_code == 200
+    return timings
+
+
+async def main(requests: int) -> None:
+    # Соединения с БД не открываются: запросы идут без Authorization
+    container = Container()
+    print(f"{'endpoint':<10}{'mode':<10}{'mean, us':>12}{'p99, us':>12}{'overhead, us':>16}")
+    for path in ("/health", "/posts"):
+        baseline = None
+        for mode in ("bare", "legacy", "asgi"):
+            timings = await measure(create_app(mode, container), path, requests)
+            avg = mean(timings)
+            p99 = quantiles(timings, n=100)[98]
+            baseline = avg if baseline is None else baseline
+            print(f"{path:<10}{mode:<10}{avg:>12.1f}{p99:>12.1f}{avg - baseline:>16.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=3000)
+    asyncio.run(main(parser.parse_args().requests))
@@ -0,0 +1,91 @@
+"""
+Латентность /posts под параллельной нагрузкой на логин.
+
+Запуск из каталога src:
+    python -m benchmarks.password_hashing --logins 4 --requests 50
+
+"inline" - argon2 прямо в event loop (как было), "pool" - через PasswordHasher.
+Эндпоинты не ходят в БД: измеряется только влияние хеширования на цикл событий.
+"""
+
+import argparse
+import asyncio
+from statistics import quantiles
+from time import perf_counter
+
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from passlib.hash import argon2
+
+from config.settings import PasswordHashingSettings
+from infrastructure.managers.password_hasher import PasswordHasher
+
+PASSWORD = "benchmark-password"
+PASSWORD_HASH = argon2.hash(PASSWORD)
+
+
+def create_app(mode: str, hasher: PasswordHasher) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/posts")
+    async def posts() -> dict:
+        return {"data": [{"id": index, "title": f"Post {index}"} for index in range(10)]}
+
+    @app.post("/login")
+    async def login() -> dict:
+        if mode == "inline":
+            ok = argon2.verify(PASSWORD, PASSWORD_HASH)
+        else:
+            ok = await hasher.verify(PASSWORD, PASSWORD_HASH)
+        return {"ok": ok}
+
+    return app
+
+
+async def run(mode: str, logins: int, requests: int) -> list[float]:
+    hasher = PasswordHasher(PasswordHashingSettings(max_workers=2, max_queue=logins))
+    app = create_app(mode, hasher)
+    stop = asyncio.Event()
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://bench"
+    ) as client:
+
+        async def login_load() -> None:
+            while not stop.is_set():
+                await client.post("/login")
+                # ASGITransport не делает реального I/O - отдаём управление циклу
+                await asyncio.sleep(0)
+
+        load = [asyncio.create_task(login_load()) for _ in range(logins)]
+        await asyncio.sleep(0.2)
+
+        timings = []
+        for _ in range(requests):
+            started = perf_counter()
+            # запрос "пришёл" - ждём своей очереди в цикле событий, как в живом сервере
+            await asyncio.sleep(0)
+            await client.get("/posts")
+            timings.append((perf_counter() - started) * 1000)
+
+        stop.set()
+        await asyncio.gather(*load)
+
+    hasher.shutdown()
+    return timings
+
+
+async def main(logins: int, requests: int) -> None:
+    print(f"{'mode':<10}{'p50, ms':>10}{'p99, ms':>10}")
+    for mode in ("inline", "pool"):
+        timings = await run(mode, logins, requests)
+        cuts = quantiles(timings, n=100)
+        print(f"{mode:<10}{cuts[49]:>10.2f}{cuts[98]:>10.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--logins", type=int, default=4)
+    parser.add_argument("--requests", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main(args.logins, args.requests))
@@ -0,0 +1,116 @@
+"""
+Пропускная способность массового импорта постов.
+
+Запуск из каталога src против БД из .env (с применёнными миграциями):
+    python -m benchmarks.post_import --rows 100000
+
+"copy" - PostImportUseCase: NDJSON-поток, пачки через COPY;
+"orm" - по одному посту через repository.create, как эндпоинт формы.
+Созданные посты, категория и автор удаляются в конце.
+"""
+
+import argparse
+import asyncio
+import json
+import resource
+from time import perf_counter
+from typing import AsyncIterator
+from uuid import uuid4
+
+from sqlalchemy import delete
+
+from application.use_cases.posts.import_posts import PostImportUseCase
+from config.settings import Settings
+from domain.entities.category import Category
+from domain.entities.post import Post
+from domain.entities.user import User
+from infrastructure.managers.autocomplete import AutocompleteIndex
+from infrastructure.managers.response_cache import ResponseCache
+from infrastructure.managers.stream_reader import read_ndjson
+from infrastructure.models.alchemy.base import Category as CategoryModel
+from infrastructure.models.alchemy.base import User as UserModel
+from infrastructure.repositories.alchemy.db import Database
+from infrastructure.uow import SqlAlchemyUnitOfWork
+
+
+async def ndjson(
+    rows: int, prefix: str, category: str, email: str
+) -> AsyncIterator[bytes]:
+    chunk: list[bytes] = []
+    for index in range(rows):
+        row = {
+            "title": f"{prefix}-{index}",
+            "body": "Lorem ipsum dolor sit amet. " * 20,
+            "category": category,
+            "author_email": email,
+        }
+        chunk.append(json.dumps(row).encode() + b"\n")
+        if len(chunk) == 500:
+            yield b"".join(chunk)
+            chunk = []
+    yield b"".join(chunk)
+
+
+async def main(rows: int, orm_rows: int) -> None:
+    database = Database(Settings().db)
+    uow = SqlAlchemyUnitOfWork(database.session_factory)
+    prefix = uuid4().hex[:8]
+    async with uow(autocommit=True):
+        category = await uow.categories.create(Category(name=f"bench-{prefix}"))
+        author = await uow.users.create(
+            User(
+                email=f"bench-{prefix}@test.com",
+                first_name="Bench",
+                last_name="Import",
+                password="hash",
+            )
+        )
+
+    try:
+        use_case = PostImportUseCase(
+            uow,
+            ResponseCache(max_bytes=0, ttl=0),
+            AutocompleteIndex(database, rebuild_interval=0),
+        )
+        started = perf_counter()
+        result = await use_case.execute(
+            read_ndjson(ndjson(rows, prefix, category.name, author.email))
+        )
+        copy_seconds = perf_counter() - started
+
+        started = perf_counter()
+        for index in range(orm_rows):
+            async with uow(autocommit=True):
+                await uow.posts.create(
+                    Post(
+                        title=f"{prefix}-orm-{index}",
+                        body="Lorem ipsum dolor sit amet. " * 20,
+                        author_id=author.id,
+                        category_id=category.id,
+                    )
+                )
+        orm_seconds = perf_counter() - started
+
+        print(f"{'path':<6}{'rows':>10}{'rows/s':>10}")
+        copy_rate = result.imported / copy_seconds
+        print(f"{'copy':<6}{result.imported:>10}{copy_rate:>10.0f}")
+        print(f"{'orm':<6}{orm_rows:>10}{orm_rows / orm_seconds:>10.0f}")
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+        print(f"\nmax RSS: {max_rss:.0f} MiB, ошибок: {result.failed}")
+    finally:
+        # Посты удаляются каскадом вместе с категорией
+        async with database.session_factory() as session:
+            await session.execute(
+                delete(CategoryModel).where(CategoryModel.id == category.id)
+            )
+            await session.execute(delete(UserModel).where(UserModel.id == author.id))
+            await session.commit()
+        await database.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--orm-rows", type=int, default=1_000)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.orm_rows))
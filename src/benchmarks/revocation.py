@@ -0,0 +1,78 @@
+"""
+Стоимость проверки отзыва токена на каждом запросе.
+
+Запуск из каталога src:
+    python -m benchmarks.revocation --revoked 100000 --checks 100000
+    python -m benchmarks.revocation --with-db   # плюс точечный запрос в БД из .env
+
+"bloom" - путь TokenRevocationList для неотозванного токена (обычный случай),
+"set" - попадание в точное множество, "db" - exists() по таблице revoked_tokens.
+"""
+
+import argparse
+import asyncio
+import sys
+from time import perf_counter
+from uuid import uuid4
+
+from config.settings import Settings
+from infrastructure.managers.bloom import BloomFilter
+from infrastructure.repositories.alchemy.db import Database
+from infrastructure.repositories.alchemy.revoked_tokens import (
+    SqlAlchemyRevokedTokensRepository,
+)
+
+
+def per_check_us(check, items: list[str]) -> float:
+    started = perf_counter()
+    for item in items:
+        check(item)
+    return (perf_counter() - started) / len(items) * 1_000_000
+
+
+async def db_check_us(jtis: list[str]) -> float:
+    database = Database(Settings().db)
+    try:
+        async with database.session_factory() as session:
+            repository = SqlAlchemyRevokedTokensRepository(session)
+            started = perf_counter()
+            for jti in jtis:
+                await repository.exists(jti)
+            return (perf_counter() - started) / len(jtis) * 1_000_000
+    finally:
+        await database.engine.dispose()
+
+
+def main(revoked_count: int, checks: int, with_db: bool) -> None:
+    revoked = [uuid4().hex for _ in range(revoked_count)]
+    bloom = BloomFilter(revoked_count, error_rate=0.01)
+    exact = set(revoked)
+    for jti in revoked:
+        bloom.add(jti)
+
+    active = [uuid4().hex for _ in range(checks)]
+    false_positives = sum(jti in bloom for jti in active)
+
+    def hot_path(jti: str) -> bool:
+        return jti in exact or (jti in bloom and jti in exact)
+
+    print(f"{'path':<8}{'us/check':>10}")
+    print(f"{'bloom':<8}{per_check_us(hot_path, active):>10.2f}")
+    print(f"{'set':<8}{per_check_us(hot_path, revoked[:checks]):>10.2f}")
+    if with_db:
+        print(f"{'db':<8}{asyncio.run(db_check_us(active[:1000])):>10.2f}")
+
+    print(
+        f"\nbloom: {len(bloom._bits) / 1024:.0f} KiB, "
+        f"{false_positives / checks:.2%} ложных срабатываний (уходят в БД)"
+    )
+    print(f"set:   {sys.getsizeof(exact) / 1024:.0f} KiB без учёта самих строк")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--revoked", type=int, default=100_000)
+    parser.add_argument("--checks", type=int, default=100_000)
+    parser.add_argument("--with-db", action="store_true")
+    args = parser.parse_args()
+    main(args.revoked, args.checks, args.with_db)
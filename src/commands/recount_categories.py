@@ -0,0 +1,32 @@
+"""
+Пересчёт post_count и last_post_at категорий по таблице posts.
+
+Счётчики ведут триггеры на posts; команда нужна после правок в обход них
+(ручной SQL, восстановление дампа без триггеров) и как проверка расхождений.
+Запуск из каталога src против БД из .env:
+    python -m commands.recount_categories
+"""
+
+import asyncio
+
+from application.use_cases.categories.recount import CategoryRecountUseCase
+from config.settings import Settings
+from infrastructure.managers.response_cache import ResponseCache
+from infrastructure.repositories.alchemy.db import Database
+from infrastructure.uow import SqlAlchemyUnitOfWork
+
+
+async def main() -> None:
+    database = Database(Settings().db)
+    uow = SqlAlchemyUnitOfWork(database.session_factory)
+    # Кэш ответов живёт в процессах API; записи истекут по ttl
+    use_case = CategoryRecountUseCase(uow, ResponseCache(max_bytes=0, ttl=0))
+    try:
+        result = await use_case.execute()
+    finally:
+        await database.dispose()
+    print(f"исправлено категорий: {result.fixed}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
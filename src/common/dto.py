@@ -9,6 +9,8 @@ from domain.entities.post import Post
 class CategoryRead(BaseModel):
     id: int
     name: str
+    post_count: int = 0
+    last_post_at: Optional[datetime] = None
 
     model_config = {"from_attributes": True}
 
@@ -51,3 +53,10 @@ class PostRead(BaseModel):
                 CategoryRead.model_validate(post.category) if post.category else None
             ),
         )
+
+
+class PostSearchHit(BaseModel):
+    post: PostRead
+    rank: float
+    # HTML: фрагменты экранированного текста, найденные слова в <mark>
+    snippet: str
@@ -1,4 +1,5 @@
 class APIException(Exception):
-    def __init__(self, code: int, message: str):
+    def __init__(self, code: int, message: str, headers: dict[str, str] | None = None):
         self.code = code
         self.message = message
+        self.headers = headers
@@ -7,11 +7,11 @@ from fastapi.openapi.utils import get_openapi
 
 import api
 from api import admin_routers, public_routers
-from api.middlewares.get_jwt_token_user import JwtTokenUserMiddleware
 from config.containers import Container
 from config.loggers import config_loggers
 from config.settings import Settings
 from config.uptrace import config_uptrace
+from infrastructure.middleware.consistency import ConsistencyKeyMiddleware
 from infrastructure.middleware.sanitize_html import SanitizeHTMLMiddleware
 
 from .exceptions import handlers
@@ -32,6 +32,7 @@ def create_app(settings: Settings) -> FastAPI:
 
     add_middlewares(app, settings)
     app.add_middleware(SanitizeHTMLMiddleware)
+    app.add_middleware(ConsistencyKeyMiddleware)
 
     include_routers(app, settings)
 
@@ -63,7 +64,6 @@ def add_middlewares(app: FastAPI, settings: Settings) -> None:
         allow_methods=["*"],
         allow_headers=["*"],
     )
-    app.add_middleware(JwtTokenUserMiddleware, settings=settings)
 
 
 @asynccontextmanager
@@ -76,7 +76,12 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, Any]:
         ]
     ) as container:
         app.container = container  # type: ignore
-        yield
+        # Индекс подсказок собирается до первого запроса, а не на нём
+        await container.autocomplete().build()
+        try:
+            yield
+        finally:
+            await container.autocomplete().aclose()
 
 
 def custom_openapi(app: FastAPI) -> Callable[[], Dict[str, Any]]:
@@ -5,26 +5,38 @@ from typing import AsyncGenerator
 from dependency_injector import containers, providers
 
 from application.use_cases.auth.login import LoginUseCase
+from application.use_cases.auth.logout import LogoutUseCase
 from application.use_cases.auth.me import GetCurrentUserUseCase
 from application.use_cases.auth.refresh import RefreshTokenUseCase
 from application.use_cases.auth.register import RegisterUserUseCase
 from application.use_cases.categories.create import CategoryCreateUseCase
 from application.use_cases.categories.list_posts import PostByCategoryUseCase
+from application.use_cases.categories.recount import CategoryRecountUseCase
 from application.use_cases.categories.update import CategoryUpdateUseCase
 from application.use_cases.common.create import ModelObjectCreateUseCase
 from application.use_cases.common.delete import ModelObjectDeleteUseCase
+from application.use_cases.common.export import ModelObjectExportUseCase
 from application.use_cases.common.list import ModelObjectListUseCase
 from application.use_cases.common.partial_update import ModelObjectPartialUpdateUseCase
 from application.use_cases.common.retrieve import ModelObjectRetrieveUseCase
 from application.use_cases.common.update import ModelObjectUpdateUseCase
 from application.use_cases.posts.create import PostCreateUseCase
+from application.use_cases.posts.import_posts import PostImportUseCase
 from application.use_cases.posts.retrieve import PostRetriveUseCase
+from application.use_cases.posts.search import PostSearchUseCase
 from application.use_cases.posts.update import PostUpdateUseCase
 from application.use_cases.users.list import UsersListUseCase
 from application.use_cases.users.retrieve import UserRetrieveUseCase
 from application.use_cases.users.update_user import UserUpdateUseCase
 from config.settings import Settings
+from infrastructure.managers.autocomplete import AutocompleteIndex
+from infrastructure.managers.cache import TTLCache
 from infrastructure.managers.jwt_manager import JWTManager
+from infrastructure.managers.password_hasher import PasswordHasher
+from infrastructure.managers.rate_limiter import AuthRateLimiter
+from infrastructure.managers.response_cache import ResponseCache
+from infrastructure.managers.revocation import TokenRevocationList
+from infrastructure.managers.token_versions import TokenVersionRegistry
 from infrastructure.repositories.alchemy.db import Database
 from infrastructure.uow import SqlAlchemyUnitOfWork, UnitOfWork
 
@@ -41,7 +53,9 @@ class DBContainer(containers.DeclarativeContainer):
     )
 
     uow: providers.Provider[UnitOfWork] = providers.Factory(
-        SqlAlchemyUnitOfWork, session_factory=db.provided.session_factory
+        SqlAlchemyUnitOfWork,
+        session_factory=db.provided.session_factory,
+        replicas=db.provided.replicas,
     )
 
     session = providers.Factory(lambda db: db.session_factory(), db)
@@ -54,30 +68,96 @@ class Container(containers.DeclarativeContainer):
 
     clients = providers.Container(ClientsContainer, settings=settings)
 
-    jwt_manager = providers.Singleton(JWTManager, settings=settings)
+    # Payload уже проверенных токенов по sha256 токена
+    token_cache: providers.Provider[TTLCache] = providers.Singleton(
+        TTLCache,
+        max_size=settings.provided.cache.token_max_size,
+        ttl=settings.provided.cache.token_ttl_seconds,
+    )
+
+    jwt_manager = providers.Singleton(
+        JWTManager, settings=settings, token_cache=token_cache
+    )
+
+    password_hasher: providers.Provider[PasswordHasher] = providers.Singleton(
+        PasswordHasher, settings=settings.provided.hashing
+    )
+
+    auth_rate_limiter: providers.Provider[AuthRateLimiter] = providers.Singleton(
+        AuthRateLimiter, settings=settings.provided.rate_limit
+    )
+
+    # Аутентифицированные пользователи по id, общий для middleware и use cases
+    principal_cache: providers.Provider[TTLCache] = providers.Singleton(
+        TTLCache,
+        max_size=settings.provided.cache.principal_max_size,
+        ttl=settings.provided.cache.principal_ttl_seconds,
+    )
+
+    response_cache: providers.Provider[ResponseCache] = providers.Singleton(
+        ResponseCache,
+        max_bytes=settings.provided.cache.response_max_bytes,
+        ttl=settings.provided.cache.response_ttl_seconds,
+    )
+
+    token_versions: providers.Provider[TokenVersionRegistry] = providers.Singleton(
+        TokenVersionRegistry,
+        database=db.container.db,
+        refresh_interval=settings.provided.jwt.token_versions_refresh_seconds,
+    )
+
+    token_revocations: providers.Provider[TokenRevocationList] = providers.Singleton(
+        TokenRevocationList,
+        database=db.container.db,
+        capacity=settings.provided.jwt.revocation_capacity,
+        error_rate=settings.provided.jwt.revocation_error_rate,
+        refresh_interval=settings.provided.jwt.revocation_refresh_seconds,
+    )
+
+    autocomplete: providers.Provider[AutocompleteIndex] = providers.Singleton(
+        AutocompleteIndex,
+        database=db.container.db,
+        rebuild_interval=settings.provided.cache.autocomplete_rebuild_seconds,
+    )
 
     ###################
     #### Use cases ####
     ###################
 
     register_use_case: providers.Provider[RegisterUserUseCase] = providers.Factory(
-        RegisterUserUseCase, uow=db.container.uow, jwt_manager=jwt_manager
+        RegisterUserUseCase,
+        uow=db.container.uow,
+        jwt_manager=jwt_manager,
+        password_hasher=password_hasher,
     )
 
     login_use_case: providers.Provider[LoginUseCase] = providers.Factory(
-        LoginUseCase, uow=db.container.uow, jwt_manager=jwt_manager
+        LoginUseCase,
+        uow=db.container.uow,
+        jwt_manager=jwt_manager,
+        password_hasher=password_hasher,
     )
 
     refresh_token_use_case: providers.Provider[RefreshTokenUseCase] = providers.Factory(
         RefreshTokenUseCase,
         uow=db.container.uow,
         jwt_manager=jwt_manager,
+        revocations=token_revocations,
+        token_versions=token_versions,
+    )
+
+    logout_use_case: providers.Provider[LogoutUseCase] = providers.Factory(
+        LogoutUseCase,
+        uow=db.container.uow,
+        jwt_manager=jwt_manager,
+        revocations=token_revocations,
     )
 
     get_current_user_use_case = providers.Factory(
         GetCurrentUserUseCase,
         uow=db.container.uow,
         jwt_manager=jwt_manager,
+        trust_claims=settings.provided.jwt.trust_claims,
     )
 
     users_list_use_case = providers.Factory(
@@ -93,11 +173,22 @@ class Container(containers.DeclarativeContainer):
     user_update_use_case = providers.Factory(
         UserUpdateUseCase,
         uow=db.container.uow,
+        principal_cache=principal_cache,
+        token_versions=token_versions,
     )
 
     post_create_use_case = providers.Factory(
         PostCreateUseCase,
         uow=db.container.uow,
+        response_cache=response_cache,
+        autocomplete=autocomplete,
+    )
+
+    post_import_use_case = providers.Factory(
+        PostImportUseCase,
+        uow=db.container.uow,
+        response_cache=response_cache,
+        autocomplete=autocomplete,
     )
 
     post_retrieve_use_case = providers.Factory(
@@ -105,9 +196,16 @@ class Container(containers.DeclarativeContainer):
         uow=db.container.uow,
     )
 
+    post_search_use_case = providers.Factory(
+        PostSearchUseCase,
+        uow=db.container.uow,
+    )
+
     post_update_use_case = providers.Factory(
         PostUpdateUseCase,
         uow=db.container.uow,
+        response_cache=response_cache,
+        autocomplete=autocomplete,
     )
 
     post_by_category_use_case = providers.Factory(
@@ -118,11 +216,21 @@ class Container(containers.DeclarativeContainer):
     category_create_use_case = providers.Factory(
         CategoryCreateUseCase,
         uow=db.container.uow,
+        response_cache=response_cache,
+        autocomplete=autocomplete,
     )
 
     category_update_use_case = providers.Factory(
         CategoryUpdateUseCase,
         uow=db.container.uow,
+        response_cache=response_cache,
+        autocomplete=autocomplete,
+    )
+
+    category_recount_use_case = providers.Factory(
+        CategoryRecountUseCase,
+        uow=db.container.uow,
+        response_cache=response_cache,
     )
 
     # COMMON CRUD USE_CASES
@@ -130,6 +238,8 @@ class Container(containers.DeclarativeContainer):
         providers.Factory(
             ModelObjectCreateUseCase,
             uow=db.container.uow,
+            response_cache=response_cache,
+            autocomplete=autocomplete,
         )
     )
 
@@ -147,10 +257,20 @@ class Container(containers.DeclarativeContainer):
         )
     )
 
+    object_export_use_case: providers.Provider[ModelObjectExportUseCase] = (
+        providers.Factory(
+            ModelObjectExportUseCase,
+            uow=db.container.uow,
+            queue_size=settings.provided.export.queue_size,
+        )
+    )
+
     object_update_use_case: providers.Provider[ModelObjectUpdateUseCase] = (
         providers.Factory(
             ModelObjectUpdateUseCase,
             uow=db.container.uow,
+            response_cache=response_cache,
+            autocomplete=autocomplete,
         )
     )
 
@@ -159,12 +279,18 @@ class Container(containers.DeclarativeContainer):
     ] = providers.Factory(
         ModelObjectPartialUpdateUseCase,
         uow=db.container.uow,
+        response_cache=response_cache,
+        autocomplete=autocomplete,
     )
 
     object_delete_use_case: providers.Provider[ModelObjectDeleteUseCase] = (
         providers.Factory(
             ModelObjectDeleteUseCase,
             uow=db.container.uow,
+            principal_cache=principal_cache,
+            token_versions=token_versions,
+            response_cache=response_cache,
+            autocomplete=autocomplete,
         )
     )
 
@@ -175,4 +301,7 @@ class Container(containers.DeclarativeContainer):
     ) -> AsyncGenerator["Container", None]:
         container = cls()
         container.wire(packages=wireable_packages)
+        await container.password_hasher().calibrate()
         yield container
+        container.password_hasher().shutdown()
+        await container.db.db().dispose()
@@ -5,12 +5,18 @@ from fastapi import Request, Response
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
 
-from api.permissions.exceptions import UserIsNotAdminError, UserIsNotAuthenticatedError
+from api.permissions.exceptions import (
+    AuthenticationError,
+    TokenExpiredError,
+    UserIsNotAdminError,
+    UserIsNotAuthenticatedError,
+)
 from application.exceptions import (
     CategoryAlreadyExists,
     CategoryDoesNotExist,
     InvalidEmailError,
     PostTitleAlreadyExists,
+    TokenRevokedError,
     UserDoesNotExistError,
     UserWithEmailAlreadyExistsError,
     WrongPasswordError,
@@ -56,6 +62,21 @@ async def api_exception_handler(request: Request, exc: APIException):
     return JSONResponse(
         status_code=exc.code,
         content={"code": exc.code, "message": exc.message},
+        headers=exc.headers,
+    )
+
+
+async def authentication_exception_handler(request: Request, exc: DomainException):
+    return JSONResponse(
+        status_code=401,
+        content={
+            "error": {
+                "code": exc.code,
+                "message": exc.message,
+                "detail": exc.get_detail(),
+                "help_link": None,
+            }
+        },
     )
 
 
@@ -82,6 +103,8 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
 
 handlers = {
     APIException: api_exception_handler,
+    AuthenticationError: authentication_exception_handler,
+    TokenExpiredError: authentication_exception_handler,
     UserIsNotAdminError: create_exception_handler(status_code=403),
     UserWithEmailAlreadyExistsError: create_exception_handler(status_code=400),
     UserIsNotAuthenticatedError: create_exception_handler(status_code=403),
@@ -91,5 +114,6 @@ handlers = {
     CategoryAlreadyExists: create_exception_handler(status_code=400),
     PostTitleAlreadyExists: create_exception_handler(status_code=400),
     InvalidEmailError: create_exception_handler(status_code=400),
+    TokenRevokedError: create_exception_handler(status_code=401),
     RequestValidationError: validation_exception_handler,
 }
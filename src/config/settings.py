@@ -16,6 +16,26 @@ class DBSettings(BaseSettings):
     pool_size: int = 2
     max_overflow: int = 4
     echo: bool = False
+    # Общий лимит соединений на все процессы приложения (max_connections Postgres
+    # минус резерв). Если задан, пул одного процесса урезается до доли лимита
+    max_connections: int | None = None
+    workers: int = 1
+    # DSN реплик для чтения; пусто - всё читается из primary
+    replica_dsns: list[str] = []
+    replica_health_interval_seconds: float = 5.0
+    replica_health_timeout_seconds: float = 1.0
+    # Сколько после своей записи клиент читает из primary
+    read_your_writes_seconds: float = 5.0
+
+    @property
+    def pool_limits(self) -> tuple[int, int]:
+        """pool_size и max_overflow одного процесса"""
+        if not self.max_connections:
+            return self.pool_size, self.max_overflow
+
+        per_worker = max(self.max_connections // max(self.workers, 1), 1)
+        pool_size = min(self.pool_size, per_worker)
+        return pool_size, min(self.max_overflow, per_worker - pool_size)
 
     @property
     def dsn(self) -> str:
@@ -66,8 +86,66 @@ class ApiSettings(BaseModel):
 class JWTSettings(BaseSettings):
     secret_key: str = "secret"
     algorithm: str = "HS256"
-    access_token_expire_minutes: int = 600000
-    refresh_token_expire_days: int = 600000
+    access_token_expire_minutes: int = 30
+    refresh_token_expire_days: int = 30
+    # Строить пользователя запроса из claims токена, без обращения к БД.
+    # Отзыв токенов - через users.token_version, перечитываемый раз в N секунд
+    trust_claims: bool = False
+    token_versions_refresh_seconds: float = 30
+    # Отозванные jti: ожидаемый объём bloom-фильтра и период дочитывания таблицы
+    revocation_capacity: int = 100_000
+    revocation_error_rate: float = 0.01
+    revocation_refresh_seconds: float = 10
+
+
+class PasswordHashingSettings(BaseModel):
+    # "thread" (argon2 отпускает GIL) или "process"
+    executor: str = "thread"
+    max_workers: int = 2
+    # Сколько операций может ждать свободного воркера, остальные отклоняются
+    max_queue: int = 32
+    # Сколько секунд операция может простоять в очереди, прежде чем получить 503
+    queue_timeout_seconds: float = 2.0
+    # Параметры argon2. Если задан target_verify_ms, time_cost и memory_cost
+    # подбираются при старте под эту длительность проверки на текущем железе
+    target_verify_ms: float | None = 200
+    time_cost: int = 3
+    memory_cost: int = 65_536  # KiB
+    min_memory_cost: int = 19_456  # KiB, нижняя граница по рекомендациям OWASP
+    parallelism: int = 1
+
+
+class RateLimitSettings(BaseModel):
+    """Token bucket для /auth/login и /auth/register: ёмкость и пополнение в секунду"""
+
+    enabled: bool = True
+    ip_capacity: int = 20
+    ip_refill_per_second: float = 1.0
+    email_capacity: int = 5
+    email_refill_per_second: float = 0.1
+    max_keys: int = 100_000
+
+
+class CacheSettings(BaseModel):
+    principal_max_size: int = 10_000
+    principal_ttl_seconds: float = 60
+    # Проверенные JWT: запись живёт не дольше exp самого токена
+    token_max_size: int = 10_000
+    token_ttl_seconds: float = 300
+    # Ответы публичных GET-эндпоинтов: бюджет памяти и TTL по умолчанию
+    response_enabled: bool = True
+    response_max_bytes: int = 32 * 1024 * 1024
+    response_ttl_seconds: float = 30
+    # Индекс подсказок перестраивается из БД не реже этого периода: так
+    # видны изменения, сделанные другими воркерами
+    autocomplete_rebuild_seconds: float = 300
+
+
+class ExportSettings(BaseModel):
+    # Каталог для файлов выгрузок; в ответ API попадает путь внутри него
+    directory: Path = BASE_DIRECTORY / "storage" / "exports"
+    # Сколько кусков COPY может ждать отправки, прежде чем чтение встанет
+    queue_size: int = 16
 
 
 class Settings(BaseSettings):
@@ -76,6 +154,10 @@ class Settings(BaseSettings):
     db: DBSettings = DBSettings()
     api: ApiSettings = ApiSettings()
     jwt: JWTSettings = JWTSettings()
+    cache: CacheSettings = CacheSettings()
+    hashing: PasswordHashingSettings = PasswordHashingSettings()
+    rate_limit: RateLimitSettings = RateLimitSettings()
+    export: ExportSettings = ExportSettings()
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import Optional
 
 from domain.entities.entity import Entity
@@ -8,7 +9,11 @@ class Category(Entity):
         self,
         id: Optional[int] = None,
         name: Optional[str] = None,
+        post_count: int = 0,
+        last_post_at: Optional[datetime] = None,
     ) -> None:
         super().__init__(id)
 
         self.name = name
+        self.post_count = post_count
+        self.last_post_at = last_post_at
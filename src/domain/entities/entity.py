@@ -1,11 +1,33 @@
+from typing import Any
+
+
 class Entity:
     def __init__(self, id: int | None) -> None:
         self.id = id
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Изменения запоминаются только после загрузки из хранилища
+        changes = self.__dict__.get("_changes")
+        if changes is not None and not name.startswith("_"):
+            if name not in self.__dict__ or self.__dict__[name] != value:
+                changes.add(name)
+        super().__setattr__(name, value)
+
+    @property
+    def changed_fields(self) -> set[str] | None:
+        """Поля, изменённые после mark_clean; None - изменения не отслеживаются"""
+        changes = self.__dict__.get("_changes")
+        return None if changes is None else set(changes)
+
+    def mark_clean(self) -> None:
+        """Состояние совпадает с хранилищем, дальше отслеживаются изменения"""
+        self._changes: set[str] = set()
+
     def __repr__(self) -> str:
         attributes = {
             attribute.strip("_") if attribute.startswith("_") else attribute: value
             for attribute, value in vars(self).items()
+            if attribute != "_changes"
         }
         attributes_repr = ", ".join(
             f"{key}={value}" for key, value in attributes.items()
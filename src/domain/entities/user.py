@@ -19,6 +19,7 @@ class User(Entity):
         password: Optional[str] = None,
         registration_date: Optional[datetime] = datetime.now(),
         posts: Optional[List["Post"]] = None,
+        token_version: int = 0,
     ) -> None:
         super().__init__(id)
         self.email = email
@@ -28,6 +29,13 @@ class User(Entity):
         self.password = password
         self.registration_date = registration_date
         self.posts = posts or []
+        self.token_version = token_version
 
     def change_role(self, role: RoleEnum) -> None:
+        if role != self.role:
+            self.revoke_tokens()
         self.role = role
+
+    def revoke_tokens(self) -> None:
+        """Выданные ранее токены перестают приниматься"""
+        self.token_version += 1
@@ -30,3 +30,9 @@ class UserLoginDTO(BaseModel):
 
 class RefreshTokenDTO(BaseModel):
     refresh_token: str = Field(..., example="eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...")
+
+
+class LogoutDTO(BaseModel):
+    refresh_token: str | None = Field(
+        None, description="Refresh-токен той же сессии, тоже будет отозван"
+    )
@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import Generic, List, Optional, TypeVar
 
 from pydantic import BaseModel
@@ -7,9 +8,18 @@ T = TypeVar("T")
 
 class PaginatedResponse(BaseModel, Generic[T]):
     data: List[T]
-    count: int
-    page: int
+    count: Optional[int] = None
+    page: Optional[int] = None
     page_size: int
-    total_pages: int
+    total_pages: Optional[int] = None
     next: Optional[str] = None
     previous: Optional[str] = None
+    next_cursor: Optional[str] = None
+
+
+class ResourceVersion(BaseModel):
+    """Дешёвый отпечаток ресурса для ETag/Last-Modified, без загрузки самих строк"""
+
+    count: int
+    last_modified: Optional[datetime] = None
+    fingerprint: Optional[str] = None
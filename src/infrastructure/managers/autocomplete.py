@@ -0,0 +1,229 @@
+import asyncio
+import sys
+from bisect import bisect_left
+from datetime import datetime
+from time import monotonic, perf_counter
+from typing import Any, Iterable
+
+from domain.entities.enums import ModelType
+from infrastructure.managers.dto import AutocompleteDTO, AutocompleteStatsDTO
+from infrastructure.repositories.alchemy.categories import (
+    SqlAlchemyCategoriesRepository,
+)
+from infrastructure.repositories.alchemy.db import Database
+from infrastructure.repositories.alchemy.posts import SqlAlchemyPostsRepository
+
+# Поле сущности, по которому строятся подсказки
+FIELDS = {ModelType.POSTS: "title", ModelType.CATEGORIES: "name"}
+
+
+def normalize(text: str) -> str:
+    return text.strip().casefold()
+
+
+class PrefixIndex:
+    """
+    Отсортированный массив ключей в нижнем регистре и параллельный массив
+    исходных строк. Поиск по префиксу - bisect и проход по соседям,
+    O(log n + limit); вставка и удаление - сдвиг массива указателей
+    """
+
+    __slots__ = ("_keys", "_values", "_bytes")
+
+    def __init__(self, values: Iterable[str] = ()) -> None:
+        # Две устойчивые сортировки дают порядок (ключ, строка) без кортежей
+        self._values = sorted(values)
+        self._values.sort(key=normalize)
+        self._keys = [self._key(value) for value in self._values]
+        self._bytes = sum(
+            self._size(key, value) for key, value in zip(self._keys, self._values)
+        )
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def search(self, prefix: str, limit: int) -> list[str]:
+        found = []
+        index = bisect_left(self._keys, prefix)
+        while (
+            len(found) < limit
+            and index < len(self._keys)
+            and self._keys[index].startswith(prefix)
+        ):
+            found.append(self._values[index])
+            index += 1
+        return found
+
+    def add(self, value: str) -> None:
+        key = self._key(value)
+        index = self._position(key, value)
+        if index < len(self._keys) and self._values[index] == value:
+            return
+        self._keys.insert(index, key)
+        self._values.insert(index, value)
+        self._bytes += self._size(key, value)
+
+    def remove(self, value: str) -> None:
+        key = self._key(value)
+        index = self._position(key, value)
+        if index < len(self._keys) and self._values[index] == value:
+            del self._keys[index]
+            del self._values[index]
+            self._bytes -= self._size(key, value)
+
+    def nbytes(self) -> int:
+        """Строки и оба массива указателей"""
+        return self._bytes + sys.getsizeof(self._keys) + sys.getsizeof(self._values)
+
+    def _position(self, key: str, value: str) -> int:
+        # Разные строки могут совпасть без учёта регистра: среди равных
+        # ключей порядок по исходной строке
+        index = bisect_left(self._keys, key)
+        while (
+            index < len(self._keys)
+            and self._keys[index] == key
+            and self._values[index] < value
+        ):
+            index += 1
+        return index
+
+    @staticmethod
+    def _key(value: str) -> str:
+        key = normalize(value)
+        # Строка уже в нижнем регистре - ключ ссылается на неё же
+        return value if key == value else key
+
+    @staticmethod
+    def _size(key: str, value: str) -> int:
+        size = sys.getsizeof(value)
+        return size if key is value else size + sys.getsizeof(key)
+
+
+class AutocompleteIndex:
+    """
+    Подсказки по префиксу заголовков постов и названий категорий из памяти
+    процесса. Строится из БД при старте или первом запросе, затем use cases
+    сообщают о своих изменениях после коммита. Изменения других воркеров
+    подхватываются фоновой перестройкой раз в rebuild_interval
+    """
+
+    def __init__(self, database: Database, rebuild_interval: float) -> None:
+        self._database = database
+        self._rebuild_interval = rebuild_interval
+        self._indexes: dict[ModelType, PrefixIndex] = {}
+        # Изменения, пришедшие во время перестройки: новый индекс их не видел
+        self._pending: list[tuple[bool, ModelType, str]] | None = None
+        self._built_at: datetime | None = None
+        self._loaded_at: float | None = None
+        self._invalidated = False
+        self._build_ms = 0.0
+        self._lock = asyncio.Lock()
+        self._rebuild: asyncio.Task | None = None
+
+    async def suggest(self, query: str, limit: int = 10) -> AutocompleteDTO:
+        if self._loaded_at is None:
+            await self.build()
+        elif self._is_stale() and self._rebuild is None:
+            # Пока индекс перестраивается, отвечает текущий
+            self._rebuild = asyncio.create_task(self.build())
+            self._rebuild.add_done_callback(self._rebuild_done)
+
+        prefix = normalize(query)
+        if not prefix:
+            return AutocompleteDTO()
+        return AutocompleteDTO(
+            posts=self._indexes[ModelType.POSTS].search(prefix, limit),
+            categories=self._indexes[ModelType.CATEGORIES].search(prefix, limit),
+        )
+
+    async def build(self) -> None:
+        async with self._lock:
+            if not self._is_stale():
+                return
+
+            started = perf_counter()
+            self._invalidated = False
+            self._pending = []
+            try:
+                async with self._database.session_factory() as session:
+                    titles = await SqlAlchemyPostsRepository(session).get_titles()
+                    names = await SqlAlchemyCategoriesRepository(session).get_names()
+                # Сортировка миллиона строк - секунды CPU: не в event loop
+                indexes = {
+                    ModelType.POSTS: await asyncio.to_thread(PrefixIndex, titles),
+                    ModelType.CATEGORIES: await asyncio.to_thread(PrefixIndex, names),
+                }
+                for added, model_type, value in self._pending:
+                    self._change(indexes[model_type], added, value)
+            finally:
+                self._pending = None
+
+            self._indexes = indexes
+            self._built_at = datetime.now()
+            self._loaded_at = monotonic()
+            self._build_ms = (perf_counter() - started) * 1000
+
+    async def aclose(self) -> None:
+        """Отменяет фоновую перестройку: она не должна пережить пул соединений"""
+        if (rebuild := self._rebuild) is not None:
+            rebuild.cancel()
+            await asyncio.wait([rebuild])
+
+    def label(self, model_type: ModelType, entity: Any) -> str | None:
+        """Строка сущности в индексе; None - модель не индексируется"""
+        field = FIELDS.get(model_type)
+        return getattr(entity, field) if field else None
+
+    def add(self, model_type: ModelType, value: str | None) -> None:
+        self._apply(True, model_type, value)
+
+    def remove(self, model_type: ModelType, value: str | None) -> None:
+        self._apply(False, model_type, value)
+
+    def replace(
+        self, model_type: ModelType, old: str | None, new: str | None
+    ) -> None:
+        if old != new:
+            self.remove(model_type, old)
+            self.add(model_type, new)
+
+    def invalidate(self) -> None:
+        """Изменения, которые нельзя применить точечно (каскадное удаление)"""
+        self._invalidated = True
+
+    def stats(self) -> AutocompleteStatsDTO:
+        return AutocompleteStatsDTO(
+            posts=len(self._indexes.get(ModelType.POSTS, ())),
+            categories=len(self._indexes.get(ModelType.CATEGORIES, ())),
+            bytes=sum(index.nbytes() for index in self._indexes.values()),
+            built_at=self._built_at,
+            build_ms=round(self._build_ms, 1),
+        )
+
+    def _apply(self, added: bool, model_type: ModelType, value: str | None) -> None:
+        if value is None or model_type not in FIELDS:
+            return
+        if self._pending is not None:
+            self._pending.append((added, model_type, value))
+        if (index := self._indexes.get(model_type)) is not None:
+            self._change(index, added, value)
+
+    @staticmethod
+    def _change(index: PrefixIndex, added: bool, value: str) -> None:
+        if added:
+            index.add(value)
+        else:
+            index.remove(value)
+
+    def _rebuild_done(self, task: asyncio.Task) -> None:
+        self._rebuild = None
+        # Неудачная перестройка повторится на следующем запросе
+        if not task.cancelled():
+            task.exception()
+
+    def _is_stale(self) -> bool:
+        return (
+            self._loaded_at is None
+            or self._invalidated
+            or monotonic() - self._loaded_at >= self._rebuild_interval
+        )
@@ -0,0 +1,34 @@
+from hashlib import blake2b
+from math import ceil, log
+
+
+class BloomFilter:
+    """
+    Вероятностное множество строк: «нет» - точно нет, «да» - возможно.
+    Размер подбирается по ожидаемому числу элементов и доле ложных срабатываний
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.01) -> None:
+        capacity = max(capacity, 1)
+        self.capacity = capacity
+        self.size = ceil(-capacity * log(error_rate) / log(2) ** 2)
+        self.hash_count = max(round(self.size / capacity * log(2)), 1)
+        self.count = 0
+        self._bits = bytearray(ceil(self.size / 8))
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self._bits[index >> 3] & (1 << (index & 7)) for index in self._indexes(item)
+        )
+
+    def add(self, item: str) -> None:
+        for index in self._indexes(item):
+            self._bits[index >> 3] |= 1 << (index & 7)
+        self.count += 1
+
+    def _indexes(self, item: str) -> list[int]:
+        # Двойное хеширование: k индексов из двух половин одного дайджеста
+        digest = blake2b(item.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return [(first + i * second) % self.size for i in range(self.hash_count)]
@@ -1,3 +1,5 @@
+from datetime import datetime
+
 from pydantic import BaseModel, Field
 
 from infrastructure.enum import RoleEnum
@@ -7,3 +9,54 @@ class UserCreateDTO(BaseModel):
     user_id: int = Field(gt=0, alias="user_id")
     email: str = Field(alias="email")
     role: RoleEnum = Field(alias="role")
+    first_name: str | None = None
+    last_name: str | None = None
+    registration_date: datetime | None = None
+    token_version: int = 0
+
+
+class CacheStatsDTO(BaseModel):
+    size: int
+    max_size: int
+    hits: int
+    misses: int
+    hit_ratio: float
+
+
+class ResponseCacheStatsDTO(BaseModel):
+    size: int
+    bytes: int
+    max_bytes: int
+    hits: int
+    misses: int
+    hit_ratio: float
+    avg_hit_ms: float
+    avg_miss_ms: float
+
+
+class PasswordHashingStatsDTO(BaseModel):
+    time_cost: int
+    memory_cost: int
+    parallelism: int
+    max_workers: int
+    in_flight: int
+    waiting: int
+
+
+class ExportFileDTO(BaseModel):
+    path: str
+    size: int
+
+
+class AutocompleteDTO(BaseModel):
+    posts: list[str] = []
+    categories: list[str] = []
+
+
+class AutocompleteStatsDTO(BaseModel):
+    posts: int
+    categories: int
+    # Оценка памяти индекса: строки и массивы указателей
+    bytes: int
+    built_at: datetime | None
+    build_ms: float
@@ -1,15 +1,21 @@
 import datetime
+from hashlib import sha256
+from uuid import uuid4
 
 import jwt
 
 from config.settings import JWTSettings
+from infrastructure.managers.cache import TTLCache
 from infrastructure.managers.dto import UserCreateDTO
 from infrastructure.managers.enum import TokenType
 
 
 class JWTManager:
-    def __init__(self, settings: JWTSettings):
+    def __init__(
+        self, settings: JWTSettings, token_cache: TTLCache[str, dict] | None = None
+    ):
         self.jwt_settigns = settings.jwt
+        self.token_cache = token_cache
 
     def create_access_token(self, data: UserCreateDTO) -> str:
         payload = self.create_payload(data, token_type=TokenType.ACCESS)
@@ -27,19 +33,55 @@ class JWTManager:
             algorithm=self.jwt_settigns.algorithm,
         )
 
+    def decode_token(self, token: str) -> dict:
+        """
+        Проверяет подпись и декодирует токен. Payload кэшируется по sha256 токена
+        не дольше его exp, так что повторный токен не проходит HMAC заново.
+        Ошибки PyJWT пробрасываются как есть; возвращаемый dict нельзя менять
+        """
+        if self.token_cache is None:
+            return self._decode(token)
+
+        key = sha256(token.encode()).hexdigest()
+        payload = self.token_cache.get(key)
+        if payload is not None:
+            return payload
+
+        payload = self._decode(token)
+        ttl = self.token_cache.ttl
+        if isinstance(payload.get("exp"), (int, float)):
+            ttl = min(ttl, payload["exp"] - datetime.datetime.now().timestamp())
+        if ttl > 0:
+            self.token_cache.set(key, payload, ttl=ttl)
+        return payload
+
     def verify_token(self, token: str) -> dict:
         try:
-            payload = jwt.decode(
-                token,
-                self.jwt_settigns.secret_key,
-                algorithms=[self.jwt_settigns.algorithm],
-            )
-            return payload
+            return self.decode_token(token)
         except jwt.ExpiredSignatureError:
             raise ValueError("Token has expired")
         except jwt.InvalidTokenError:
             raise ValueError("Invalid token")
 
+    def _decode(self, token: str) -> dict:
+        return jwt.decode(
+            token,
+            self.jwt_settigns.secret_key,
+            algorithms=[self.jwt_settigns.algorithm],
+        )
+
+    @staticmethod
+    def get_token_id(token: str, payload: dict) -> str:
+        """jti токена; у выданных до ротации токенов его нет - берём sha256"""
+        return payload.get("jti") or sha256(token.encode()).hexdigest()
+
+    @staticmethod
+    def get_expiration(payload: dict) -> datetime.datetime:
+        """exp токена как naive UTC, в котором хранятся даты отзыва"""
+        return datetime.datetime.fromtimestamp(
+            payload["exp"], tz=datetime.UTC
+        ).replace(tzinfo=None)
+
     def decode_refresh_token(self, token: str) -> dict:
         payload = self.verify_token(token)
 
@@ -49,19 +91,30 @@ class JWTManager:
         return payload
 
     def create_payload(self, data: UserCreateDTO, token_type: TokenType) -> dict:
+        # PyJWT считает naive datetime временем в UTC
+        now = datetime.datetime.now(tz=datetime.UTC)
         if token_type == TokenType.REFRESH:
-            expire = datetime.datetime.now() + datetime.timedelta(
+            expire = now + datetime.timedelta(
                 days=self.jwt_settigns.refresh_token_expire_days
             )
         else:
-            expire = datetime.datetime.now() + datetime.timedelta(
+            expire = now + datetime.timedelta(
                 minutes=self.jwt_settigns.access_token_expire_minutes
             )
 
-        return {
+        payload = {
             "token_type": token_type.value,
             "email": data.email,
             "exp": expire,
             "user_id": data.user_id,
             "role": data.role,
+            "ver": data.token_version,
+            "jti": uuid4().hex,
         }
+        # Профиль в claims позволяет не ходить в БД в режиме trust_claims
+        if data.first_name is not None:
+            payload["first_name"] = data.first_name
+            payload["last_name"] = data.last_name
+        if data.registration_date is not None:
+            payload["registration_date"] = data.registration_date.isoformat()
+        return payload
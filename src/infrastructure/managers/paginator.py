@@ -1,34 +1,94 @@
+import base64
+import binascii
+import json
+from datetime import datetime
 from math import ceil
-from typing import Generic, Optional, Type, TypeVar
+from typing import Any, Generic, Optional, Type, TypeVar
 from urllib.parse import urlencode
 
+from common.exceptions import APIException
 from fastapi import Request
-from sqlalchemy import Result
+from sqlalchemy import Select
 
 from domain.validators.dto import PaginatedResponse
+from infrastructure.repositories.interfaces.base import ModelRepository
 
 T = TypeVar("T")
 
 
+def encode_cursor(values: tuple) -> str:
+    raw = json.dumps(
+        [value.isoformat() if isinstance(value, datetime) else value for value in values]
+    )
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, types: tuple[type, ...]) -> tuple:
+    """
+    Курсор хранит значения CURSOR_FIELDS: даты - строками в ISO-формате.
+    Число и типы значений сверяются с types, чтобы подделанный курсор
+    давал 400, а не ошибку драйвера
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+        if not isinstance(values, list) or len(values) != len(types):
+            raise ValueError
+        return tuple(
+            _cursor_value(value, type_) for value, type_ in zip(values, types)
+        )
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError):
+        raise APIException(code=400, message="Некорректный курсор пагинации")
+
+
+def _cursor_value(value: Any, type_: type) -> Any:
+    if type_ is datetime:
+        if not isinstance(value, str):
+            raise ValueError
+        return datetime.fromisoformat(value)
+    # bool - подкласс int, но в курсоре его быть не может
+    if isinstance(value, bool):
+        raise ValueError
+    if type_ is float and isinstance(value, int):
+        return float(value)
+    if not isinstance(value, type_):
+        raise ValueError
+    return value
+
+
+def cursor_url(request: Request, cursor: str, page_size: int) -> str:
+    """URL следующей страницы: текущие параметры запроса с новым курсором"""
+    params = {
+        **{
+            key: value
+            for key, value in request.query_params.items()
+            if key not in ("page", "cursor")
+        },
+        "cursor": cursor,
+        "page_size": str(page_size),
+    }
+    return f"{request.url.replace_query_params()}?{urlencode(params)}"
+
+
 class Paginator(Generic[T]):
     def __init__(self, schema_read: Type[T]):
         self.schema_read = schema_read
 
     async def paginate(
         self,
-        result: Result,
+        repository: ModelRepository,
+        stmt: Select,
         request: Request,
         page: int = 1,
         page_size: int = 10,
     ) -> PaginatedResponse[T]:
-        items = result.scalars().unique().all()
-        total_items = len(items)
+        """Выполняет запрос с LIMIT/OFFSET, не выгружая всю таблицу"""
+        items, total_items = await repository.get_page(
+            stmt, limit=page_size, offset=(page - 1) * page_size
+        )
         total_pages = ceil(total_items / page_size) if total_items else 1
 
-        start = (page - 1) * page_size
-        end = start + page_size
-        paginated_items = items[start:end]
-        data = [self.schema_read.model_validate(obj) for obj in paginated_items]
+        data = [self.schema_read.model_validate(obj) for obj in items]
         base_url = str(request.url.replace_query_params())
         query_params = dict(request.query_params)
 
@@ -42,6 +102,10 @@ class Paginator(Generic[T]):
             }
             return f"{base_url}?{urlencode(params)}"
 
+        next_cursor = None
+        if repository.CURSOR_FIELDS and items and page < total_pages:
+            next_cursor = self._build_cursor(repository, items[-1])
+
         return PaginatedResponse[T](
             data=data,
             count=total_items,
@@ -50,4 +114,35 @@ class Paginator(Generic[T]):
             total_pages=total_pages,
             next=build_url(page + 1),
             previous=build_url(page - 1),
+            next_cursor=next_cursor,
+        )
+
+    async def paginate_by_cursor(
+        self,
+        repository: ModelRepository,
+        stmt: Select,
+        request: Request,
+        cursor: str,
+        page_size: int = 10,
+    ) -> PaginatedResponse[T]:
+        """Keyset-пагинация: стоимость страницы не зависит от её глубины"""
+        stmt = repository.seek(stmt, decode_cursor(cursor, repository.cursor_types()))
+        items = await repository.get_slice(stmt, limit=page_size + 1)
+
+        next_cursor = None
+        if len(items) > page_size:
+            items = items[:page_size]
+            next_cursor = self._build_cursor(repository, items[-1])
+
+        data = [self.schema_read.model_validate(obj) for obj in items]
+        return PaginatedResponse[T](
+            data=data,
+            page_size=page_size,
+            next=cursor_url(request, next_cursor, page_size) if next_cursor else None,
+            next_cursor=next_cursor,
+        )
+
+    def _build_cursor(self, repository: ModelRepository, obj: Any) -> str:
+        return encode_cursor(
+            tuple(getattr(obj, field) for field in repository.CURSOR_FIELDS)
         )
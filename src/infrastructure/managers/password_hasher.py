@@ -0,0 +1,196 @@
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import cache, partial
+from time import perf_counter
+from typing import Callable, TypeVar
+
+from common.exceptions import APIException
+from passlib.hash import argon2
+
+from config.settings import PasswordHashingSettings
+from infrastructure.managers.dto import PasswordHashingStatsDTO
+
+T = TypeVar("T")
+
+# Хеш перехешируется, только если его стоимость (rounds * memory_cost) ниже
+# текущей больше, чем на этот запас: калибровка в разных процессах
+# и после перезапуска даёт немного разные параметры
+REHASH_MARGIN = 0.8
+
+
+def hash_password(password: str, **params: int) -> str:
+    return argon2.using(**params).hash(password)
+
+
+def verify_password(password: str, password_hash: str) -> bool:
+    # Параметры берутся из самого хеша
+    return argon2.verify(password, password_hash)
+
+
+@cache
+def calibrate_argon2(
+    target_ms: float, memory_cost: int, min_memory_cost: int, parallelism: int
+) -> dict[str, int]:
+    """
+    Подбирает rounds (time_cost) и memory_cost так, чтобы хеширование
+    занимало около target_ms. Время argon2 растёт линейно по rounds, поэтому
+    достаточно двух замеров; если и один проход дольше цели - уменьшаем память.
+    Результат кэшируется на процесс
+    """
+
+    def measure(rounds: int, memory: int) -> float:
+        handler = argon2.using(
+            rounds=rounds, memory_cost=memory, parallelism=parallelism
+        )
+        started = perf_counter()
+        handler.hash("calibration")
+        return (perf_counter() - started) * 1000
+
+    # Первый замер прогревает аллокатор и не учитывается
+    measure(1, memory_cost)
+    single_pass = measure(1, memory_cost)
+    while single_pass > target_ms and memory_cost // 2 >= min_memory_cost:
+        memory_cost //= 2
+        single_pass = measure(1, memory_cost)
+
+    rounds = 1
+    if single_pass < target_ms:
+        per_round = max(measure(2, memory_cost) - single_pass, 0.001)
+        rounds += round((target_ms - single_pass) / per_round)
+    return {"rounds": rounds, "memory_cost": memory_cost, "parallelism": parallelism}
+
+
+class PasswordHasher:
+    """
+    Argon2 в отдельном пуле: хеширование не блокирует event loop.
+    Одновременно выполняется не больше max_workers операций, ещё max_queue
+    ждут слота не дольше queue_timeout_seconds, остальные сразу получают 503
+    """
+
+    def __init__(self, settings: PasswordHashingSettings) -> None:
+        self._settings = settings
+        self._set_params(
+            {
+                "rounds": settings.time_cost,
+                "memory_cost": settings.memory_cost,
+                "parallelism": settings.parallelism,
+            }
+        )
+        self._executor: Executor
+        if settings.executor == "process":
+            self._executor = ProcessPoolExecutor(max_workers=settings.max_workers)
+        else:
+            self._executor = ThreadPoolExecutor(
+                max_workers=settings.max_workers, thread_name_prefix="argon2"
+            )
+        self._slots = asyncio.Semaphore(settings.max_workers)
+        self._max_queue = settings.max_queue
+        self._queue_timeout = settings.queue_timeout_seconds
+        self._waiting = 0
+        self._in_flight = 0
+
+    @property
+    def params(self) -> dict[str, int]:
+        return dict(self._params)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def waiting(self) -> int:
+        return self._waiting
+
+    async def calibrate(self) -> None:
+        """Подбирает параметры под target_verify_ms в пуле хеширования"""
+        if self._settings.target_verify_ms is None:
+            return
+
+        loop = asyncio.get_running_loop()
+        params = await loop.run_in_executor(
+            self._executor,
+            partial(
+                calibrate_argon2,
+                self._settings.target_verify_ms,
+                self._settings.memory_cost,
+                self._settings.min_memory_cost,
+                self._settings.parallelism,
+            ),
+        )
+        self._set_params(params)
+
+    def stats(self) -> PasswordHashingStatsDTO:
+        return PasswordHashingStatsDTO(
+            time_cost=self._params["rounds"],
+            memory_cost=self._params["memory_cost"],
+            parallelism=self._params["parallelism"],
+            max_workers=self._settings.max_workers,
+            in_flight=self._in_flight,
+            waiting=self._waiting,
+        )
+
+    def needs_update(self, password_hash: str) -> bool:
+        """
+        Хеш слабее текущих параметров. Более сильный не трогаем, иначе воркеры
+        с разной калибровкой перехешировали бы пароли друг за другом.
+        Дёшево: разбирает только строку хеша
+        """
+        try:
+            stored = argon2.from_string(password_hash)
+        except ValueError:
+            return True
+
+        current = self._handler
+        if (stored.type, stored.version, stored.parallelism) != (
+            current.type,
+            current.max_version,
+            current.parallelism,
+        ):
+            return True
+        return (
+            stored.rounds * stored.memory_cost
+            < REHASH_MARGIN * current.default_rounds * current.memory_cost
+        )
+
+    async def hash(self, password: str) -> str:
+        return await self._run(partial(hash_password, password, **self._params))
+
+    async def verify(self, password: str, password_hash: str) -> bool:
+        return await self._run(partial(verify_password, password, password_hash))
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _set_params(self, params: dict[str, int]) -> None:
+        self._params = params
+        self._handler = argon2.using(**params)
+
+    async def _run(self, func: Callable[[], T]) -> T:
+        await self._acquire()
+        self._in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, func)
+        finally:
+            self._in_flight -= 1
+            self._slots.release()
+
+    async def _acquire(self) -> None:
+        if not self._slots.locked():
+            await self._slots.acquire()
+            return
+
+        if self._waiting >= self._max_queue:
+            raise APIException(
+                code=503, message="Сервис аутентификации перегружен, повторите позже"
+            )
+
+        self._waiting += 1
+        try:
+            await asyncio.wait_for(self._slots.acquire(), self._queue_timeout)
+        except TimeoutError:
+            raise APIException(
+                code=503, message="Сервис аутентификации перегружен, повторите позже"
+            )
+        finally:
+            self._waiting -= 1
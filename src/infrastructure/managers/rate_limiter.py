@@ -0,0 +1,69 @@
+from collections import OrderedDict
+from math import ceil
+from time import monotonic
+
+from common.exceptions import APIException
+
+from config.settings import RateLimitSettings
+
+
+class TokenBucket:
+    """
+    Набор token bucket'ов в памяти процесса, по одному на ключ.
+    Старые ключи вытесняются по LRU, чтобы поток уникальных IP не съел память
+    """
+
+    def __init__(self, capacity: int, refill_per_second: float, max_keys: int) -> None:
+        self._capacity = capacity
+        self._refill = refill_per_second
+        self._max_keys = max_keys
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def acquire(self, key: str) -> float:
+        """Забирает токен. Возвращает 0 или число секунд до появления следующего"""
+        now = monotonic()
+        tokens, updated_at = self._buckets.pop(key, (self._capacity, now))
+        tokens = min(self._capacity, tokens + (now - updated_at) * self._refill)
+
+        retry_after = 0.0
+        if tokens >= 1:
+            tokens -= 1
+        else:
+            retry_after = (1 - tokens) / self._refill
+
+        self._buckets[key] = (tokens, now)
+        if len(self._buckets) > self._max_keys:
+            self._buckets.popitem(last=False)
+        return retry_after
+
+
+class AuthRateLimiter:
+    """Ограничивает попытки логина и регистрации по IP клиента и по email"""
+
+    def __init__(self, settings: RateLimitSettings) -> None:
+        self._enabled = settings.enabled
+        self._by_ip = TokenBucket(
+            settings.ip_capacity, settings.ip_refill_per_second, settings.max_keys
+        )
+        self._by_email = TokenBucket(
+            settings.email_capacity, settings.email_refill_per_second, settings.max_keys
+        )
+
+    def check(self, ip: str | None, email: str) -> None:
+        if not self._enabled:
+            return
+
+        # Email-бакет трогаем, только если IP пропустил запрос: иначе флуд с
+        # одного адреса выжигал бы попытки чужого аккаунта
+        retry_after = self._by_ip.acquire(ip or "unknown") or self._by_email.acquire(
+            email.strip().lower()
+        )
+        if retry_after:
+            raise APIException(
+                code=429,
+                message="Слишком много попыток, повторите позже",
+                headers={"Retry-After": str(ceil(retry_after))},
+            )
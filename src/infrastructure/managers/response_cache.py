@@ -0,0 +1,131 @@
+from collections import OrderedDict
+from time import monotonic
+from typing import Iterable
+
+from infrastructure.managers.dto import ResponseCacheStatsDTO
+
+
+class CachedResponse:
+    __slots__ = ("body", "media_type", "tags", "expires_at", "headers")
+
+    def __init__(
+        self,
+        body: bytes,
+        media_type: str,
+        tags: frozenset[str],
+        expires_at: float,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        self.body = body
+        self.media_type = media_type
+        self.tags = tags
+        self.expires_at = expires_at
+        self.headers = headers or {}
+
+
+class ResponseCache:
+    """
+    Готовые тела ответов публичных GET-эндпоинтов.
+    Размер ограничен суммарным объёмом тел (LRU), записи помечены тегами
+    и сбрасываются use case'ами после коммита изменений
+    """
+
+    def __init__(self, max_bytes: int, ttl: float) -> None:
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._hit_seconds = 0.0
+        self._miss_seconds = 0.0
+        self._bytes = 0
+        self._data: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._keys_by_tag: dict[str, set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: str) -> CachedResponse | None:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+
+        if entry.expires_at <= monotonic():
+            self._remove(key)
+            return None
+
+        self._data.move_to_end(key)
+        return entry
+
+    def set(
+        self,
+        key: str,
+        body: bytes,
+        tags: Iterable[str],
+        ttl: float | None = None,
+        media_type: str = "application/json",
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        if len(body) > self.max_bytes:
+            return
+
+        self._remove(key)
+        entry = CachedResponse(
+            body=body,
+            media_type=media_type,
+            tags=frozenset(tags),
+            expires_at=monotonic() + (self.ttl if ttl is None else ttl),
+            headers=headers,
+        )
+        self._data[key] = entry
+        self._bytes += len(body)
+        for tag in entry.tags:
+            self._keys_by_tag.setdefault(tag, set()).add(key)
+
+        while self._bytes > self.max_bytes:
+            self._remove(next(iter(self._data)))
+
+    def invalidate_tags(self, *tags: str) -> None:
+        for tag in tags:
+            for key in self._keys_by_tag.pop(tag, set()).copy():
+                self._remove(key)
+
+    def clear(self) -> None:
+        self._data.clear()
+        self._keys_by_tag.clear()
+        self._bytes = 0
+
+    def record(self, hit: bool, seconds: float) -> None:
+        if hit:
+            self.hits += 1
+            self._hit_seconds += seconds
+        else:
+            self.misses += 1
+            self._miss_seconds += seconds
+
+    def stats(self) -> ResponseCacheStatsDTO:
+        requests = self.hits + self.misses
+        return ResponseCacheStatsDTO(
+            size=len(self._data),
+            bytes=self._bytes,
+            max_bytes=self.max_bytes,
+            hits=self.hits,
+            misses=self.misses,
+            hit_ratio=self.hits / requests if requests else 0.0,
+            avg_hit_ms=self._hit_seconds / self.hits * 1000 if self.hits else 0.0,
+            avg_miss_ms=(
+                self._miss_seconds / self.misses * 1000 if self.misses else 0.0
+            ),
+        )
+
+    def _remove(self, key: str) -> None:
+        entry = self._data.pop(key, None)
+        if entry is None:
+            return
+
+        self._bytes -= len(entry.body)
+        for tag in entry.tags:
+            keys = self._keys_by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_tag[tag]
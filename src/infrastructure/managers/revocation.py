@@ -0,0 +1,102 @@
+import asyncio
+from time import monotonic
+
+from infrastructure.managers.bloom import BloomFilter
+from infrastructure.repositories.alchemy.db import Database
+from infrastructure.repositories.alchemy.revoked_tokens import (
+    SqlAlchemyRevokedTokensRepository,
+)
+
+
+class TokenRevocationList:
+    """
+    Отозванные токены (jti) для проверки на каждом запросе.
+    Bloom-фильтр отвечает «точно не отозван» без обращения к БД, в БД идём
+    только при срабатывании фильтра. Точное множество хранит отзывы этого
+    процесса и подтверждённые БД, пока фильтр не перестроен.
+    Таблица дочитывается инкрементально не чаще раза в refresh_interval,
+    а каждые rebuild_every чтений фильтр строится заново без истёкших токенов
+    """
+
+    def __init__(
+        self,
+        database: Database,
+        capacity: int,
+        error_rate: float,
+        refresh_interval: float,
+        rebuild_every: int = 10,
+    ) -> None:
+        self._database = database
+        self._capacity = capacity
+        self._error_rate = error_rate
+        self._refresh_interval = refresh_interval
+        self._rebuild_every = rebuild_every
+        self._bloom = BloomFilter(capacity, error_rate)
+        self._revoked: set[str] = set()
+        # Поколение точного множества до последней перестройки фильтра
+        self._previous: set[str] = set()
+        self._last_id = 0
+        self._refreshes = 0
+        self._loaded_at: float | None = None
+        self._lock = asyncio.Lock()
+
+    async def is_revoked(self, jti: str) -> bool:
+        if self._is_stale():
+            await self.refresh()
+
+        if jti in self._revoked or jti in self._previous:
+            return True
+        if jti not in self._bloom:
+            return False
+
+        # Редкий путь: токен действительно отозван или ложное срабатывание
+        async with self._database.session_factory() as session:
+            revoked = await SqlAlchemyRevokedTokensRepository(session).exists(jti)
+        if revoked:
+            self._revoked.add(jti)
+        return revoked
+
+    def add(self, jti: str) -> None:
+        """Отзыв, уже записанный в БД этим процессом, виден сразу"""
+        self._bloom.add(jti)
+        self._revoked.add(jti)
+
+    async def refresh(self) -> None:
+        async with self._lock:
+            if not self._is_stale():
+                return
+
+            # Перестройка убирает истёкшие отзывы и id, пропущенные из-за
+            # транзакций, закоммиченных не в порядке выдачи id
+            rebuild = (
+                self._refreshes % self._rebuild_every == 0
+                or self._bloom.count >= self._capacity
+            )
+            last_id = 0 if rebuild else self._last_id
+
+            async with self._database.session_factory() as session:
+                rows = await SqlAlchemyRevokedTokensRepository(session).get_since(
+                    last_id
+                )
+
+            if rebuild:
+                self._bloom = BloomFilter(
+                    max(self._capacity, len(rows) * 2), self._error_rate
+                )
+                # Свежие отзывы могли не попасть в снимок - держим их ещё поколение
+                self._previous, self._revoked = self._revoked, set()
+                for jti in self._previous:
+                    self._bloom.add(jti)
+            for row_id, jti in rows:
+                self._bloom.add(jti)
+                last_id = row_id
+
+            self._last_id = last_id
+            self._refreshes += 1
+            self._loaded_at = monotonic()
+
+    def _is_stale(self) -> bool:
+        return (
+            self._loaded_at is None
+            or monotonic() - self._loaded_at >= self._refresh_interval
+        )
@@ -0,0 +1,103 @@
+import codecs
+import csv
+import json
+from typing import Any, AsyncIterator
+
+# Номер строки, данные записи или текст ошибки разбора
+Record = tuple[int, dict[str, Any] | None, str | None]
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """Строки потока байт в UTF-8, без накопления всего тела"""
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    buffer = ""
+    async for chunk in chunks:
+        buffer += decoder.decode(chunk)
+        *lines, buffer = buffer.split("\n")
+        for line in lines:
+            yield line.removesuffix("\r")
+    buffer += decoder.decode(b"", final=True)
+    if buffer:
+        yield buffer.removesuffix("\r")
+
+
+async def read_ndjson(chunks: AsyncIterator[bytes]) -> AsyncIterator[Record]:
+    number = 0
+    async for line in iter_lines(chunks):
+        number += 1
+        if not line.strip():
+            continue
+        try:
+            data = json.loads(line)
+        except ValueError as error:
+            yield number, None, f"Некорректный JSON: {error}"
+            continue
+        if not isinstance(data, dict):
+            yield number, None, "Ожидался JSON-объект"
+            continue
+        yield number, data, None
+
+
+# Состояния разбора CSV на границе строк, как у модуля csv: кавычка открывает
+# поле только в его начале, внутри поля в кавычках "" - экранированная кавычка
+START_FIELD, IN_FIELD, IN_QUOTED, QUOTE_IN_QUOTED = range(4)
+# Запись в кавычках копится в памяти: незакрытая кавычка не должна собрать
+# в одну запись весь остаток файла
+MAX_RECORD_CHARS = 1 << 20
+
+
+def quote_state(line: str, state: int = START_FIELD) -> int:
+    """Состояние разбора после строки; IN_QUOTED - запись продолжается"""
+    if '"' not in line:
+        return state if state == IN_QUOTED else START_FIELD
+
+    for char in line:
+        if state == IN_QUOTED:
+            if char == '"':
+                state = QUOTE_IN_QUOTED
+        elif char == ",":
+            state = START_FIELD
+        elif state == QUOTE_IN_QUOTED:
+            state = IN_QUOTED if char == '"' else IN_FIELD
+        elif state == START_FIELD:
+            state = IN_QUOTED if char == '"' else IN_FIELD
+    return state
+
+
+async def read_csv(chunks: AsyncIterator[bytes]) -> AsyncIterator[Record]:
+    """CSV с заголовком; поле в кавычках может содержать переводы строк"""
+    header: list[str] | None = None
+    lines: list[str] = []
+    size = 0
+    state = START_FIELD
+    number = start = 0
+    async for line in iter_lines(chunks):
+        number += 1
+        if not lines:
+            start = number
+        lines.append(line)
+        size += len(line)
+        state = quote_state(line, state)
+        if state == IN_QUOTED:
+            if size <= MAX_RECORD_CHARS:
+                continue
+            # Следующая строка разбирается как начало новой записи
+            lines, size, state = [], 0, START_FIELD
+            yield start, None, "Незакрытая кавычка: запись слишком длинная"
+            continue
+
+        text = "\n".join(lines)
+        lines, size, state = [], 0, START_FIELD
+        if not text.strip():
+            continue
+
+        values = next(csv.reader([text]))
+        if header is None:
+            header = [name.strip() for name in values]
+        elif len(values) != len(header):
+            yield start, None, "Число полей не совпадает с заголовком"
+        else:
+            yield start, dict(zip(header, values)), None
+
+    if lines:
+        yield start, None, "Незакрытая кавычка"
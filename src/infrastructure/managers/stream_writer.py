@@ -0,0 +1,102 @@
+import asyncio
+import csv
+import io
+import zlib
+from pathlib import Path
+from typing import Any, AsyncIterator, Type, get_args
+
+from pydantic import BaseModel
+
+MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+
+async def write_ndjson(
+    items: AsyncIterator[BaseModel], rows_per_chunk: int = 100
+) -> AsyncIterator[bytes]:
+    chunk: list[str] = []
+    async for item in items:
+        chunk.append(item.model_dump_json(by_alias=True))
+        if len(chunk) >= rows_per_chunk:
+            yield ("\n".join(chunk) + "\n").encode()
+            chunk = []
+    if chunk:
+        yield ("\n".join(chunk) + "\n").encode()
+
+
+async def write_csv(
+    items: AsyncIterator[BaseModel], schema: Type[BaseModel], rows_per_chunk: int = 100
+) -> AsyncIterator[bytes]:
+    """Вложенные модели разворачиваются в колонки вида author.email"""
+    columns = csv_columns(schema)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    rows = 0
+    async for item in items:
+        values = flatten(item.model_dump(mode="json", by_alias=True))
+        writer.writerow([values.get(column, "") for column in columns])
+        rows += 1
+        if rows % rows_per_chunk == 0:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue().encode()
+
+
+def csv_columns(schema: Type[BaseModel], prefix: str = "") -> list[str]:
+    columns = []
+    for name, field in schema.model_fields.items():
+        key = f"{prefix}{field.alias or name}"
+        nested = next(
+            (
+                arg
+                for arg in (field.annotation, *get_args(field.annotation))
+                if isinstance(arg, type) and issubclass(arg, BaseModel)
+            ),
+            None,
+        )
+        if nested is None:
+            columns.append(key)
+        else:
+            columns.extend(csv_columns(nested, prefix=f"{key}."))
+    return columns
+
+
+def flatten(data: dict[str, Any], prefix: str = "") -> dict[str, Any]:
+    values: dict[str, Any] = {}
+    for key, value in data.items():
+        if isinstance(value, dict):
+            values.update(flatten(value, prefix=f"{prefix}{key}."))
+        elif value is not None:
+            values[f"{prefix}{key}"] = value
+    return values
+
+
+async def gzip_chunks(
+    chunks: AsyncIterator[bytes], level: int = 6
+) -> AsyncIterator[bytes]:
+    """gzip на лету: сжатый кусок отдаётся, как только компрессор его выпустил"""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    async for chunk in chunks:
+        if data := compressor.compress(chunk):
+            yield data
+    yield compressor.flush()
+
+
+async def write_file(chunks: AsyncIterator[bytes], path: Path) -> int:
+    """
+    Поток в файл через временный .part: незаконченная выгрузка не выглядит
+    готовой. Запись на диск - в потоке, чтобы не держать event loop
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial = path.with_name(f"{path.name}.part")
+    size = 0
+    try:
+        with partial.open("wb") as file:
+            async for chunk in chunks:
+                size += await asyncio.to_thread(file.write, chunk)
+    except BaseException:
+        partial.unlink(missing_ok=True)
+        raise
+    partial.replace(path)
+    return size
@@ -0,0 +1,55 @@
+import asyncio
+from time import monotonic
+
+from infrastructure.repositories.alchemy.db import Database
+from infrastructure.repositories.alchemy.users import SqlAlchemyUsersRepository
+
+
+class TokenVersionRegistry:
+    """
+    Минимальные допустимые версии токенов по пользователям.
+    Из БД читаются только пользователи, у которых токены отзывались,
+    и не чаще раза в refresh_interval секунд, а не на каждый запрос
+    """
+
+    def __init__(self, database: Database, refresh_interval: float) -> None:
+        self._database = database
+        self._refresh_interval = refresh_interval
+        self._versions: dict[int, int] = {}
+        # Удалённых пользователей нет в таблице, поэтому помним их отдельно
+        self._revoked: set[int] = set()
+        self._loaded_at: float | None = None
+        self._lock = asyncio.Lock()
+
+    async def is_revoked(self, user_id: int, version: int) -> bool:
+        if self._is_stale():
+            await self.refresh()
+        return user_id in self._revoked or version < self._versions.get(user_id, 0)
+
+    async def refresh(self) -> None:
+        async with self._lock:
+            if not self._is_stale():
+                return
+
+            async with self._database.session_factory() as session:
+                versions = await SqlAlchemyUsersRepository(session).get_token_versions()
+
+            for user_id, version in self._versions.items():
+                # Локальный bump мог закоммититься уже после начала чтения
+                if version > versions.get(user_id, 0):
+                    versions[user_id] = version
+            self._versions = versions
+            self._loaded_at = monotonic()
+
+    def bump(self, user_id: int, version: int) -> None:
+        """Применяет новую версию в этом процессе сразу, не дожидаясь refresh"""
+        self._versions[user_id] = max(version, self._versions.get(user_id, 0))
+
+    def revoke(self, user_id: int) -> None:
+        self._revoked.add(user_id)
+
+    def _is_stale(self) -> bool:
+        return (
+            self._loaded_at is None
+            or monotonic() - self._loaded_at >= self._refresh_interval
+        )
@@ -0,0 +1,30 @@
+from hashlib import sha256
+
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from infrastructure.repositories.alchemy.replicas import consistency_key
+
+
+class ConsistencyKeyMiddleware:
+    """
+    Pure ASGI middleware: ключ клиента для read-your-writes.
+    Пишут только авторизованные клиенты, поэтому ключ - дайджест заголовка
+    Authorization, без разбора токена
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        authorization = Headers(scope=scope).get("authorization")
+        key = sha256(authorization.encode()).hexdigest() if authorization else None
+        token = consistency_key.set(key)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            consistency_key.reset(token)
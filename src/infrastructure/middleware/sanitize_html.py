@@ -1,9 +1,9 @@
 import json
+from typing import Any
 
 import bleach
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 ALLOWED_TAGS = [
     "p",
@@ -42,34 +42,80 @@ def sanitize_html(value: str) -> str:
     )
 
 
-class SanitizeHTMLMiddleware(BaseHTTPMiddleware):
-    """Middleware для автоматической очистки входящих данных с HTML."""
-
-    async def dispatch(self, request: Request, call_next) -> Response:
-        if request.method in {"POST", "PUT", "PATCH"} and request.headers.get(
-            "content-type", ""
-        ).startswith("application/json"):
-            body = await request.body()
-            if body:
-                try:
-                    data = json.loads(body)
-                except json.JSONDecodeError:
-                    return await call_next(request)
-
-                def clean_html_in_dict(obj):
-                    if isinstance(obj, dict):
-                        for k, v in obj.items():
-                            if k == "content_html" and isinstance(v, str):
-                                obj[k] = sanitize_html(v)
-                            else:
-                                clean_html_in_dict(v)
-                    elif isinstance(obj, list):
-                        for item in obj:
-                            clean_html_in_dict(item)
-
-                clean_html_in_dict(data)
-
-                request._body = json.dumps(data).encode("utf-8")
-
-        response = await call_next(request)
-        return response
+def clean_html_in_dict(obj: Any) -> bool:
+    """Очищает поля content_html на месте; возвращает True, если что-то изменилось"""
+    changed = False
+    if isinstance(obj, dict):
+        for k, v in obj.items():
+            if k == "content_html" and isinstance(v, str):
+                cleaned = sanitize_html(v)
+                if cleaned != v:
+                    obj[k] = cleaned
+                    changed = True
+            else:
+                changed = clean_html_in_dict(v) or changed
+    elif isinstance(obj, list):
+        for item in obj:
+            changed = clean_html_in_dict(item) or changed
+    return changed
+
+
+class SanitizeHTMLMiddleware:
+    """Pure ASGI middleware для автоматической очистки входящих данных с HTML."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] not in {"POST", "PUT", "PATCH"}:
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        if not headers.get("content-type", "").startswith("application/json"):
+            await self.app(scope, receive, send)
+            return
+
+        body = await self._read_body(receive)
+        body, scope = self._sanitize(body, scope)
+
+        body_sent = False
+
+        async def replay_receive() -> Message:
+            nonlocal body_sent
+            if not body_sent:
+                body_sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+
+        await self.app(scope, replay_receive, send)
+
+    async def _read_body(self, receive: Receive) -> bytes:
+        chunks = []
+        more_body = True
+        while more_body:
+            message = await receive()
+            chunks.append(message.get("body", b""))
+            more_body = message.get("more_body", False)
+        return b"".join(chunks)
+
+    def _sanitize(self, body: bytes, scope: Scope) -> tuple[bytes, Scope]:
+        # Без поля content_html разбирать и перекодировать тело незачем. Ключ
+        # можно записать через \uXXXX, а json.loads принимает и UTF-16/32:
+        # такие тела (BOM или NUL в первых байтах) разбираются всегда
+        ascii_start = body[:1].isascii() and b"\x00" not in body[:4]
+        if ascii_start and b'"content_html"' not in body and b"\\u" not in body:
+            return body, scope
+
+        try:
+            data = json.loads(body)
+        except ValueError:  # JSONDecodeError и UnicodeDecodeError
+            return body, scope
+
+        if not clean_html_in_dict(data):
+            return body, scope
+
+        body = json.dumps(data).encode("utf-8")
+        headers = MutableHeaders(scope=dict(scope))
+        headers["content-length"] = str(len(body))
+        return body, {**scope, "headers": headers.raw}
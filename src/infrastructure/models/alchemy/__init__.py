@@ -1 +1 @@
-from .base import Post, User
+from .base import Post, RevokedToken, User
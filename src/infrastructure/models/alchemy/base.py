@@ -1,11 +1,26 @@
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import JSON, DateTime, Enum, ForeignKey, Integer, MetaData, String, Text
+from sqlalchemy import (
+    JSON,
+    Computed,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    Integer,
+    MetaData,
+    String,
+    Text,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 from infrastructure.enum import RoleEnum
 
+# Конфигурация полнотекстового поиска: russian стеммит и кириллицу, и латиницу
+SEARCH_CONFIG = "russian"
+
 
 class Base(DeclarativeBase):
     type_annotation_map = {dict[str, Any]: JSON}
@@ -27,9 +42,17 @@ class User(Base):
         nullable=False,
         default=RoleEnum.USER,
     )
+    # Токены с меньшей версией считаются отозванными
+    token_version: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
 
     posts: Mapped[list["Post"]] = relationship(
-        "Post", back_populates="author", cascade="all, delete-orphan", lazy="selectin"
+        "Post",
+        back_populates="author",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise",
     )
 
 
@@ -37,14 +60,32 @@ class Category(Base):
     __tablename__ = "post_categories"
 
     name: Mapped[str] = mapped_column(String(255), nullable=False, unique=True)
+    # Денормализованные счётчики: их ведут триггеры на posts, приложение
+    # только читает. Починка - SqlAlchemyCategoriesRepository.recount
+    post_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    last_post_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
 
     posts: Mapped[list["Post"]] = relationship(
-        "Post", back_populates="category", cascade="all, delete-orphan", lazy="selectin"
+        "Post",
+        back_populates="category",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise",
     )
 
 
 class Post(Base):
     __tablename__ = "posts"
+    __table_args__ = (
+        Index("ix_posts_created_at_id", "created_at", "id"),
+        # Пересчёт last_post_at категории после удаления поста
+        Index("ix_posts_category_id_created_at", "category_id", "created_at"),
+        Index("ix_posts_search_vector", "search_vector", postgresql_using="gin"),
+    )
+    # Иначе INSERT возвращал бы search_vector, который никто не читает
+    __mapper_args__ = {"eager_defaults": False}
 
     author_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"))
     category_id: Mapped[int] = mapped_column(
@@ -62,8 +103,33 @@ class Post(Base):
     updated_at: Mapped[datetime] = mapped_column(
         DateTime, default=datetime.now, onupdate=datetime.now, server_default="now()"
     )
+    # Заголовок весомее текста; колонку считает сама БД, в обычные запросы она
+    # не попадает
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(
+            f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(title, '')), 'A') || "
+            f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(body, '')), 'B')",
+            persisted=True,
+        ),
+        deferred=True,
+    )
 
-    author: Mapped["User"] = relationship("User", back_populates="posts", lazy="joined")
+    author: Mapped["User"] = relationship("User", back_populates="posts", lazy="raise")
     category: Mapped["Category"] = relationship(
-        "Category", back_populates="posts", lazy="joined"
+        "Category", back_populates="posts", lazy="raise"
+    )
+
+
+class RevokedToken(Base):
+    __tablename__ = "revoked_tokens"
+
+    # jti токена (или sha256 для токенов, выданных без jti)
+    jti: Mapped[str] = mapped_column(String(64), nullable=False, unique=True)
+    # Без внешнего ключа: отзыв переживает удаление пользователя
+    user_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    # UTC; после этого момента токен отвергается и без записи в таблице
+    expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
+    revoked_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=datetime.now
     )
@@ -1,12 +1,32 @@
-from typing import Any, Type, TypeVar
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Awaitable, Callable, Type, TypeVar
 
 from common.exceptions import APIException
 from pydantic import BaseModel
-from sqlalchemy import Result, and_, delete, exists, func, select, update
+from sqlalchemy import (
+    Select,
+    Text,
+    and_,
+    cast,
+    column,
+    delete,
+    exists,
+    func,
+    inspect,
+    literal,
+    select,
+    tuple_,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.interfaces import ORMOption
 
 from domain.entities.model import Model
+from domain.validators.dto import ResourceVersion
 from infrastructure.models.alchemy.base import Base
+from infrastructure.repositories.enum import CopyFormat, LoadProfile
 from infrastructure.repositories.interfaces.base import ModelRepository, Repository
 
 TModel = TypeVar("TModel", bound=Model)
@@ -18,17 +38,45 @@ class SqlAlchemyRepository(Repository):
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
 
+    @staticmethod
+    def _get_loaded(model: Base, attribute: str) -> Any:
+        """Значение атрибута, если он был загружен запросом, иначе None"""
+        if attribute in inspect(model).unloaded:
+            return None
+        return getattr(model, attribute)
+
 
 class SqlAlchemyModelRepository(SqlAlchemyRepository, ModelRepository[TModel]):
     ENTITY: Type[Model]
     LIST_DTO: Type[BaseModel]
+    CURSOR_FIELDS: tuple[str, ...] | None = None
+    # Колонка с временем изменения строки; без неё версия считается по содержимому
+    VERSION_FIELD: str | None = None
+    # Колонки, которые выгрузка не отдаёт никогда (хеши паролей, служебные)
+    EXPORT_EXCLUDE: tuple[str, ...] = ()
+    # Связи моделей по умолчанию lazy="raise": всё, что нужно запросу,
+    # подгружается явно через профиль загрузки
+    LOAD_PROFILES: dict[LoadProfile, tuple[ORMOption, ...]] = {}
+
+    def load_options(self, profile: LoadProfile) -> tuple[ORMOption, ...]:
+        return self.LOAD_PROFILES.get(profile, ())
 
     ###############
     ### Getters ###
     ###############
 
-    async def get_by_id(self, model_id: int, **filters: Any) -> TModel:
-        stmt = select(self.MODEL).filter_by(id=model_id).filter_by(**filters)
+    async def get_by_id(
+        self,
+        model_id: int,
+        profile: LoadProfile = LoadProfile.DETAIL,
+        **filters: Any,
+    ) -> TModel:
+        stmt = (
+            select(self.MODEL)
+            .options(*self.load_options(profile))
+            .filter_by(id=model_id)
+            .filter_by(**filters)
+        )
         result = await self._session.execute(stmt)
         model = result.unique().scalar_one_or_none()
         if not model:
@@ -55,10 +103,144 @@ class SqlAlchemyModelRepository(SqlAlchemyRepository, ModelRepository[TModel]):
         objects = result.all()
         return [self.LIST_DTO.model_validate(obj) for obj in objects]
 
-    async def get_list_models(self, **filters: Any) -> Result:
-        stmt = select(self.MODEL).filter_by(**filters)
-        result = await self._session.execute(stmt)
-        return result
+    def get_list_models(
+        self, profile: LoadProfile = LoadProfile.LIST, **filters: Any
+    ) -> Select:
+        return (
+            select(self.MODEL)
+            .options(*self.load_options(profile))
+            .filter_by(**filters)
+            .order_by(self.MODEL.id)
+        )
+
+    async def get_page(
+        self, stmt: Select, limit: int, offset: int
+    ) -> tuple[list[Base], int]:
+        """Возвращает одну страницу запроса и общее число строк"""
+        count_stmt = select(func.count()).select_from(stmt.order_by(None).subquery())
+        total = await self._session.scalar(count_stmt)
+
+        result = await self._session.execute(stmt.limit(limit).offset(offset))
+        return list(result.scalars().unique().all()), total or 0
+
+    async def stream(self, stmt: Select, batch_size: int = 1000) -> AsyncIterator[Base]:
+        """
+        Строки запроса через серверный курсор: в памяти не больше batch_size
+        объектов. Курсору нужна транзакция, autocommit-режим не подходит
+        """
+        result = await self._session.stream_scalars(
+            stmt.execution_options(yield_per=batch_size)
+        )
+        async for model in result:
+            yield model
+
+    async def get_slice(self, stmt: Select, limit: int) -> list[Base]:
+        result = await self._session.execute(stmt.limit(limit))
+        return list(result.scalars().unique().all())
+
+    def cursor_types(self) -> tuple[type, ...]:
+        """Python-типы колонок CURSOR_FIELDS, по ним проверяется курсор"""
+        table = self.MODEL.__table__
+        return tuple(
+            table.columns[field].type.python_type for field in self._cursor_fields()
+        )
+
+    def seek(self, stmt: Select, cursor: tuple) -> Select:
+        """Keyset-условие для запроса, отсортированного по CURSOR_FIELDS по убыванию"""
+        fields = self._cursor_fields()
+        if len(cursor) != len(fields):
+            raise APIException(code=400, message="Некорректный курсор пагинации")
+        columns = [getattr(self.MODEL, field) for field in fields]
+        return stmt.where(tuple_(*columns) < tuple_(*cursor))
+
+    def _cursor_fields(self) -> tuple[str, ...]:
+        if not self.CURSOR_FIELDS:
+            raise APIException(
+                code=400,
+                message=f"Курсорная пагинация недоступна для `{self.MODEL.__tablename__}`",
+            )
+        return self.CURSOR_FIELDS
+
+    async def get_version(self, stmt: Select) -> ResourceVersion:
+        """
+        Версия всей выборки одним агрегатом: count и max(VERSION_FIELD).
+        Для моделей без VERSION_FIELD - md5 от строк, это O(n), но такие таблицы малы
+        """
+        rows = stmt.order_by(None).subquery()
+        if self.VERSION_FIELD:
+            version_stmt = select(func.count(), func.max(rows.c[self.VERSION_FIELD]))
+            count, last_modified = (await self._session.execute(version_stmt)).one()
+            return ResourceVersion(count=count, last_modified=last_modified)
+
+        version_stmt = select(
+            func.count(),
+            func.md5(
+                func.string_agg(
+                    cast(rows.table_valued(), Text),
+                    aggregate_order_by(literal(","), rows.c.id),
+                )
+            ),
+        )
+        count, fingerprint = (await self._session.execute(version_stmt)).one()
+        return ResourceVersion(count=count, fingerprint=fingerprint)
+
+    async def copy_to(
+        self,
+        output: Callable[[bytes], Awaitable[None]],
+        columns: list[str] | None = None,
+        updated_from: datetime | None = None,
+        updated_to: datetime | None = None,
+        format: CopyFormat = CopyFormat.CSV,
+    ) -> None:
+        """
+        Выгрузка таблицы через COPY (SELECT ...) TO STDOUT: строки не разбираются
+        в объекты, output получает данные кусками по мере прихода с сервера.
+        Диапазон [updated_from, updated_to) - по VERSION_FIELD
+        """
+        table = self.MODEL.__table__
+        exportable = [
+            name for name in table.columns.keys() if name not in self.EXPORT_EXCLUDE
+        ]
+        # id объявлен в Base и стоит в таблице последним - в выгрузке он первый
+        names = columns or sorted(exportable, key=lambda name: name != "id")
+        # Исключённые колонки не выгружаются и по явному запросу
+        if unknown := [name for name in names if name not in exportable]:
+            raise APIException(
+                code=400,
+                message=f"Нет колонок в `{table.name}`: {', '.join(unknown)}",
+            )
+        stmt = select(*(table.columns[name] for name in names))
+
+        if updated_from is not None or updated_to is not None:
+            if not self.VERSION_FIELD:
+                raise APIException(
+                    code=400,
+                    message=f"Фильтр по времени изменения недоступен для `{table.name}`",
+                )
+            version = table.columns[self.VERSION_FIELD]
+            if updated_from is not None:
+                stmt = stmt.where(version >= self._naive_utc(updated_from))
+            if updated_to is not None:
+                stmt = stmt.where(version < self._naive_utc(updated_to))
+
+        connection = await self._session.connection()
+        compiled = stmt.compile(dialect=connection.dialect)
+        args = [compiled.params[name] for name in compiled.positiontup or ()]
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_from_query(
+            compiled.string,
+            *args,
+            output=output,
+            format=format.value,
+            header=True if format is CopyFormat.CSV else None,
+        )
+
+    @staticmethod
+    def _naive_utc(value: datetime) -> datetime:
+        # Колонки без часового пояса хранят UTC; asyncpg не сравнивает aware с naive
+        if value.tzinfo is None:
+            return value
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
 
     ################
     ### Creators ###
@@ -80,23 +262,77 @@ class SqlAlchemyModelRepository(SqlAlchemyRepository, ModelRepository[TModel]):
     ### Updators ###
     ################
 
-    async def update(self, data: TModel) -> None:
-        await self.bulk_update([data])
+    async def update(self, data: TModel) -> int:
+        return await self.bulk_update([data])
+
+    async def bulk_update(self, entities: list[TModel]) -> int:
+        """
+        Один UPDATE ... FROM (VALUES ...) на каждый набор изменённых колонок.
+        Отправляются только поля, изменённые после загрузки сущности;
+        у сущностей без отслеживания - все непустые колонки, как раньше.
+        Возвращает число обновлённых строк
+        """
+        table = self.MODEL.__table__
+        groups: dict[tuple[str, ...], list[dict[str, Any]]] = {}
+        for entity in entities:
+            changed = entity.changed_fields
+            model = self.convert_to_model(entity)
+            columns = tuple(
+                column.name
+                for column in table.columns
+                if column.name != "id"
+                and (
+                    column.name in changed
+                    if changed is not None
+                    else getattr(model, column.name) is not None
+                )
+            )
+            if columns:
+                row = {name: getattr(model, name) for name in ("id", *columns)}
+                groups.setdefault(columns, []).append(row)
 
-    async def bulk_update(self, entities: list[TModel]) -> None:
-        models = [self.convert_to_model(entity) for entity in entities]
+        updated = 0
+        for columns, rows in groups.items():
+            # Лимит asyncpg - 32767 параметров на запрос
+            chunk_size = 32767 // (len(columns) + 1)
+            for start in range(0, len(rows), chunk_size):
+                updated += await self._update_rows(
+                    columns, rows[start : start + chunk_size]
+                )
 
-        for model in models:
-            data = {
-                col.name: getattr(model, col.name)
-                for col in self.MODEL.__table__.columns
-                if getattr(model, col.name) is not None
-            }
+        for entity in entities:
+            if entity.changed_fields is not None:
+                entity.mark_clean()
+        return updated
 
-            # Выполняем UPDATE по первичному ключу
-            await self._session.execute(
-                update(self.MODEL).where(self.MODEL.id == model.id).values(**data)
+    async def _update_rows(
+        self, columns: tuple[str, ...], rows: list[dict[str, Any]]
+    ) -> int:
+        # ORM-вариант UPDATE синхронизирует объекты, уже загруженные в сессию
+        table = self.MODEL.__table__
+        if len(rows) == 1:
+            row = rows[0]
+            stmt = (
+                update(self.MODEL)
+                .where(self.MODEL.id == row["id"])
+                .values({name: row[name] for name in columns})
             )
+        else:
+            changes = (
+                values(
+                    *(column(name, table.c[name].type) for name in ("id", *columns)),
+                    name="changes",
+                )
+                .data([tuple(row.values()) for row in rows])
+            )
+            stmt = (
+                update(self.MODEL)
+                .where(self.MODEL.id == changes.c.id)
+                .values({name: changes.c[name] for name in columns})
+            )
+
+        result = await self._session.execute(stmt)
+        return result.rowcount
 
     ################
     ### Deleters ###
@@ -1,9 +1,11 @@
 from common.exceptions import APIException
-from sqlalchemy import select
+from sqlalchemy import func, select, text, tuple_, update
 
 from domain.entities.category import Category
 from infrastructure.models.alchemy.base import Category as CategoryModel
+from infrastructure.models.alchemy.base import Post as PostModel
 from infrastructure.repositories.alchemy.base import SqlAlchemyModelRepository
+from infrastructure.repositories.enum import LoadProfile
 from infrastructure.repositories.interfaces.category import CategoryRepository
 
 
@@ -13,8 +15,23 @@ class SqlAlchemyCategoriesRepository(
     MODEL = CategoryModel
     ENTITY = Category
 
-    async def get_by_name(self, name: str) -> Category:
-        stmt = select(CategoryModel).filter(CategoryModel.name == name)
+    async def get_ids_by_names(self, names: set[str]) -> dict[str, int]:
+        stmt = select(CategoryModel.name, CategoryModel.id).where(
+            CategoryModel.name.in_(names)
+        )
+        return dict((await self._session.execute(stmt)).tuples().all())
+
+    async def get_names(self) -> list[str]:
+        return list(await self._session.scalars(select(CategoryModel.name)))
+
+    async def get_by_name(
+        self, name: str, profile: LoadProfile = LoadProfile.DETAIL
+    ) -> Category:
+        stmt = (
+            select(CategoryModel)
+            .options(*self.load_options(profile))
+            .filter(CategoryModel.name == name)
+        )
 
         result = await self._session.execute(stmt)
         model = result.unique().scalar_one_or_none()
@@ -24,6 +41,46 @@ class SqlAlchemyCategoriesRepository(
             )
         return self.convert_to_entity(model)
 
+    async def recount(self) -> int:
+        """
+        Пересчитывает post_count и last_post_at всех категорий по posts одним
+        агрегатом. Нужен после ручных правок в обход триггеров и как проверка:
+        возвращает число категорий, у которых счётчики разошлись
+        """
+        # Пока идёт пересчёт, триггеры не должны менять те же строки
+        await self._session.execute(text("LOCK TABLE posts IN SHARE MODE"))
+
+        counts = (
+            select(
+                PostModel.category_id,
+                func.count().label("post_count"),
+                func.max(PostModel.created_at).label("last_post_at"),
+            )
+            .group_by(PostModel.category_id)
+            .subquery()
+        )
+        fresh = (
+            select(
+                CategoryModel.id,
+                func.coalesce(counts.c.post_count, 0).label("post_count"),
+                counts.c.last_post_at,
+            )
+            .outerjoin(counts, counts.c.category_id == CategoryModel.id)
+            .subquery()
+        )
+        stmt = (
+            update(CategoryModel)
+            .where(
+                CategoryModel.id == fresh.c.id,
+                tuple_(CategoryModel.post_count, CategoryModel.last_post_at)
+                .is_distinct_from(tuple_(fresh.c.post_count, fresh.c.last_post_at)),
+            )
+            .values(post_count=fresh.c.post_count, last_post_at=fresh.c.last_post_at)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self._session.execute(stmt)
+        return result.rowcount
+
     def convert_to_model(self, entity: Category) -> CategoryModel:
         return CategoryModel(
             id=entity.id,
@@ -31,7 +88,11 @@ class SqlAlchemyCategoriesRepository(
         )
 
     def convert_to_entity(self, model: CategoryModel) -> Category:
-        return Category(
+        entity = Category(
             id=model.id,
             name=model.name,
+            post_count=model.post_count,
+            last_post_at=model.last_post_at,
         )
+        entity.mark_clean()
+        return entity
@@ -6,19 +6,35 @@ from sqlalchemy.ext.asyncio import (
 )
 
 from config.settings import DBSettings
+from infrastructure.repositories.alchemy.dto import PoolStatusDTO
+from infrastructure.repositories.alchemy.replicas import ReplicaSet
 
 
 class Database:
     def __init__(self, settings: DBSettings) -> None:
+        pool_size, max_overflow = settings.pool_limits
         self._engine: AsyncEngine = create_async_engine(
             url=str(settings.dsn),
-            pool_size=settings.pool_size,
-            max_overflow=settings.max_overflow,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
             echo=settings.echo,
         )
         self._session_factory = async_sessionmaker(
             bind=self._engine, expire_on_commit=False
         )
+        self._replicas = (
+            ReplicaSet(
+                dsns=settings.replica_dsns,
+                pool_size=pool_size,
+                max_overflow=max_overflow,
+                echo=settings.echo,
+                health_interval=settings.replica_health_interval_seconds,
+                health_timeout=settings.replica_health_timeout_seconds,
+                read_your_writes=settings.read_your_writes_seconds,
+            )
+            if settings.replica_dsns
+            else None
+        )
 
     @property
     def engine(self) -> AsyncEngine:
@@ -27,3 +43,21 @@ class Database:
     @property
     def session_factory(self) -> async_sessionmaker[AsyncSession]:
         return self._session_factory
+
+    @property
+    def replicas(self) -> ReplicaSet | None:
+        return self._replicas
+
+    async def dispose(self) -> None:
+        await self._engine.dispose()
+        if self._replicas is not None:
+            await self._replicas.dispose()
+
+    def pool_status(self) -> PoolStatusDTO:
+        pool = self._engine.pool
+        return PoolStatusDTO(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=pool.overflow(),
+        )
@@ -0,0 +1,15 @@
+from pydantic import BaseModel
+
+
+class PoolStatusDTO(BaseModel):
+    size: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+
+
+class ReplicaStatusDTO(BaseModel):
+    host: str | None
+    port: int | None
+    healthy: bool
+    checked_out: int
@@ -1,18 +1,54 @@
+import html
 from typing import Any
 
 from common.exceptions import APIException
-from sqlalchemy import Result, desc, select
+from sqlalchemy import Select, column, desc, func, select, table, text, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import joinedload
 
 from domain.entities.post import Post
+from domain.validators.dto import ResourceVersion
+from infrastructure.models.alchemy.base import SEARCH_CONFIG
 from infrastructure.models.alchemy.base import Post as PostModel
 from infrastructure.repositories.alchemy.base import SqlAlchemyModelRepository
+from infrastructure.repositories.enum import LoadProfile
 from infrastructure.repositories.interfaces.post import PostRepository
 
+# Границы совпадений в ts_headline - символы из области частного использования:
+# фрагмент экранируется целиком, и только они становятся тегами <mark>
+MARK_START, MARK_STOP = "\ue000", "\ue001"
+HEADLINE_OPTIONS = (
+    f"StartSel={MARK_START}, StopSel={MARK_STOP}, "
+    "MaxFragments=2, MaxWords=20, MinWords=8"
+)
+
+
+def highlight(headline: str) -> str:
+    """HTML фрагмента: разметка самого поста экранирована, совпадения в <mark>"""
+    return (
+        html.escape(headline)
+        .replace(MARK_START, "<mark>")
+        .replace(MARK_STOP, "</mark>")
+    )
+
 
 class SqlAlchemyPostsRepository(SqlAlchemyModelRepository[Post], PostRepository):
     MODEL = PostModel
     ENTITY = Post
+    CURSOR_FIELDS = ("created_at", "id")
+    VERSION_FIELD = "updated_at"
+    EXPORT_EXCLUDE = ("search_vector",)
+    SEARCH_MAX_MATCHES = 10_000
+    LOAD_PROFILES = {
+        LoadProfile.LIST: (
+            joinedload(PostModel.author),
+            joinedload(PostModel.category),
+        ),
+        LoadProfile.DETAIL: (
+            joinedload(PostModel.author),
+            joinedload(PostModel.category),
+        ),
+    }
 
     async def create(self, data: Post) -> Post:
         model = self.convert_to_model(data)
@@ -24,13 +60,12 @@ class SqlAlchemyPostsRepository(SqlAlchemyModelRepository[Post], PostRepository)
         )
         return self.convert_to_entity(model)
 
-    async def get_by_id(self, model_id: int) -> Post:
+    async def get_by_id(
+        self, model_id: int, profile: LoadProfile = LoadProfile.DETAIL
+    ) -> Post:
         stmt = (
             select(PostModel)
-            .options(
-                joinedload(PostModel.author),
-                joinedload(PostModel.category),
-            )
+            .options(*self.load_options(profile))
             .filter(PostModel.id == model_id)
         )
 
@@ -40,25 +75,119 @@ class SqlAlchemyPostsRepository(SqlAlchemyModelRepository[Post], PostRepository)
             raise APIException(code=404, message=f"Пост c id={model_id} не найден")
         return self.convert_to_entity(model)
 
-    async def get_list_models(self, **filters: Any) -> Result:
-        stmt = (
+    def get_list_models(
+        self, profile: LoadProfile = LoadProfile.LIST, **filters: Any
+    ) -> Select:
+        return (
             select(PostModel)
             .filter_by(**filters)
-            .options(
-                joinedload(PostModel.author),
-                joinedload(PostModel.category),
+            .options(*self.load_options(profile))
+            .order_by(desc(PostModel.created_at), desc(PostModel.id))
+        )
+
+    async def copy_from_records(
+        self, records: list[tuple[str, str, int, int]]
+    ) -> set[str]:
+        """
+        Пачка постов (title, body, author_id, category_id) через COPY.
+        COPY прерывается целиком на первом конфликте, поэтому строки идут
+        во временную таблицу, а оттуда INSERT ... ON CONFLICT DO NOTHING.
+        Возвращает заголовки вставленных постов, остальные уже были заняты
+        """
+        columns = ("title", "body", "author_id", "category_id")
+        # Первый запрос открывает транзакцию, в которой пойдёт COPY
+        await self._session.execute(
+            text(
+                "CREATE TEMP TABLE posts_import (title varchar(255), body text, "
+                "author_id integer, category_id integer) ON COMMIT DROP"
             )
-            .order_by(desc(PostModel.created_at))
         )
-        return await self._session.execute(stmt)
+        connection = await self._session.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            "posts_import", records=records, columns=columns
+        )
 
-    async def get_by_title(self, title: str) -> Post:
+        staged = table("posts_import", *(column(name) for name in columns))
         stmt = (
-            select(PostModel)
-            .options(
-                joinedload(PostModel.author),
-                joinedload(PostModel.category),
+            pg_insert(PostModel)
+            .from_select(columns, select(*staged.c))
+            .on_conflict_do_nothing(index_elements=[PostModel.title])
+            .returning(PostModel.title)
+        )
+        inserted = set((await self._session.scalars(stmt)).all())
+        await self._session.execute(text("DROP TABLE posts_import"))
+        return inserted
+
+    async def get_titles(self) -> list[str]:
+        return list(await self._session.scalars(select(PostModel.title)))
+
+    async def search(
+        self, query: str, limit: int, after: tuple[float, int] | None = None
+    ) -> list[tuple[Post, float, str]]:
+        """
+        Посты по запросу в синтаксисе websearch ("фраза", or, -слово), по
+        убыванию ts_rank. Совпадения ищет GIN-индекс; ts_headline - дорогая
+        функция, поэтому считается только для строк страницы.
+        after - (rank, id) последней строки предыдущей страницы
+        """
+        tsquery = func.websearch_to_tsquery(SEARCH_CONFIG, query)
+        # Ранжируются только SEARCH_MAX_MATCHES самых новых совпадений: для
+        # слова из каждого поста иначе пришлось бы ранжировать всю таблицу.
+        # Порядок по id делает набор кандидатов одинаковым от запроса к запросу,
+        # иначе курсор листал бы разные выборки
+        candidates = (
+            select(PostModel.id, PostModel.search_vector)
+            .where(PostModel.search_vector.bool_op("@@")(tsquery))
+            .order_by(PostModel.id.desc())
+            .limit(self.SEARCH_MAX_MATCHES)
+            .subquery()
+        )
+        rank = func.ts_rank(candidates.c.search_vector, tsquery)
+        matches = (
+            select(candidates.c.id, rank.label("rank"))
+            .order_by(rank.desc(), candidates.c.id.desc())
+            .limit(limit)
+        )
+        if after is not None:
+            matches = matches.where(tuple_(rank, candidates.c.id) < tuple_(*after))
+        page = matches.subquery()
+
+        stmt = (
+            select(
+                PostModel,
+                page.c.rank,
+                func.ts_headline(
+                    SEARCH_CONFIG, PostModel.body, tsquery, HEADLINE_OPTIONS
+                ),
             )
+            .join(page, page.c.id == PostModel.id)
+            .options(*self.load_options(LoadProfile.LIST))
+            .order_by(page.c.rank.desc(), PostModel.id.desc())
+        )
+        result = await self._session.execute(stmt)
+        return [
+            (self.convert_to_entity(model), rank, highlight(headline))
+            for model, rank, headline in result.unique().tuples()
+        ]
+
+    async def get_version_by_title(self, title: str) -> ResourceVersion | None:
+        stmt = select(PostModel.id, PostModel.updated_at).where(
+            PostModel.title == title
+        )
+        row = (await self._session.execute(stmt)).one_or_none()
+        if not row:
+            return None
+        return ResourceVersion(
+            count=1, last_modified=row.updated_at, fingerprint=str(row.id)
+        )
+
+    async def get_by_title(
+        self, title: str, profile: LoadProfile = LoadProfile.DETAIL
+    ) -> Post:
+        stmt = (
+            select(PostModel)
+            .options(*self.load_options(profile))
             .filter(PostModel.title == title)
         )
 
@@ -80,7 +209,7 @@ class SqlAlchemyPostsRepository(SqlAlchemyModelRepository[Post], PostRepository)
         )
 
     def convert_to_entity(self, model: PostModel) -> Post:
-        return Post(
+        entity = Post(
             id=model.id,
             author_id=model.author_id,
             category_id=model.category_id,
@@ -88,6 +217,8 @@ class SqlAlchemyPostsRepository(SqlAlchemyModelRepository[Post], PostRepository)
             body=model.body,
             created_at=model.created_at,
             updated_at=model.updated_at,
-            author=model.author if model.author else None,
-            category=model.category if model.category else None,
+            author=self._get_loaded(model, "author"),
+            category=self._get_loaded(model, "category"),
         )
+        entity.mark_clean()
+        return entity
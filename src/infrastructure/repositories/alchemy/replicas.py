@@ -0,0 +1,131 @@
+import asyncio
+from contextvars import ContextVar
+from time import monotonic
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from infrastructure.managers.cache import TTLCache
+from infrastructure.repositories.alchemy.dto import ReplicaStatusDTO
+
+# Ключ клиента для read-your-writes, выставляется ConsistencyKeyMiddleware
+consistency_key: ContextVar[str | None] = ContextVar("consistency_key", default=None)
+
+
+class Replica:
+    __slots__ = ("dsn", "engine", "session_factory", "healthy")
+
+    def __init__(self, dsn: str, engine: AsyncEngine) -> None:
+        self.dsn = dsn
+        self.engine = engine
+        self.session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+        self.healthy = True
+
+
+class ReplicaSet:
+    """
+    Реплики для читающих use case'ов: выдаются по кругу среди живых.
+    Живость проверяется SELECT 1 не чаще раза в health_interval.
+    Клиент, недавно писавший в primary, read_your_writes секунд читает из primary,
+    чтобы не увидеть реплику до применения своей записи
+    """
+
+    def __init__(
+        self,
+        dsns: list[str],
+        pool_size: int,
+        max_overflow: int,
+        echo: bool,
+        health_interval: float,
+        health_timeout: float,
+        read_your_writes: float,
+        max_clients: int = 10_000,
+    ) -> None:
+        self._replicas = [
+            Replica(
+                dsn,
+                create_async_engine(
+                    url=dsn,
+                    pool_size=pool_size,
+                    max_overflow=max_overflow,
+                    echo=echo,
+                ),
+            )
+            for dsn in dsns
+        ]
+        self._health_interval = health_interval
+        self._health_timeout = health_timeout
+        self._recent_writes: TTLCache[str, bool] = TTLCache(
+            max_clients, read_your_writes
+        )
+        self._next = 0
+        self._checked_at: float | None = None
+        self._lock = asyncio.Lock()
+
+    async def session_factory(self) -> async_sessionmaker[AsyncSession] | None:
+        """Фабрика сессий следующей живой реплики; None - читать из primary"""
+        key = consistency_key.get()
+        if key is not None and self._recent_writes.get(key):
+            return None
+
+        if self._is_stale():
+            await self.check_health()
+
+        healthy = [replica for replica in self._replicas if replica.healthy]
+        if not healthy:
+            return None
+
+        self._next = (self._next + 1) % len(healthy)
+        return healthy[self._next].session_factory
+
+    def record_write(self) -> None:
+        key = consistency_key.get()
+        if key is not None:
+            self._recent_writes.set(key, True)
+
+    async def check_health(self) -> None:
+        async with self._lock:
+            if not self._is_stale():
+                return
+
+            results = await asyncio.gather(
+                *(self._ping(replica) for replica in self._replicas)
+            )
+            for replica, healthy in zip(self._replicas, results):
+                replica.healthy = healthy
+            self._checked_at = monotonic()
+
+    async def dispose(self) -> None:
+        for replica in self._replicas:
+            await replica.engine.dispose()
+
+    def status(self) -> list[ReplicaStatusDTO]:
+        return [
+            ReplicaStatusDTO(
+                host=replica.engine.url.host,
+                port=replica.engine.url.port,
+                healthy=replica.healthy,
+                checked_out=replica.engine.pool.checkedout(),
+            )
+            for replica in self._replicas
+        ]
+
+    async def _ping(self, replica: Replica) -> bool:
+        try:
+            async with asyncio.timeout(self._health_timeout):
+                async with replica.engine.connect() as connection:
+                    await connection.execute(text("SELECT 1"))
+        except Exception:  # недоступна, таймаут, отказ в подключении
+            return False
+        return True
+
+    def _is_stale(self) -> bool:
+        return (
+            self._checked_at is None
+            or monotonic() - self._checked_at >= self._health_interval
+        )
@@ -0,0 +1,49 @@
+from datetime import UTC, datetime
+
+from sqlalchemy import exists, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from infrastructure.models.alchemy.base import RevokedToken as RevokedTokenModel
+from infrastructure.repositories.interfaces.revoked_token import (
+    RevokedTokenRepository,
+)
+
+
+class SqlAlchemyRevokedTokensRepository(RevokedTokenRepository):
+    MODEL = RevokedTokenModel
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def add(self, jti: str, user_id: int | None, expires_at: datetime) -> bool:
+        """Отзывает токен. False - токен уже был отозван (в том числе параллельно)"""
+        stmt = (
+            insert(self.MODEL)
+            .values(
+                jti=jti,
+                user_id=user_id,
+                expires_at=expires_at,
+                revoked_at=datetime.now(),
+            )
+            .on_conflict_do_nothing(index_elements=[self.MODEL.jti])
+            .returning(self.MODEL.id)
+        )
+        result = await self._session.execute(stmt)
+        return result.scalar_one_or_none() is not None
+
+    async def exists(self, jti: str) -> bool:
+        stmt = select(exists().where(self.MODEL.jti == jti))
+        result = await self._session.execute(stmt)
+        return bool(result.scalar())
+
+    async def get_since(self, last_id: int) -> list[tuple[int, str]]:
+        """Ещё не истёкшие отзывы с id больше last_id, по возрастанию id"""
+        now = datetime.now(UTC).replace(tzinfo=None)
+        stmt = (
+            select(self.MODEL.id, self.MODEL.jti)
+            .where(self.MODEL.id > last_id, self.MODEL.expires_at > now)
+            .order_by(self.MODEL.id)
+        )
+        result = await self._session.execute(stmt)
+        return list(result.tuples().all())
@@ -1,14 +1,62 @@
-from sqlalchemy import delete, exists, select
+from sqlalchemy import delete, exists, select, update
+from sqlalchemy.orm import load_only
 
 from domain.entities.user import User
 from infrastructure.models.alchemy.base import User as UserModel
 from infrastructure.repositories.alchemy.base import SqlAlchemyModelRepository
+from infrastructure.repositories.enum import LoadProfile
 from infrastructure.repositories.interfaces import UserRepository
 
+IDENTITY_COLUMNS = (
+    UserModel.id,
+    UserModel.email,
+    UserModel.role,
+    UserModel.first_name,
+    UserModel.last_name,
+    UserModel.registration_date,
+    UserModel.token_version,
+)
+
 
 class SqlAlchemyUsersRepository(SqlAlchemyModelRepository[User], UserRepository):
     MODEL = UserModel
     ENTITY = User
+    # Хеши паролей попадают в выгрузку, только если их запросили явно
+    EXPORT_EXCLUDE = ("password",)
+    LOAD_PROFILES = {
+        LoadProfile.IDENTITY: (load_only(*IDENTITY_COLUMNS),),
+    }
+
+    async def get_ids_by_emails(self, emails: set[str]) -> dict[str, int]:
+        stmt = select(UserModel.email, UserModel.id).where(UserModel.email.in_(emails))
+        return dict((await self._session.execute(stmt)).tuples().all())
+
+    async def get_identity(self, user_id: int) -> User | None:
+        """Данные пользователя для аутентификации: без пароля и связей"""
+        stmt = select(*IDENTITY_COLUMNS).where(self.MODEL.id == user_id)
+        result = await self._session.execute(stmt)
+        row = result.one_or_none()
+        if not row:
+            return None
+        user = User(**row._mapping)
+        user.mark_clean()
+        return user
+
+    async def get_token_versions(self) -> dict[int, int]:
+        """Версии токенов пользователей, у которых токены отзывались"""
+        stmt = select(self.MODEL.id, self.MODEL.token_version).where(
+            self.MODEL.token_version > 0
+        )
+        result = await self._session.execute(stmt)
+        return dict(result.tuples().all())
+
+    async def update_password(self, user_id: int, password_hash: str) -> None:
+        stmt = (
+            update(self.MODEL)
+            .where(self.MODEL.id == user_id)
+            .values(password=password_hash)
+        )
+        await self._session.execute(stmt)
 
     async def get_by_email(self, email: str) -> User | None:
         stmt = select(self.MODEL).where(self.MODEL.email == email)
@@ -43,15 +91,19 @@ class SqlAlchemyUsersRepository(SqlAlchemyModelRepository[User], UserRepository)
             last_name=entity.last_name,
             password=entity.password,
             registration_date=entity.registration_date,
+            token_version=entity.token_version,
         )
 
     def convert_to_entity(self, model: UserModel) -> User:
-        return User(
+        entity = User(
             id=model.id,
             role=model.role,
             email=model.email,
             first_name=model.first_name,
             last_name=model.last_name,
-            password=model.password,
+            password=self._get_loaded(model, "password"),
             registration_date=model.registration_date,
+            token_version=model.token_version,
         )
+        entity.mark_clean()
+        return entity
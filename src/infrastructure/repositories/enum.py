@@ -0,0 +1,12 @@
+from enum import Enum
+
+
+class LoadProfile(Enum):
+    LIST = "list"
+    DETAIL = "detail"
+    IDENTITY = "identity"
+
+
+class CopyFormat(Enum):
+    CSV = "csv"
+    BINARY = "binary"
@@ -1,9 +1,12 @@
 from abc import ABC, abstractmethod
-from typing import Any, Generic, Type, TypeVar
+from datetime import datetime
+from typing import Any, AsyncIterator, Awaitable, Callable, Generic, Type, TypeVar
 
-from sqlalchemy import Result
+from sqlalchemy import Select
 
 from domain.entities.model import Model
+from domain.validators.dto import ResourceVersion
+from infrastructure.repositories.enum import CopyFormat, LoadProfile
 
 TModel = TypeVar("TModel", bound=Model)
 
@@ -20,6 +23,7 @@ class Repository(ABC):
 
 class ModelRepository(Repository, Generic[TModel]):
     ENTITY: Type[Model]
+    CURSOR_FIELDS: tuple[str, ...] | None
 
     @abstractmethod
     def convert_to_model(self, entity: TModel) -> Any:
@@ -38,7 +42,9 @@ class ModelRepository(Repository, Generic[TModel]):
         pass
 
     @abstractmethod
-    async def get_by_id(self, model_id: int) -> TModel:
+    async def get_by_id(
+        self, model_id: int, profile: LoadProfile = LoadProfile.DETAIL
+    ) -> TModel:
         pass
 
     @abstractmethod
@@ -51,15 +57,52 @@ class ModelRepository(Repository, Generic[TModel]):
         pass
 
     @abstractmethod
-    async def get_list_models(self, **filters) -> Result:
+    def get_list_models(
+        self, profile: LoadProfile = LoadProfile.LIST, **filters
+    ) -> Select:
         pass
 
     @abstractmethod
-    async def update(self, data: TModel) -> None:
+    async def get_page(self, stmt: Select, limit: int, offset: int) -> tuple[list, int]:
         pass
 
     @abstractmethod
-    async def bulk_update(self, entities: list[TModel]) -> None:
+    async def get_slice(self, stmt: Select, limit: int) -> list:
+        pass
+
+    @abstractmethod
+    def cursor_types(self) -> tuple[type, ...]:
+        pass
+
+    @abstractmethod
+    def seek(self, stmt: Select, cursor: tuple) -> Select:
+        pass
+
+    @abstractmethod
+    def stream(self, stmt: Select, batch_size: int = 1000) -> AsyncIterator[Any]:
+        pass
+
+    @abstractmethod
+    async def get_version(self, stmt: Select) -> ResourceVersion:
+        pass
+
+    @abstractmethod
+    async def copy_to(
+        self,
+        output: Callable[[bytes], Awaitable[None]],
+        columns: list[str] | None = None,
+        updated_from: datetime | None = None,
+        updated_to: datetime | None = None,
+        format: CopyFormat = CopyFormat.CSV,
+    ) -> None:
+        pass
+
+    @abstractmethod
+    async def update(self, data: TModel) -> int:
+        pass
+
+    @abstractmethod
+    async def bulk_update(self, entities: list[TModel]) -> int:
         pass
 
     @abstractmethod
@@ -2,6 +2,7 @@ from abc import abstractmethod
 from typing import TypeVar
 
 from domain.entities.model import Model
+from infrastructure.repositories.enum import LoadProfile
 from infrastructure.repositories.interfaces.base import ModelRepository
 
 TModel = TypeVar("TModel", bound=Model)
@@ -9,5 +10,19 @@ TModel = TypeVar("TModel", bound=Model)
 
 class CategoryRepository(ModelRepository):
     @abstractmethod
-    async def get_by_name(self, name: str) -> TModel:
+    async def get_by_name(
+        self, name: str, profile: LoadProfile = LoadProfile.DETAIL
+    ) -> TModel:
+        pass
+
+    @abstractmethod
+    async def get_ids_by_names(self, names: set[str]) -> dict[str, int]:
+        pass
+
+    @abstractmethod
+    async def get_names(self) -> list[str]:
+        pass
+
+    @abstractmethod
+    async def recount(self) -> int:
         pass
@@ -1,10 +1,12 @@
 from abc import abstractmethod
 from typing import Any, TypeVar
 
-from sqlalchemy import Result
+from sqlalchemy import Select
 
 from domain.entities.model import Model
 from domain.entities.post import Post
+from domain.validators.dto import ResourceVersion
+from infrastructure.repositories.enum import LoadProfile
 from infrastructure.repositories.interfaces.base import ModelRepository
 
 TModel = TypeVar("TModel", bound=Model)
@@ -12,9 +14,33 @@ TModel = TypeVar("TModel", bound=Model)
 
 class PostRepository(ModelRepository):
     @abstractmethod
-    async def get_list_models(self, **filters: Any) -> Result:
+    def get_list_models(
+        self, profile: LoadProfile = LoadProfile.LIST, **filters: Any
+    ) -> Select:
         pass
 
     @abstractmethod
-    async def get_by_title(self, title: str) -> Post:
+    async def get_by_title(
+        self, title: str, profile: LoadProfile = LoadProfile.DETAIL
+    ) -> Post:
+        pass
+
+    @abstractmethod
+    async def copy_from_records(
+        self, records: list[tuple[str, str, int, int]]
+    ) -> set[str]:
+        pass
+
+    @abstractmethod
+    async def get_titles(self) -> list[str]:
+        pass
+
+    @abstractmethod
+    async def search(
+        self, query: str, limit: int, after: tuple[float, int] | None = None
+    ) -> list[tuple[Post, float, str]]:
+        pass
+
+    @abstractmethod
+    async def get_version_by_title(self, title: str) -> ResourceVersion | None:
         pass
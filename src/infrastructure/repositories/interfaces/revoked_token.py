@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+
+class RevokedTokenRepository(ABC):
+    @abstractmethod
+    async def add(self, jti: str, user_id: int | None, expires_at: datetime) -> bool:
+        pass
+
+    @abstractmethod
+    async def exists(self, jti: str) -> bool:
+        pass
+
+    @abstractmethod
+    async def get_since(self, last_id: int) -> list[tuple[int, str]]:
+        pass
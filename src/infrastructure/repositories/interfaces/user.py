@@ -12,6 +12,22 @@ class UserRepository(ModelRepository):
     async def get_by_email(self, email: str) -> TModel | None:
         pass
 
+    @abstractmethod
+    async def get_ids_by_emails(self, emails: set[str]) -> dict[str, int]:
+        pass
+
+    @abstractmethod
+    async def get_identity(self, user_id: int) -> TModel | None:
+        pass
+
+    @abstractmethod
+    async def get_token_versions(self) -> dict[int, int]:
+        pass
+
+    @abstractmethod
+    async def update_password(self, user_id: int, password_hash: str) -> None:
+        pass
+
     @abstractmethod
     async def get_list(self) -> List[TModel]:
         pass
@@ -1,32 +1,103 @@
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from common.exceptions import APIException
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+from sqlalchemy.orm import ORMExecuteState, Session
 
 from domain.entities.enums import ModelType
 from infrastructure.repositories.alchemy.categories import (
     SqlAlchemyCategoriesRepository,
 )
 from infrastructure.repositories.alchemy.posts import SqlAlchemyPostsRepository
+from infrastructure.repositories.alchemy.replicas import ReplicaSet
+from infrastructure.repositories.alchemy.revoked_tokens import (
+    SqlAlchemyRevokedTokensRepository,
+)
 from infrastructure.repositories.alchemy.users import SqlAlchemyUsersRepository
 from infrastructure.repositories.interfaces.base import ModelRepository
 from infrastructure.uow.base import UnitOfWork
 
+# Режимы соединения read-only блока. BEGIN READ ONLY: запись отвергает сама БД,
+# намерение видят пулер и реплика, запросы блока идут в одном снимке.
+# При возврате соединения в пул транзакция откатывается
+READONLY_OPTIONS = {"postgresql_readonly": True}
+SNAPSHOT_OPTIONS = {
+    "isolation_level": "SERIALIZABLE",
+    "postgresql_readonly": True,
+    "postgresql_deferrable": True,
+}
+# Hot standby отвергает SERIALIZABLE; на реплике REPEATABLE READ READ ONLY
+# даёт тот же единый снимок, а конфликтов с записью там нет
+REPLICA_SNAPSHOT_OPTIONS = {
+    "isolation_level": "REPEATABLE READ",
+    "postgresql_readonly": True,
+}
+
+
+# ORM-записи отвергаются ещё до БД, с понятной ошибкой; сырой SQL остановит
+# сама read-only транзакция
+def _reject_write(session: Session) -> None:
+    if session.info.get("readonly"):
+        raise APIException(
+            code=500, message="Запись в unit of work, открытом только для чтения"
+        )
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _reject_write_statements(state: ORMExecuteState) -> None:
+    if state.is_insert or state.is_update or state.is_delete:
+        _reject_write(state.session)
+
+
+@event.listens_for(Session, "before_flush")
+def _reject_flush(session: Session, *args: object) -> None:
+    if session.new or session.dirty or session.deleted:
+        _reject_write(session)
+
 
 class SqlAlchemyUnitOfWork(UnitOfWork):
-    def __init__(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        replicas: ReplicaSet | None = None,
+    ) -> None:
         self._session_factory = session_factory
+        self._replicas = replicas
+        self._replica = False
+        self._readonly = False
+        self._deferrable = False
 
     async def __aenter__(self) -> UnitOfWork:
-        self._session = self._session_factory()
+        session_factory = None
+        if self._replica and self._replicas is not None:
+            session_factory = await self._replicas.session_factory()
+        self._session = (session_factory or self._session_factory)()
+        if self._readonly:
+            await self._begin_readonly(on_replica=session_factory is not None)
 
         self.users = SqlAlchemyUsersRepository(self._session)
         self.posts = SqlAlchemyPostsRepository(self._session)
         self.categories = SqlAlchemyCategoriesRepository(self._session)
+        self.revoked_tokens = SqlAlchemyRevokedTokensRepository(self._session)
 
         return await super().__aenter__()
 
+    async def _begin_readonly(self, on_replica: bool) -> None:
+        self._session.info["readonly"] = True
+        # Сессия внутри чужой транзакции (тесты): режим задаёт её владелец
+        if not isinstance(self._session.bind, AsyncEngine):
+            return
+        if not self._deferrable:
+            options = READONLY_OPTIONS
+        elif on_replica:
+            options = REPLICA_SNAPSHOT_OPTIONS
+        else:
+            options = SNAPSHOT_OPTIONS
+        await self._session.connection(execution_options=options)
+
     def get_model_repository(self, model_name: ModelType) -> ModelRepository:
         match model_name:
             case ModelType.USERS:
-                return self.routes
+                return self.users
             case ModelType.POSTS:
                 return self.posts
             case ModelType.CATEGORIES:
@@ -39,6 +110,8 @@ class SqlAlchemyUnitOfWork(UnitOfWork):
 
     async def commit(self) -> None:
         await self._session.commit()
+        if self._replicas is not None and not self._replica:
+            self._replicas.record_write()
 
     async def shutdown(self) -> None:
         await self._session.close()
@@ -10,6 +10,9 @@ from infrastructure.repositories.alchemy.posts import SqlAlchemyPostsRepository
 from infrastructure.repositories.alchemy.users import SqlAlchemyUsersRepository
 from infrastructure.repositories.interfaces.category import CategoryRepository
 from infrastructure.repositories.interfaces.post import PostRepository
+from infrastructure.repositories.interfaces.revoked_token import (
+    RevokedTokenRepository,
+)
 from infrastructure.repositories.interfaces.user import UserRepository
 
 
@@ -17,9 +20,27 @@ class UnitOfWork(ABC):
     users: UserRepository
     posts: PostRepository
     categories: CategoryRepository
+    revoked_tokens: RevokedTokenRepository
 
-    def __call__(self, *args: Any, autocommit: bool, **kwargs: Any) -> "UnitOfWork":
-        self._autocommit = autocommit
+    def __call__(
+        self,
+        *args: Any,
+        autocommit: bool = False,
+        replica: bool = False,
+        readonly: bool = False,
+        deferrable: bool = False,
+        **kwargs: Any,
+    ) -> "UnitOfWork":
+        """
+        replica=True - чтение, допускающее отставание реплики.
+        readonly=True - транзакция READ ONLY: без COMMIT, попытка записи падает сразу.
+        deferrable=True - единый снимок для долгих выгрузок: SERIALIZABLE DEFERRABLE
+        на primary, REPEATABLE READ на реплике
+        """
+        self._autocommit = autocommit and not readonly
+        self._replica = replica
+        self._readonly = readonly
+        self._deferrable = deferrable
         return self
 
     async def __aenter__(self) -> "UnitOfWork":
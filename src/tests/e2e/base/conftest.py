@@ -1,4 +1,12 @@
+from typing import Any, AsyncGenerator, Generator
+
 import pytest
+from sqlalchemy import delete, event, insert
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from infrastructure.enum import RoleEnum
+from infrastructure.models.alchemy.base import User as UserModel
 
 
 @pytest.fixture()
@@ -6,6 +14,11 @@ def health_url() -> str:
     return "public/health"
 
 
+@pytest.fixture()
+def health_auth_url() -> str:
+    return "public/health-auth"
+
+
 @pytest.fixture()
 def register_url() -> str:
     return "public/auth/register"
@@ -14,3 +27,42 @@ def register_url() -> str:
 @pytest.fixture()
 def login_url() -> str:
     return "public/auth/login"
+
+
+@pytest.fixture(scope="function")
+async def persisted_user_id(alchemy_engine: AsyncEngine) -> AsyncGenerator[int, Any]:
+    """
+    User committed outside of the test transaction,
+    so it is visible to the JWT middleware connection pool
+    """
+    async with alchemy_engine.begin() as connection:
+        user_id = await connection.scalar(
+            insert(UserModel)
+            .values(
+                email="middleware@test.com",
+                password="hash",
+                first_name="Test",
+                last_name="Middleware",
+                role=RoleEnum.ADMIN,
+            )
+            .returning(UserModel.id)
+        )
+
+    yield user_id
+
+    async with alchemy_engine.begin() as connection:
+        await connection.execute(delete(UserModel).where(UserModel.id == user_id))
+
+
+@pytest.fixture(scope="function")
+def executed_statements() -> Generator[list[str], Any, Any]:
+    statements: list[str] = []
+
+    def collect(conn, cursor, statement, parameters, context, executemany) -> None:
+        # Периодическая загрузка списка отозванных токенов не относится к запросу
+        if "FROM revoked_tokens" not in statement:
+            statements.append(statement)
+
+    event.listen(Engine, "before_cursor_execute", collect)
+    yield statements
+    event.remove(Engine, "before_cursor_execute", collect)
@@ -2,6 +2,10 @@ import pytest
 from httpx import AsyncClient
 from starlette import status
 
+from config.containers import Container
+from infrastructure.enum import RoleEnum
+from infrastructure.managers.dto import UserCreateDTO
+
 
 @pytest.mark.asyncio(loop_scope="session")
 @pytest.mark.parametrize(
@@ -90,3 +94,100 @@ async def test_login_wrong_password(
     login_response = await http_client.post(login_url, params=wrong_login)
 
     assert login_response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_login_is_rate_limited_by_email(
+    http_client: AsyncClient, login_url: str, container
+) -> None:
+    settings = container.settings()
+    params = {"email": "bruteforce@test.com", "password": "test"}
+
+    for _ in range(settings.rate_limit.email_capacity):
+        response = await http_client.post(login_url, params=params)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    response = await http_client.post(login_url, params=params)
+
+    assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    assert "Retry-After" in response.headers
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_refresh_token_is_rotated(
+    http_client: AsyncClient, register_url: str
+) -> None:
+    user = {
+        "first_name": "Тест",
+        "last_name": "Тесов",
+        "email": "rotation@test.com",
+        "password": "test",
+    }
+    tokens = (await http_client.post(register_url, params=user)).json()
+    headers = {"Authorization": f"Bearer {tokens['refresh_token']}"}
+
+    response = await http_client.post("public/auth/refresh", headers=headers)
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert response.json()["refresh_token"] != tokens["refresh_token"]
+
+    reused = await http_client.post("public/auth/refresh", headers=headers)
+    assert reused.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_logout_revokes_tokens(
+    # Первым, чтобы удалить пользователя уже после отката тестовой транзакции
+    persisted_user_id: int,
+    http_client: AsyncClient,
+    container: Container,
+) -> None:
+    user = UserCreateDTO(
+        user_id=persisted_user_id, email="middleware@test.com", role=RoleEnum.ADMIN
+    )
+    access_token = container.jwt_manager().create_access_token(user)
+    refresh_token = container.jwt_manager().create_refresh_token(user)
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    response = await http_client.get("public/profile/me", headers=headers)
+    assert response.status_code == status.HTTP_200_OK, response.text
+
+    response = await http_client.post(
+        "public/auth/logout", headers=headers, json={"refresh_token": refresh_token}
+    )
+    assert response.status_code == status.HTTP_204_NO_CONTENT, response.text
+
+    response = await http_client.get("public/profile/me", headers=headers)
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    response = await http_client.post(
+        "public/auth/refresh", headers={"Authorization": f"Bearer {refresh_token}"}
+    )
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_refresh_replay_revokes_access_tokens(
+    persisted_user_id: int,
+    http_client: AsyncClient,
+    container: Container,
+) -> None:
+    user = UserCreateDTO(
+        user_id=persisted_user_id, email="middleware@test.com", role=RoleEnum.ADMIN
+    )
+    access_token = container.jwt_manager().create_access_token(user)
+    refresh_headers = {
+        "Authorization": f"Bearer {container.jwt_manager().create_refresh_token(user)}"
+    }
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    response = await http_client.get("public/profile/me", headers=headers)
+    assert response.status_code == status.HTTP_200_OK, response.text
+
+    response = await http_client.post("public/auth/refresh", headers=refresh_headers)
+    assert response.status_code == status.HTTP_200_OK, response.text
+    replayed = await http_client.post("public/auth/refresh", headers=refresh_headers)
+    assert replayed.status_code == status.HTTP_401_UNAUTHORIZED
+
+    # Пользователь уже в кэше principal, но access-токен старой версии
+    response = await http_client.get("public/profile/me", headers=headers)
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
@@ -0,0 +1,48 @@
+import pytest
+from httpx import AsyncClient
+from starlette import status
+
+from application.use_cases.dto import CreateCategoryDTO, CreatePostDTO, PostPut
+from config.containers import Container
+from domain.entities.enums import ModelType
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_suggestions_follow_committed_changes(
+    persisted_user_id: int, http_client: AsyncClient, container: Container
+) -> None:
+    # Дальше индекс меняется только use cases: данные теста не закоммичены
+    await container.autocomplete().build()
+    category = await container.category_create_use_case().execute(
+        CreateCategoryDTO(name="Suggestible")
+    )
+    posts = [
+        await container.post_create_use_case().execute(
+            CreatePostDTO(
+                title=title,
+                body="body",
+                author_id=persisted_user_id,
+                category_id=category.id,
+            )
+        )
+        for title in ("Suggest first", "suggest second", "Other")
+    ]
+
+    created = await http_client.get("public/autocomplete/", params={"q": "SUGG"})
+
+    await container.post_update_use_case().execute(
+        posts[0].id,
+        PostPut(title="Renamed", body="body", category_id=category.id),
+    )
+    await container.object_delete_use_case().execute(posts[1].id, ModelType.POSTS)
+    changed = await http_client.get("public/autocomplete/", params={"q": "sugg"})
+    renamed = await http_client.get("public/autocomplete/", params={"q": "ren"})
+
+    assert created.status_code == status.HTTP_200_OK
+    assert created.json() == {
+        "posts": ["Suggest first", "suggest second"],
+        "categories": ["Suggestible"],
+    }
+    assert changed.json() == {"posts": [], "categories": ["Suggestible"]}
+    assert renamed.json()["posts"] == ["Renamed"]
+    assert container.autocomplete().stats().bytes > 0
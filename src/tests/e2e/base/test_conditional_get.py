@@ -0,0 +1,77 @@
+import pytest
+from httpx import AsyncClient
+from starlette import status
+
+from application.use_cases.dto import CreateCategoryDTO, CreatePostDTO
+from config.containers import Container
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_category_list_answers_not_modified_by_etag(
+    http_client: AsyncClient, container: Container
+) -> None:
+    first = await http_client.get("public/categories/")
+    etag = first.headers["ETag"]
+
+    cached = await http_client.get(
+        "public/categories/", headers={"If-None-Match": etag}
+    )
+    container.response_cache().clear()
+    from_db = await http_client.get(
+        "public/categories/", headers={"If-None-Match": etag}
+    )
+    other_page = await http_client.get(
+        "public/categories/", params={"page": 2}, headers={"If-None-Match": etag}
+    )
+
+    assert first.status_code == status.HTTP_200_OK, first.text
+    assert "Last-Modified" not in first.headers
+    assert cached.status_code == status.HTTP_304_NOT_MODIFIED
+    assert cached.headers["X-Cache"] == "HIT"
+    assert from_db.status_code == status.HTTP_304_NOT_MODIFIED
+    assert from_db.content == b""
+    assert other_page.status_code == status.HTTP_200_OK
+
+    await container.category_create_use_case().execute(
+        CreateCategoryDTO(name="etag-category")
+    )
+    changed = await http_client.get(
+        "public/categories/", headers={"If-None-Match": etag}
+    )
+
+    assert changed.status_code == status.HTTP_200_OK
+    assert changed.headers["ETag"] != etag
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_post_answers_not_modified_since_last_update(
+    persisted_user_id: int, http_client: AsyncClient, container: Container
+) -> None:
+    category = await container.category_create_use_case().execute(
+        CreateCategoryDTO(name="etag-posts")
+    )
+    await container.post_create_use_case().execute(
+        CreatePostDTO(
+            title="etag-post",
+            body="body",
+            author_id=persisted_user_id,
+            category_id=category.id,
+        )
+    )
+
+    first = await http_client.get("public/posts/etag-post")
+    last_modified = first.headers["Last-Modified"]
+    container.response_cache().clear()
+    response = await http_client.get(
+        "public/posts/etag-post", headers={"If-Modified-Since": last_modified}
+    )
+    listed = await http_client.get(
+        "public/categories/etag-posts/posts",
+        headers={"If-Modified-Since": last_modified},
+    )
+
+    assert first.status_code == status.HTTP_200_OK, first.text
+    assert first.json()["title"] == "etag-post"
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.headers["ETag"] == first.headers["ETag"]
+    assert listed.status_code == status.HTTP_304_NOT_MODIFIED
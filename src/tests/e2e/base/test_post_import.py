@@ -0,0 +1,47 @@
+import pytest
+from httpx import AsyncClient
+from starlette import status
+
+from application.use_cases.dto import CreateCategoryDTO
+from config.containers import Container
+from infrastructure.enum import RoleEnum
+from infrastructure.managers.dto import UserCreateDTO
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_admin_imports_posts_from_streamed_csv(
+    persisted_user_id: int, http_client: AsyncClient, container: Container
+) -> None:
+    await container.category_create_use_case().execute(
+        CreateCategoryDTO(name="csv-import")
+    )
+    token = container.jwt_manager().create_access_token(
+        UserCreateDTO(
+            user_id=persisted_user_id, email="middleware@test.com", role=RoleEnum.ADMIN
+        )
+    )
+    rows = [b"title,body,category,author_email\n"] + [
+        f'csv-{i},"line one\nline two",csv-import,middleware@test.com\n'.encode()
+        for i in range(50)
+    ]
+
+    async def body():
+        for row in rows:
+            yield row
+
+    response = await http_client.post(
+        "admin/posts/import",
+        content=body(),
+        headers={"Authorization": f"Bearer {token}", "Content-Type": "text/csv"},
+    )
+    unsupported = await http_client.post(
+        "admin/posts/import",
+        content=b"{}",
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    post = await http_client.get("public/posts/csv-49")
+
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert response.json() == {"imported": 50, "failed": 0, "errors": []}
+    assert unsupported.status_code == status.HTTP_415_UNSUPPORTED_MEDIA_TYPE
+    assert post.json()["body"] == "line one\nline two"
@@ -0,0 +1,145 @@
+import pytest
+from dependency_injector import providers
+from httpx import AsyncClient
+from starlette import status
+
+from config.containers import Container
+from config.settings import Settings
+from tests.utils import generate_jwt_token
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_authenticated_request_runs_single_identity_select(
+    http_client: AsyncClient,
+    health_auth_url: str,
+    settings: Settings,
+    container: Container,
+    persisted_user_id: int,
+    executed_statements: list[str],
+) -> None:
+    # Таблица версий токенов загружается раз в refresh_interval, не на запрос
+    await container.token_versions().refresh()
+    executed_statements.clear()
+    token = generate_jwt_token(
+        settings, user_id=persisted_user_id, email="middleware@test.com"
+    )
+
+    response = await http_client.get(
+        health_auth_url, headers={"Authorization": f"Bearer {token}"}
+    )
+
+    assert response.status_code == status.HTTP_200_OK, response.text
+    selects = [sql for sql in executed_statements if sql.lstrip().startswith("SELECT")]
+    assert len(selects) == 1
+    assert "FROM users" in selects[0]
+    assert "password" not in selects[0]
+    assert "posts" not in selects[0]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_repeated_requests_are_served_from_principal_cache(
+    http_client: AsyncClient,
+    health_auth_url: str,
+    settings: Settings,
+    container: Container,
+    persisted_user_id: int,
+    executed_statements: list[str],
+) -> None:
+    # Таблица версий токенов загружается раз в refresh_interval, не на запрос
+    await container.token_versions().refresh()
+    executed_statements.clear()
+    token = generate_jwt_token(
+        settings, user_id=persisted_user_id, email="middleware@test.com"
+    )
+    headers = {"Authorization": f"Bearer {token}"}
+
+    for _ in range(3):
+        response = await http_client.get(health_auth_url, headers=headers)
+        assert response.status_code == status.HTTP_200_OK, response.text
+
+    selects = [sql for sql in executed_statements if sql.lstrip().startswith("SELECT")]
+    assert len(selects) == 1
+
+    response = await http_client.get("admin/metrics/caches", headers=headers)
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert response.json()["principal"]["hits"] == 3
+    assert response.json()["principal"]["misses"] == 1
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_middleware_uses_container_connection_pool(
+    http_client: AsyncClient,
+    health_auth_url: str,
+    settings: Settings,
+    persisted_user_id: int,
+) -> None:
+    token = generate_jwt_token(
+        settings, user_id=persisted_user_id, email="middleware@test.com"
+    )
+    headers = {"Authorization": f"Bearer {token}"}
+
+    await http_client.get(health_auth_url, headers=headers)
+    response = await http_client.get("admin/metrics/db-pool", headers=headers)
+
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert response.json()["checked_in"] == 1
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_public_route_ignores_authorization_header(
+    http_client: AsyncClient, health_url: str, executed_statements: list[str]
+) -> None:
+    headers = {"Authorization": "Bearer not-a-jwt"}
+
+    response = await http_client.get(health_url, headers=headers)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert executed_statements == []
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_protected_route_rejects_invalid_token(
+    http_client: AsyncClient, health_auth_url: str
+) -> None:
+    headers = {"Authorization": "Bearer not-a-jwt"}
+
+    response = await http_client.get(health_auth_url, headers=headers)
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    assert response.json()["error"]["code"] == 10001
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_trusted_claims_are_served_without_user_lookup(
+    http_client: AsyncClient,
+    container: Container,
+    settings: Settings,
+    executed_statements: list[str],
+) -> None:
+    trusted = settings.model_copy(
+        update={"jwt": settings.jwt.model_copy(update={"trust_claims": True})}
+    )
+    container.settings.override(providers.Singleton(lambda: trusted))
+    try:
+        token = generate_jwt_token(
+            settings, user_id=424242, first_name="Клейм", last_name="Токенов", ver=0
+        )
+        headers = {"Authorization": f"Bearer {token}"}
+
+        for _ in range(3):
+            response = await http_client.get("public/profile/me", headers=headers)
+            assert response.status_code == status.HTTP_200_OK, response.text
+
+        assert response.json()["first_name"] == "Клейм"
+        # Только разовая загрузка таблицы версий токенов
+        assert len(executed_statements) == 1
+        assert "token_version" in executed_statements[0]
+
+        container.token_versions().bump(424242, 1)
+        response = await http_client.get("public/profile/me", headers=headers)
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    finally:
+        # Настройки и реестр версий не должны пережить тест
+        container.settings.reset_last_overriding()
+        container.token_versions.reset()
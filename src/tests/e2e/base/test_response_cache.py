@@ -0,0 +1,32 @@
+import pytest
+from httpx import AsyncClient
+from starlette import status
+
+from application.use_cases.dto import CreateCategoryDTO
+from config.containers import Container
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_public_list_is_cached_until_category_is_created(
+    http_client: AsyncClient, container: Container
+) -> None:
+    first = await http_client.get("public/categories/", params={"page_size": 50})
+    second = await http_client.get(
+        "public/categories/", params={"page_size": "50", "page": "1"}
+    )
+    same = await http_client.get("public/categories/", params={"page_size": 50})
+
+    assert first.status_code == status.HTTP_200_OK, first.text
+    assert first.headers["X-Cache"] == "MISS"
+    assert second.headers["X-Cache"] == "MISS"
+    assert same.headers["X-Cache"] == "HIT"
+    assert same.json() == first.json()
+
+    await container.category_create_use_case().execute(
+        CreateCategoryDTO(name="cached-category")
+    )
+    response = await http_client.get("public/categories/", params={"page_size": 50})
+
+    assert response.headers["X-Cache"] == "MISS"
+    assert "cached-category" in [item["name"] for item in response.json()["data"]]
+    assert container.response_cache().stats().hits == 1
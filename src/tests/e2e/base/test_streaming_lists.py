@@ -0,0 +1,53 @@
+import csv
+import io
+import json
+
+import pytest
+from httpx import AsyncClient
+from starlette import status
+
+from application.use_cases.dto import CreateCategoryDTO, CreatePostDTO
+from config.containers import Container
+from infrastructure.enum import RoleEnum
+from infrastructure.managers.dto import UserCreateDTO
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_admin_lists_are_streamed_as_ndjson_and_csv(
+    persisted_user_id: int, http_client: AsyncClient, container: Container
+) -> None:
+    category = await container.category_create_use_case().execute(
+        CreateCategoryDTO(name="streamed")
+    )
+    for index in range(150):
+        await container.post_create_use_case().execute(
+            CreatePostDTO(
+                title=f"streamed-{index}",
+                body="body",
+                author_id=persisted_user_id,
+                category_id=category.id,
+            )
+        )
+    token = container.jwt_manager().create_access_token(
+        UserCreateDTO(
+            user_id=persisted_user_id, email="middleware@test.com", role=RoleEnum.ADMIN
+        )
+    )
+    headers = {"Authorization": f"Bearer {token}"}
+
+    posts = await http_client.get(
+        "admin/posts/", params={"format": "ndjson"}, headers=headers
+    )
+    users = await http_client.get(
+        "admin/users", headers={**headers, "Accept": "text/csv"}
+    )
+
+    assert posts.status_code == status.HTTP_200_OK, posts.text
+    assert posts.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in posts.text.splitlines()]
+    assert len(rows) == 150
+    assert rows[0]["author"]["email"] == "middleware@test.com"
+
+    assert users.headers["content-type"].startswith("text/csv")
+    table = list(csv.DictReader(io.StringIO(users.text)))
+    assert "middleware@test.com" in [row["email"] for row in table]
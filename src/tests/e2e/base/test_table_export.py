@@ -0,0 +1,151 @@
+import csv
+import gzip
+import io
+from datetime import UTC, datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+from httpx import AsyncClient
+from starlette import status
+
+from application.use_cases.dto import CreateCategoryDTO, CreatePostDTO
+from config.containers import Container
+from infrastructure.enum import RoleEnum
+from infrastructure.managers.dto import UserCreateDTO
+
+
+def admin_headers(container: Container, user_id: int) -> dict[str, str]:
+    token = container.jwt_manager().create_access_token(
+        UserCreateDTO(user_id=user_id, email="middleware@test.com", role=RoleEnum.ADMIN)
+    )
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_tables_are_exported_through_copy(
+    persisted_user_id: int, http_client: AsyncClient, container: Container
+) -> None:
+    category = await container.category_create_use_case().execute(
+        CreateCategoryDTO(name="exported")
+    )
+    for index in range(3):
+        await container.post_create_use_case().execute(
+            CreatePostDTO(
+                title=f"exported-{index}",
+                body="body, with \"quotes\"\nand a newline",
+                author_id=persisted_user_id,
+                category_id=category.id,
+            )
+        )
+    headers = admin_headers(container, persisted_user_id)
+    since = (datetime.now() - timedelta(hours=1)).isoformat()
+
+    posts = await http_client.get(
+        "admin/exports/posts",
+        params={"columns": "id,title,body", "updated_from": since},
+        headers=headers,
+    )
+    users = await http_client.get(
+        "admin/exports/users", params={"gzip": "true"}, headers=headers
+    )
+
+    assert posts.status_code == status.HTTP_200_OK, posts.text
+    assert posts.headers["content-type"].startswith("text/csv")
+    rows = list(csv.DictReader(io.StringIO(posts.text)))
+    assert list(rows[0]) == ["id", "title", "body"]
+    assert {row["title"] for row in rows} >= {f"exported-{i}" for i in range(3)}
+    assert rows[0]["body"] == "body, with \"quotes\"\nand a newline"
+
+    assert users.headers["content-type"] == "application/gzip"
+    assert users.headers["content-disposition"].endswith('.csv.gz"')
+    table = list(csv.DictReader(io.StringIO(gzip.decompress(users.content).decode())))
+    assert list(table[0])[0] == "id"
+    assert "password" not in table[0]
+    assert "middleware@test.com" in [row["email"] for row in table]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_export_accepts_timezone_aware_range(
+    persisted_user_id: int, http_client: AsyncClient, container: Container
+) -> None:
+    category = await container.category_create_use_case().execute(
+        CreateCategoryDTO(name="aware")
+    )
+    await container.post_create_use_case().execute(
+        CreatePostDTO(
+            title="aware-range",
+            body="body",
+            author_id=persisted_user_id,
+            category_id=category.id,
+        )
+    )
+    now = datetime.now(UTC)
+
+    response = await http_client.get(
+        "admin/exports/posts",
+        params={
+            "columns": "id,title",
+            "updated_from": f"{now - timedelta(days=1):%Y-%m-%dT%H:%M:%S}Z",
+            "updated_to": (now + timedelta(days=1)).astimezone(
+                timezone(timedelta(hours=3))
+            ).isoformat(),
+        },
+        headers=admin_headers(container, persisted_user_id),
+    )
+
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert "aware-range" in response.text
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_export_rejects_unknown_columns_and_filters(
+    persisted_user_id: int, http_client: AsyncClient, container: Container
+) -> None:
+    headers = admin_headers(container, persisted_user_id)
+
+    columns = await http_client.get(
+        "admin/exports/posts", params={"columns": "id,secret"}, headers=headers
+    )
+    password = await http_client.get(
+        "admin/exports/users", params={"columns": "id,password"}, headers=headers
+    )
+    backup = await http_client.post(
+        "admin/exports/users/backup",
+        params={"columns": "password"},
+        headers=headers,
+    )
+    updated = await http_client.get(
+        "admin/exports/categories",
+        params={"updated_from": datetime.now().isoformat()},
+        headers=headers,
+    )
+
+    assert columns.status_code == status.HTTP_400_BAD_REQUEST
+    assert password.status_code == status.HTTP_400_BAD_REQUEST
+    assert "password" in password.text and "$argon2" not in password.text
+    assert backup.status_code == status.HTTP_400_BAD_REQUEST
+    assert updated.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_backup_is_written_to_export_directory(
+    persisted_user_id: int,
+    http_client: AsyncClient,
+    container: Container,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(container.settings().export, "directory", tmp_path)
+
+    response = await http_client.post(
+        "admin/exports/users/backup",
+        params={"format": "binary"},
+        headers=admin_headers(container, persisted_user_id),
+    )
+
+    assert response.status_code == status.HTTP_201_CREATED, response.text
+    backup = tmp_path / response.json()["path"]
+    assert backup.suffix == ".pgcopy"
+    assert backup.read_bytes().startswith(b"PGCOPY\n\xff\r\n\x00")
+    assert backup.stat().st_size == response.json()["size"]
+    assert list(tmp_path.iterdir()) == [backup]
@@ -0,0 +1,76 @@
+import pytest
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from domain.entities.user import User
+from infrastructure.enum import RoleEnum
+from infrastructure.uow import SqlAlchemyUnitOfWork
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_bulk_update_sends_only_changed_columns_in_one_statement(
+    alchemy_session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    uow = SqlAlchemyUnitOfWork(alchemy_session_factory)
+    async with uow(autocommit=True):
+        created = await uow.users.bulk_create(
+            [
+                User(
+                    email=f"bulk{i}@test.com",
+                    first_name="Bulk",
+                    last_name="Test",
+                    password="hash",
+                )
+                for i in range(3)
+            ]
+        )
+
+    statements: list[str] = []
+
+    def collect(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement)
+
+    async with uow(autocommit=True):
+        users = [await uow.users.get_by_id(user.id) for user in created]
+        for user in users:
+            user.change_role(RoleEnum.ADMIN)
+        users[2].first_name = "Renamed"
+
+        event.listen(Engine, "before_cursor_execute", collect)
+        try:
+            updated = await uow.users.bulk_update(users)
+        finally:
+            event.remove(Engine, "before_cursor_execute", collect)
+
+    async with uow(readonly=True):
+        stored = [await uow.users.get_by_id(user.id) for user in created]
+
+    assert updated == 3
+    assert len(statements) == 2
+    assert "VALUES" in statements[0] and "first_name" not in statements[0]
+    assert "registration_date" not in " ".join(statements)
+    assert [user.role for user in stored] == [RoleEnum.ADMIN] * 3
+    assert [user.token_version for user in stored] == [1, 1, 1]
+    assert stored[2].first_name == "Renamed"
+    assert users[0].changed_fields == set()
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_unchanged_entity_is_not_updated(
+    alchemy_session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    uow = SqlAlchemyUnitOfWork(alchemy_session_factory)
+    async with uow(autocommit=True):
+        user = await uow.users.create(
+            User(
+                email="unchanged@test.com",
+                first_name="Same",
+                last_name="Test",
+                password="hash",
+            )
+        )
+        loaded = await uow.users.get_by_id(user.id)
+        loaded.first_name = "Same"
+
+        assert await uow.users.update(loaded) == 0
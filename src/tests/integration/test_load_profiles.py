@@ -0,0 +1,72 @@
+import pytest
+from common.dto import PostRead
+from sqlalchemy import select
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from domain.entities.category import Category
+from domain.entities.post import Post
+from domain.entities.user import User
+from infrastructure.models.alchemy.base import Post as PostModel
+from infrastructure.repositories.enum import LoadProfile
+from infrastructure.uow import SqlAlchemyUnitOfWork
+
+
+async def create_post(uow: SqlAlchemyUnitOfWork) -> Post:
+    async with uow(autocommit=True):
+        author = await uow.users.create(
+            User(
+                email="profiles@test.com",
+                first_name="Load",
+                last_name="Profile",
+                password="hash",
+            )
+        )
+        category = await uow.categories.create(Category(name="profiles"))
+        return await uow.posts.create(
+            Post(
+                author_id=author.id,
+                category_id=category.id,
+                title="profiles",
+                body="body",
+            )
+        )
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_load_profiles_serialize_without_lazy_loads(
+    alchemy_session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    uow = SqlAlchemyUnitOfWork(alchemy_session_factory)
+    created = await create_post(uow)
+
+    async with uow():
+        detail = PostRead.model_validate(await uow.posts.get_by_id(created.id))
+        stmt = uow.posts.get_list_models(LoadProfile.LIST, id=created.id)
+        listed = [
+            PostRead.model_validate(model)
+            for model in await uow.posts.get_slice(stmt, limit=10)
+        ]
+
+    for post in (detail, *listed):
+        assert post.author and post.author.email == "profiles@test.com"
+        assert post.category and post.category.name == "profiles"
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_unloaded_relationship_raises(
+    alchemy_session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    uow = SqlAlchemyUnitOfWork(alchemy_session_factory)
+    created = await create_post(uow)
+
+    async with uow():
+        # Запрос без профиля загрузки: связи не подгружены
+        model = await uow._session.scalar(
+            select(PostModel).where(PostModel.id == created.id)
+        )
+        with pytest.raises(InvalidRequestError, match="lazy='raise'"):
+            model.author
+        entity = uow.posts.convert_to_entity(model)
+
+    assert entity.author is None and entity.category is None
@@ -0,0 +1,68 @@
+import pytest
+from common.exceptions import APIException
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from domain.entities.category import Category
+from infrastructure.repositories.alchemy.db import Database
+from infrastructure.uow import SqlAlchemyUnitOfWork
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_readonly_uow_rejects_writes_before_database(
+    alchemy_session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    uow = SqlAlchemyUnitOfWork(alchemy_session_factory)
+
+    with pytest.raises(APIException):
+        async with uow(readonly=True):
+            await uow.categories.create(Category(name="readonly"))
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_readonly_uow_runs_in_readonly_transaction(
+    alchemy_database: Database,
+) -> None:
+    uow = SqlAlchemyUnitOfWork(alchemy_database.session_factory)
+
+    async with uow(readonly=True):
+        # Один снимок на весь блок: COUNT и страница пагинатора согласованы
+        first = await uow._session.scalar(text("SELECT txid_current()"))
+        second = await uow._session.scalar(text("SELECT txid_current()"))
+        readonly = await uow._session.scalar(
+            text("SELECT current_setting('transaction_read_only')")
+        )
+
+    assert first == second
+    assert readonly == "on"
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_readonly_uow_rejects_raw_sql_writes(
+    alchemy_database: Database,
+) -> None:
+    uow = SqlAlchemyUnitOfWork(alchemy_database.session_factory)
+
+    with pytest.raises(DBAPIError, match="read-only transaction"):
+        async with uow(readonly=True):
+            await uow._session.execute(
+                text("INSERT INTO post_categories (name) VALUES ('raw readonly')")
+            )
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_deferrable_uow_reads_single_readonly_snapshot(
+    alchemy_database: Database,
+) -> None:
+    uow = SqlAlchemyUnitOfWork(alchemy_database.session_factory)
+
+    async with uow(readonly=True, deferrable=True):
+        readonly = await uow._session.scalar(
+            text("SELECT current_setting('transaction_read_only')")
+        )
+        isolation = await uow._session.scalar(
+            text("SELECT current_setting('transaction_isolation')")
+        )
+
+    assert (readonly, isolation) == ("on", "serializable")
@@ -0,0 +1,107 @@
+from typing import Any, AsyncGenerator
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from config.settings import Settings
+from infrastructure.repositories.alchemy.replicas import ReplicaSet, consistency_key
+from infrastructure.uow import SqlAlchemyUnitOfWork
+
+
+def replica_dsn(settings: Settings, host: str, port: int | None = None) -> str:
+    db = settings.db
+    return (
+        f"{db.dialect}://{db.user}:{db.password}"
+        f"@{host}:{port or db.port}/{db.name}"
+    )
+
+
+@pytest.fixture()
+async def replicas(settings: Settings) -> AsyncGenerator[ReplicaSet, Any]:
+    # Две «реплики» - один и тот же локальный сервер по разным адресам, третья недоступна
+    replicas = ReplicaSet(
+        dsns=[
+            replica_dsn(settings, "localhost"),
+            replica_dsn(settings, "127.0.0.1"),
+            replica_dsn(settings, "127.0.0.1", port=1),
+        ],
+        pool_size=1,
+        max_overflow=0,
+        echo=False,
+        health_interval=60,
+        health_timeout=1,
+        read_your_writes=60,
+    )
+    yield replicas
+    await replicas.dispose()
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_reads_are_spread_over_healthy_replicas(replicas: ReplicaSet) -> None:
+    factories = [await replicas.session_factory() for _ in range(4)]
+
+    assert factories[0] is factories[2]
+    assert factories[1] is factories[3]
+    assert factories[0] is not factories[1]
+    assert [status.healthy for status in replicas.status()] == [True, True, False]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_client_reads_own_writes_from_primary(replicas: ReplicaSet) -> None:
+    token = consistency_key.set("writer")
+    try:
+        replicas.record_write()
+        assert await replicas.session_factory() is None
+    finally:
+        consistency_key.reset(token)
+
+    token = consistency_key.set("reader")
+    try:
+        assert await replicas.session_factory() is not None
+    finally:
+        consistency_key.reset(token)
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_uow_opened_for_replica_reads_from_replica(
+    replicas: ReplicaSet,
+    alchemy_session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    uow = SqlAlchemyUnitOfWork(alchemy_session_factory, replicas=replicas)
+
+    async with uow(autocommit=False, replica=True):
+        replica_engine = uow._session.get_bind()
+        assert (await uow._session.execute(text("SELECT 1"))).scalar() == 1
+    async with uow(autocommit=False):
+        primary_bind = uow._session.get_bind()
+
+    hosts = {status.host for status in replicas.status() if status.healthy}
+    assert replica_engine.url.host in hosts
+    assert primary_bind is not replica_engine
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_deferrable_snapshot_on_replica_avoids_serializable(
+    replicas: ReplicaSet, settings: Settings
+) -> None:
+    # Без чужой транзакции: режим задаёт сам unit of work
+    primary = create_async_engine(replica_dsn(settings, "localhost"))
+    uow = SqlAlchemyUnitOfWork(
+        async_sessionmaker(bind=primary, expire_on_commit=False), replicas=replicas
+    )
+    query = text(
+        "SELECT current_setting('transaction_isolation'), "
+        "current_setting('transaction_read_only')"
+    )
+    try:
+        async with uow(readonly=True, deferrable=True, replica=True):
+            on_replica = (await uow._session.execute(query)).one()
+        async with uow(readonly=True, deferrable=True):
+            on_primary = (await uow._session.execute(query)).one()
+    finally:
+        await primary.dispose()
+
+    # Hot standby отвергает SERIALIZABLE: на реплике снимок REPEATABLE READ
+    assert tuple(on_replica) == ("repeatable read", "on")
+    assert tuple(on_primary) == ("serializable", "on")
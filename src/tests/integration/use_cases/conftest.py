@@ -5,6 +5,7 @@ from application.use_cases.common.delete import ModelObjectDeleteUseCase
 from application.use_cases.common.list import ModelObjectListUseCase
 from application.use_cases.common.retrieve import ModelObjectRetrieveUseCase
 from config.containers import Container
+from infrastructure.uow import UnitOfWork
 
 
 @pytest.fixture(scope="function")
@@ -33,3 +34,8 @@ def object_list_use_case(
     container: Container,
 ) -> ModelObjectListUseCase:
     return container.object_list_use_case()
+
+
+@pytest.fixture(scope="function")
+def uow(container: Container) -> UnitOfWork:
+    return container.db.uow()
@@ -0,0 +1,110 @@
+import pytest
+from sqlalchemy import text
+
+from application.use_cases.dto import CreateCategoryDTO, CreatePostDTO, PostPut
+from config.containers import Container
+from domain.entities.enums import ModelType
+from domain.entities.user import User
+from infrastructure.managers.stream_reader import read_ndjson
+from infrastructure.uow import UnitOfWork
+from tests.integration.use_cases.test_post_import import chunks
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_post_counters_follow_post_changes(
+    container: Container, uow: UnitOfWork
+) -> None:
+    async with uow(autocommit=True):
+        author = await uow.users.create(
+            User(
+                email="counters@test.com",
+                first_name="Counters",
+                last_name="Test",
+                password="hash",
+            )
+        )
+    first = await container.category_create_use_case().execute(
+        CreateCategoryDTO(name="counted")
+    )
+    second = await container.category_create_use_case().execute(
+        CreateCategoryDTO(name="counted-too")
+    )
+    posts = [
+        await container.post_create_use_case().execute(
+            CreatePostDTO(
+                title=f"counted-{index}",
+                body="body",
+                author_id=author.id,
+                category_id=first.id,
+            )
+        )
+        for index in range(3)
+    ]
+    body = (
+        b'{"title": "imported-1", "body": "1", "category": "counted-too", '
+        b'"author_email": "counters@test.com"}\n'
+        b'{"title": "imported-2", "body": "2", "category": "counted-too", '
+        b'"author_email": "counters@test.com"}'
+    )
+    await container.post_import_use_case().execute(read_ndjson(chunks(body)))
+    await container.post_update_use_case().execute(
+        posts[2].id, PostPut(title="moved", body="body", category_id=second.id)
+    )
+    await container.object_delete_use_case().execute(
+        obj_id=posts[1].id, model_type=ModelType.POSTS
+    )
+
+    async with uow(readonly=True):
+        counted = await uow.categories.get_by_id(first.id)
+        counted_too = await uow.categories.get_by_id(second.id)
+
+    assert (counted.post_count, counted.last_post_at) == (1, posts[0].created_at)
+    assert counted_too.post_count == 3
+    assert counted_too.last_post_at >= posts[2].created_at
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_recount_repairs_drifted_counters(
+    container: Container, uow: UnitOfWork
+) -> None:
+    async with uow(autocommit=True):
+        author = await uow.users.create(
+            User(
+                email="recount@test.com",
+                first_name="Recount",
+                last_name="Test",
+                password="hash",
+            )
+        )
+    category = await container.category_create_use_case().execute(
+        CreateCategoryDTO(name="drifted")
+    )
+    empty = await container.category_create_use_case().execute(
+        CreateCategoryDTO(name="empty")
+    )
+    post = await container.post_create_use_case().execute(
+        CreatePostDTO(
+            title="drifted", body="body", author_id=author.id, category_id=category.id
+        )
+    )
+    use_case = container.category_recount_use_case()
+    assert (await use_case.execute()).fixed == 0
+
+    # Правка в обход триггеров
+    async with uow(autocommit=True):
+        await uow._session.execute(
+            text(
+                "UPDATE post_categories SET post_count = 7, last_post_at = now() "
+                "WHERE id IN (:category, :empty)"
+            ),
+            {"category": category.id, "empty": empty.id},
+        )
+    result = await use_case.execute()
+
+    async with uow(readonly=True):
+        drifted = await uow.categories.get_by_id(category.id)
+        empty = await uow.categories.get_by_id(empty.id)
+
+    assert result.fixed == 2
+    assert (drifted.post_count, drifted.last_post_at) == (1, post.created_at)
+    assert (empty.post_count, empty.last_post_at) == (0, None)
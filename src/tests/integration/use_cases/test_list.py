@@ -0,0 +1,111 @@
+from datetime import datetime, timedelta
+
+import pytest
+from common.dto import CategoryRead, PostRead
+from common.exceptions import APIException
+
+from application.use_cases.common.create import ModelObjectCreateUseCase
+from application.use_cases.common.list import ModelObjectListUseCase
+from application.use_cases.dto import CreateCategoryDTO
+from domain.entities.category import Category
+from domain.entities.enums import ModelType
+from domain.entities.post import Post
+from infrastructure.managers.paginator import encode_cursor
+from infrastructure.uow import UnitOfWork
+from tests.factories.user import UserFactory
+from tests.integration.utils import make_request
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_list_paginates_in_sql(
+    object_create_use_case: ModelObjectCreateUseCase,
+    object_list_use_case: ModelObjectListUseCase,
+) -> None:
+    for name in ("first", "second", "third"):
+        await object_create_use_case.execute(
+            ModelType.CATEGORIES,
+            CreateCategoryDTO(name=name),
+            Category,
+            CategoryRead,
+        )
+
+    result = await object_list_use_case.execute(
+        request=make_request("/categories/"),
+        model_type=ModelType.CATEGORIES,
+        ObjectDTO=CategoryRead,
+        page=2,
+        page_size=2,
+    )
+
+    assert result.count == 3
+    assert result.total_pages == 2
+    assert [category.name for category in result.data] == ["third"]
+    assert result.next is None
+    assert result.previous is not None
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_list_posts_by_cursor(
+    uow: UnitOfWork, object_list_use_case: ModelObjectListUseCase
+) -> None:
+    created_at = datetime(2025, 1, 1)
+    async with uow(autocommit=True):
+        author = await uow.users.create(UserFactory(id=None))
+        category = await uow.categories.create(Category(name="cursor"))
+        for index in range(5):
+            await uow.posts.create(
+                Post(
+                    author_id=author.id,
+                    category_id=category.id,
+                    title=f"post {index}",
+                    body="body",
+                    created_at=created_at + timedelta(minutes=index % 3),
+                )
+            )
+
+    first_page = await object_list_use_case.execute(
+        request=make_request("/posts/"),
+        model_type=ModelType.POSTS,
+        ObjectDTO=PostRead,
+        page_size=2,
+    )
+    titles = [post.title for post in first_page.data]
+    cursor = first_page.next_cursor
+
+    while cursor:
+        next_page = await object_list_use_case.execute(
+            request=make_request("/posts/"),
+            model_type=ModelType.POSTS,
+            ObjectDTO=PostRead,
+            page_size=2,
+            cursor=cursor,
+        )
+        titles.extend(post.title for post in next_page.data)
+        cursor = next_page.next_cursor
+
+    assert titles == ["post 2", "post 4", "post 1", "post 3", "post 0"]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+@pytest.mark.parametrize(
+    "values",
+    [
+        (1, 2),
+        ("2025-01-01T00:00:00", "2025-01-01T00:00:00"),
+        (1,),
+        ("2025-01-01T00:00:00", 1, 2),
+        ("2025-01-01T00:00:00", True),
+    ],
+)
+async def test_list_rejects_crafted_cursor(
+    object_list_use_case: ModelObjectListUseCase, values: tuple
+) -> None:
+    with pytest.raises(APIException) as error:
+        await object_list_use_case.execute(
+            request=make_request("/posts/"),
+            model_type=ModelType.POSTS,
+            ObjectDTO=PostRead,
+            cursor=encode_cursor(values),
+        )
+
+    assert error.value.code == 400
@@ -0,0 +1,35 @@
+import pytest
+from passlib.hash import argon2
+
+from config.containers import Container
+from domain.entities.user import User
+from domain.validators.base import UserLoginDTO
+from infrastructure.uow import UnitOfWork
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_login_rehashes_outdated_password(
+    container: Container, uow: UnitOfWork
+) -> None:
+    outdated = argon2.using(rounds=1, memory_cost=1024, parallelism=1)
+    async with uow(autocommit=True):
+        user = await uow.users.create(
+            User(
+                email="rehash@test.com",
+                first_name="Тест",
+                last_name="Тесов",
+                password=outdated.hash("secret"),
+            )
+        )
+
+    await container.login_use_case().execute(
+        UserLoginDTO(email="rehash@test.com", password="secret")
+    )
+
+    async with uow(autocommit=False):
+        stored = await uow.users.get_by_email("rehash@test.com")
+
+    hasher = container.password_hasher()
+    assert stored.id == user.id
+    assert not hasher.needs_update(stored.password)
+    assert argon2.verify("secret", stored.password)
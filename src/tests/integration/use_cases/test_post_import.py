@@ -0,0 +1,63 @@
+from typing import AsyncIterator
+
+import pytest
+
+from application.use_cases.dto import CreateCategoryDTO, CreatePostDTO
+from config.containers import Container
+from domain.entities.user import User
+from infrastructure.managers.stream_reader import read_ndjson
+from infrastructure.uow import UnitOfWork
+
+
+async def chunks(body: bytes, size: int = 16) -> AsyncIterator[bytes]:
+    for start in range(0, len(body), size):
+        yield body[start : start + size]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_import_loads_valid_rows_and_reports_the_rest(
+    container: Container, uow: UnitOfWork
+) -> None:
+    async with uow(autocommit=True):
+        author = await uow.users.create(
+            User(
+                email="import@test.com",
+                first_name="Import",
+                last_name="Test",
+                password="hash",
+            )
+        )
+    category = await container.category_create_use_case().execute(
+        CreateCategoryDTO(name="imported")
+    )
+    await container.post_create_use_case().execute(
+        CreatePostDTO(
+            title="taken", body="body", author_id=author.id, category_id=category.id
+        )
+    )
+
+    body = b"\n".join(
+        [
+            b'{"title": "first", "body": "1", "category": "imported", '
+            b'"author_email": "import@test.com"}',
+            b'{"title": "second", "body": "2", "category": "imported", '
+            b'"author_email": "import@test.com"}',
+            b"{not json",
+            b'{"title": "third", "body": "3", "category": "missing", '
+            b'"author_email": "import@test.com"}',
+            b'{"title": "taken", "body": "4", "category": "imported", '
+            b'"author_email": "import@test.com"}',
+            b'{"title": "", "category": "imported", "author_email": "x"}',
+        ]
+    )
+    use_case = container.post_import_use_case(batch_size=2)
+    result = await use_case.execute(read_ndjson(chunks(body)))
+
+    async with uow(readonly=True):
+        second = await uow.posts.get_by_title("second")
+
+    assert result.imported == 2
+    assert result.failed == 4
+    assert [error.line for error in result.errors] == [3, 4, 5, 6]
+    assert "уже существует" in result.errors[2].message
+    assert second.author_id == author.id and second.body == "2"
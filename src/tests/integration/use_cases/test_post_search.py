@@ -0,0 +1,158 @@
+import pytest
+from common.exceptions import APIException
+
+from application.use_cases.dto import CreateCategoryDTO, CreatePostDTO
+from config.containers import Container
+from domain.entities.user import User
+from infrastructure.managers.paginator import encode_cursor
+from infrastructure.repositories.alchemy.posts import SqlAlchemyPostsRepository
+from infrastructure.uow import UnitOfWork
+from tests.integration.utils import make_request
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_search_ranks_stems_and_paginates(
+    container: Container, uow: UnitOfWork
+) -> None:
+    async with uow(autocommit=True):
+        author = await uow.users.create(
+            User(
+                email="search@test.com",
+                first_name="Search",
+                last_name="Test",
+                password="hash",
+            )
+        )
+    category = await container.category_create_use_case().execute(
+        CreateCategoryDTO(name="searched")
+    )
+    posts = {
+        "Cats and dogs": "Notes about pets.",
+        "Soup recipe": "Beetroot, cabbage and catnip. The cat was not impressed.",
+        "Weather": "Rainy today, no cats outside.",
+        "Cat on the roof": "There are dogs here too.",
+    }
+    for title, body in posts.items():
+        await container.post_create_use_case().execute(
+            CreatePostDTO(
+                title=title, body=body, author_id=author.id, category_id=category.id
+            )
+        )
+    use_case = container.post_search_use_case()
+
+    result = await use_case.execute(make_request("/posts/search"), "cat")
+    excluded = await use_case.execute(make_request("/posts/search"), "cat -dog")
+
+    found = [hit.post.title for hit in result.data]
+    # Совпадение в заголовке весомее совпадения в тексте
+    assert set(found[:2]) == {"Cats and dogs", "Cat on the roof"}
+    assert set(found) == set(posts)
+    assert all(hit.rank > 0 for hit in result.data)
+    assert "<mark>cat</mark>" in result.data[found.index("Soup recipe")].snippet
+    assert {hit.post.title for hit in excluded.data} == {"Soup recipe", "Weather"}
+
+    pages: list[str] = []
+    cursor = None
+    while True:
+        page = await use_case.execute(
+            make_request("/posts/search"), "cat", page_size=1, cursor=cursor
+        )
+        pages.extend(hit.post.title for hit in page.data)
+        if not (cursor := page.next_cursor):
+            break
+        assert page.next and "cursor=" in page.next
+    assert pages == found
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_search_escapes_post_markup_and_checks_cursor(
+    container: Container, uow: UnitOfWork
+) -> None:
+    async with uow(autocommit=True):
+        author = await uow.users.create(
+            User(
+                email="markup@test.com",
+                first_name="Markup",
+                last_name="Test",
+                password="hash",
+            )
+        )
+    category = await container.category_create_use_case().execute(
+        CreateCategoryDTO(name="markup")
+    )
+    await container.post_create_use_case().execute(
+        CreatePostDTO(
+            title="Markup",
+            # Такую разметку парсер PostgreSQL не распознаёт как тег и не вырезает
+            body="the cat <img/src=x onerror=alert(1)> <svg onload=alert(1)//",
+            author_id=author.id,
+            category_id=category.id,
+        )
+    )
+    use_case = container.post_search_use_case()
+
+    result = await use_case.execute(make_request("/posts/search"), "cat")
+
+    snippet = result.data[0].snippet
+    assert "<mark>cat</mark>" in snippet
+    assert "<img" not in snippet and "<svg" not in snippet
+    assert "&lt;img/src=x onerror=alert(1)&gt;" in snippet
+    with pytest.raises(APIException) as error:
+        await use_case.execute(
+            make_request("/posts/search"),
+            "cat",
+            cursor=encode_cursor(("2025-01-01T00:00:00", 1)),
+        )
+    assert error.value.code == 400
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_search_ranks_newest_matches_over_cap(
+    container: Container, uow: UnitOfWork, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(SqlAlchemyPostsRepository, "SEARCH_MAX_MATCHES", 3)
+    async with uow(autocommit=True):
+        author = await uow.users.create(
+            User(
+                email="capped@test.com",
+                first_name="Capped",
+                last_name="Test",
+                password="hash",
+            )
+        )
+    category = await container.category_create_use_case().execute(
+        CreateCategoryDTO(name="capped")
+    )
+    # Старые посты совпадают сильнее, но в окно из трёх новейших не попадают
+    titles = [
+        "Lighthouse lighthouse",
+        "Lighthouse keeper",
+        "Harbour",
+        "Pier",
+        "Coast",
+    ]
+    for title in titles:
+        await container.post_create_use_case().execute(
+            CreatePostDTO(
+                title=title,
+                body="a lighthouse on the shore",
+                author_id=author.id,
+                category_id=category.id,
+            )
+        )
+    use_case = container.post_search_use_case()
+
+    result = await use_case.execute(make_request("/posts/search"), "lighthouse")
+
+    found = [hit.post.title for hit in result.data]
+    assert set(found) == {"Harbour", "Pier", "Coast"}
+    pages: list[str] = []
+    cursor = None
+    while True:
+        page = await use_case.execute(
+            make_request("/posts/search"), "lighthouse", page_size=1, cursor=cursor
+        )
+        pages.extend(hit.post.title for hit in page.data)
+        if not (cursor := page.next_cursor):
+            break
+    assert pages == found
@@ -0,0 +1,15 @@
+from fastapi import Request
+
+
+def make_request(path: str = "/", query_string: str = "") -> Request:
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "scheme": "http",
+            "server": ("test", 80),
+            "path": path,
+            "query_string": query_string.encode(),
+            "headers": [],
+        }
+    )
@@ -0,0 +1,60 @@
+import asyncio
+from time import monotonic
+
+import pytest
+
+from domain.entities.enums import ModelType
+from infrastructure.managers.autocomplete import AutocompleteIndex, PrefixIndex
+
+
+def test_search_is_case_insensitive_and_ordered() -> None:
+    index = PrefixIndex(["Python tips", "pytest", "PyPI", "Rust", "python"])
+
+    assert index.search("py", limit=10) == ["PyPI", "pytest", "python", "Python tips"]
+    assert index.search("PYTHON", limit=10) == []
+    assert index.search("python", limit=1) == ["python"]
+    assert index.search("go", limit=10) == []
+
+
+def test_add_and_remove_keep_order_and_size() -> None:
+    index = PrefixIndex(["beta", "Delta"])
+    empty_size = PrefixIndex().nbytes()
+
+    index.add("Alpha")
+    index.add("alpha")
+    index.add("alpha")
+    index.remove("Delta")
+    index.remove("missing")
+
+    assert len(index) == 3
+    assert index.search("", limit=10) == ["Alpha", "alpha", "beta"]
+    assert index.search("al", limit=10) == ["Alpha", "alpha"]
+    for value in ("Alpha", "alpha", "beta"):
+        index.remove(value)
+    assert len(index) == 0
+    assert index.nbytes() <= empty_size + 64
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_aclose_cancels_background_rebuild() -> None:
+    index = AutocompleteIndex(database=None, rebuild_interval=0)
+    index._indexes = {
+        ModelType.POSTS: PrefixIndex(),
+        ModelType.CATEGORIES: PrefixIndex(),
+    }
+    index._loaded_at = monotonic()
+    started = asyncio.Event()
+
+    async def slow_build() -> None:
+        started.set()
+        await asyncio.Event().wait()
+
+    index.build = slow_build
+    await index.suggest("py")
+    rebuild = index._rebuild
+    await started.wait()
+
+    await index.aclose()
+
+    assert rebuild.cancelled()
+    assert index._rebuild is None
@@ -0,0 +1,20 @@
+from infrastructure.managers.bloom import BloomFilter
+
+
+def test_has_no_false_negatives() -> None:
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    items = [f"jti-{index}" for index in range(1000)]
+    for item in items:
+        bloom.add(item)
+
+    assert all(item in bloom for item in items)
+
+
+def test_false_positive_rate_is_bounded() -> None:
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    for index in range(1000):
+        bloom.add(f"jti-{index}")
+
+    false_positives = sum(f"other-{index}" in bloom for index in range(10_000))
+
+    assert false_positives / 10_000 < 0.03
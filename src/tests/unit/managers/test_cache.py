@@ -0,0 +1,40 @@
+from infrastructure.managers import cache
+from infrastructure.managers.cache import TTLCache
+
+
+def test_evicts_least_recently_used() -> None:
+    lru: TTLCache[int, str] = TTLCache(max_size=2, ttl=60)
+    lru.set(1, "one")
+    lru.set(2, "two")
+    assert lru.get(1) == "one"
+
+    lru.set(3, "three")
+
+    assert lru.get(2) is None
+    assert lru.get(1) == "one"
+    assert lru.get(3) == "three"
+
+
+def test_expires_entries_after_ttl(monkeypatch) -> None:
+    now = 100.0
+    monkeypatch.setattr(cache, "monotonic", lambda: now)
+    lru: TTLCache[int, str] = TTLCache(max_size=10, ttl=5)
+    lru.set(1, "one")
+
+    now = 106.0
+
+    assert lru.get(1) is None
+    assert len(lru) == 0
+
+
+def test_counts_hits_and_misses() -> None:
+    lru: TTLCache[int, str] = TTLCache(max_size=10, ttl=60)
+    lru.set(1, "one")
+    lru.get(1)
+    lru.get(2)
+    lru.invalidate(1)
+    lru.get(1)
+
+    stats = lru.stats()
+    assert (stats.hits, stats.misses) == (1, 2)
+    assert stats.size == 0
@@ -0,0 +1,40 @@
+from datetime import UTC, datetime, timedelta
+
+import jwt
+import pytest
+
+from config.settings import Settings
+from infrastructure.managers import jwt_manager
+from infrastructure.managers.cache import TTLCache
+from infrastructure.managers.jwt_manager import JWTManager
+from tests.utils import generate_jwt_token
+
+
+def test_decoded_token_is_served_from_cache(monkeypatch) -> None:
+    settings = Settings()
+    manager = JWTManager(settings, token_cache=TTLCache(max_size=10, ttl=60))
+    token = generate_jwt_token(settings)
+    first = manager.decode_token(token)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("jwt.decode must not be called on a cache hit")
+
+    monkeypatch.setattr(jwt_manager.jwt, "decode", fail)
+
+    assert manager.decode_token(token) is first
+
+
+def test_expired_token_is_not_cached() -> None:
+    settings = Settings()
+    cache: TTLCache[str, dict] = TTLCache(max_size=10, ttl=60)
+    manager = JWTManager(settings, token_cache=cache)
+    token = jwt.encode(
+        {"token_type": "access", "exp": datetime.now(tz=UTC) - timedelta(seconds=1)},
+        settings.jwt.secret_key,
+        algorithm=settings.jwt.algorithm,
+    )
+
+    with pytest.raises(jwt.ExpiredSignatureError):
+        manager.decode_token(token)
+
+    assert len(cache) == 0
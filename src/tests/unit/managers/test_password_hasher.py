@@ -0,0 +1,97 @@
+import asyncio
+
+import pytest
+from common.exceptions import APIException
+from passlib.hash import argon2
+
+from config.settings import PasswordHashingSettings
+from infrastructure.managers.password_hasher import PasswordHasher, calibrate_argon2
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_hash_and_verify() -> None:
+    hasher = PasswordHasher(PasswordHashingSettings(max_workers=1))
+
+    password_hash = await hasher.hash("secret")
+
+    assert await hasher.verify("secret", password_hash)
+    assert not await hasher.verify("wrong", password_hash)
+    hasher.shutdown()
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_rejects_when_queue_is_full() -> None:
+    hasher = PasswordHasher(PasswordHashingSettings(max_workers=1, max_queue=0))
+
+    pending = asyncio.create_task(hasher.hash("first"))
+    await asyncio.sleep(0)
+
+    with pytest.raises(APIException) as error:
+        await hasher.hash("second")
+
+    assert error.value.code == 503
+    await pending
+    assert hasher.in_flight == 0
+    hasher.shutdown()
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_rejects_after_queue_timeout() -> None:
+    hasher = PasswordHasher(
+        PasswordHashingSettings(max_workers=1, max_queue=1, queue_timeout_seconds=0.01)
+    )
+
+    pending = asyncio.create_task(hasher.hash("first"))
+    await asyncio.sleep(0)
+
+    with pytest.raises(APIException) as error:
+        await hasher.hash("second")
+
+    assert error.value.code == 503
+    assert hasher.waiting == 0
+    await pending
+    hasher.shutdown()
+
+
+def test_calibration_respects_memory_floor() -> None:
+    params = calibrate_argon2(
+        target_ms=1, memory_cost=8192, min_memory_cost=4096, parallelism=1
+    )
+
+    assert params == {"rounds": 1, "memory_cost": 4096, "parallelism": 1}
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_detects_hashes_with_outdated_parameters() -> None:
+    settings = PasswordHashingSettings(
+        target_verify_ms=None, time_cost=3, memory_cost=1024
+    )
+    hasher = PasswordHasher(settings)
+
+    current = await hasher.hash("secret")
+    outdated = argon2.using(rounds=1, memory_cost=1024, parallelism=1).hash("secret")
+    parallel = argon2.using(rounds=3, memory_cost=1024, parallelism=2).hash("secret")
+
+    assert not hasher.needs_update(current)
+    assert hasher.needs_update(outdated)
+    assert hasher.needs_update(parallel)
+    hasher.shutdown()
+
+
+def test_stronger_or_slightly_different_hashes_are_kept() -> None:
+    # Воркеры откалибровались по-разному: ни один не перехеширует пароль другого
+    weaker = PasswordHasher(
+        PasswordHashingSettings(target_verify_ms=None, time_cost=4, memory_cost=1024)
+    )
+    stronger = PasswordHasher(
+        PasswordHashingSettings(target_verify_ms=None, time_cost=5, memory_cost=1024)
+    )
+    by_stronger = argon2.using(rounds=5, memory_cost=1024, parallelism=1).hash("x")
+    by_weaker = argon2.using(rounds=4, memory_cost=1024, parallelism=1).hash("x")
+    more_memory = argon2.using(rounds=2, memory_cost=4096, parallelism=1).hash("x")
+
+    assert not weaker.needs_update(by_stronger)
+    assert not stronger.needs_update(by_weaker)
+    assert not stronger.needs_update(more_memory)
+    weaker.shutdown()
+    stronger.shutdown()
@@ -0,0 +1,52 @@
+import pytest
+from common.exceptions import APIException
+
+from config.settings import RateLimitSettings
+from infrastructure.managers import rate_limiter
+from infrastructure.managers.rate_limiter import AuthRateLimiter, TokenBucket
+
+
+def test_bucket_refills_over_time(monkeypatch) -> None:
+    now = 100.0
+    monkeypatch.setattr(rate_limiter, "monotonic", lambda: now)
+    bucket = TokenBucket(capacity=2, refill_per_second=0.5, max_keys=10)
+
+    assert bucket.acquire("a") == 0
+    assert bucket.acquire("a") == 0
+    assert bucket.acquire("a") == pytest.approx(2.0)
+    assert bucket.acquire("b") == 0
+
+    now = 102.0
+
+    assert bucket.acquire("a") == 0
+
+
+def test_bucket_evicts_oldest_keys() -> None:
+    bucket = TokenBucket(capacity=1, refill_per_second=1, max_keys=2)
+    for key in ("a", "b", "c"):
+        bucket.acquire(key)
+
+    assert len(bucket) == 2
+
+
+def test_limiter_rejects_by_email_across_ips() -> None:
+    limiter = AuthRateLimiter(RateLimitSettings(email_capacity=2))
+    limiter.check("10.0.0.1", "user@test.com")
+    limiter.check("10.0.0.2", "USER@test.com")
+
+    with pytest.raises(APIException) as error:
+        limiter.check("10.0.0.3", "user@test.com")
+
+    assert error.value.code == 429
+    assert int(error.value.headers["Retry-After"]) >= 1
+
+
+def test_limiter_keeps_email_tokens_when_ip_rejects() -> None:
+    limiter = AuthRateLimiter(RateLimitSettings(ip_capacity=1, email_capacity=2))
+    limiter.check("10.0.0.1", "victim@test.com")
+    for _ in range(5):
+        with pytest.raises(APIException):
+            limiter.check("10.0.0.1", "victim@test.com")
+
+    # Отклонённые по IP попытки не расходуют попытки аккаунта
+    limiter.check("10.0.0.2", "victim@test.com")
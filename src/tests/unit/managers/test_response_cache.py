@@ -0,0 +1,32 @@
+from infrastructure.managers.response_cache import ResponseCache
+
+
+def test_evicts_least_recently_used_over_memory_budget() -> None:
+    cache = ResponseCache(max_bytes=10, ttl=60)
+    cache.set("a", b"aaaa", tags=())
+    cache.set("b", b"bbbb", tags=())
+    assert cache.get("a") is not None
+
+    cache.set("c", b"cccc", tags=())
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.stats().bytes == 8
+
+
+def test_invalidates_entries_by_tag() -> None:
+    cache = ResponseCache(max_bytes=1024, ttl=60)
+    cache.set("/posts", b"[]", tags=("posts", "categories"))
+    cache.set("/categories", b"[]", tags=("categories",))
+    cache.set("/health", b"{}", tags=())
+
+    cache.invalidate_tags("posts")
+
+    assert cache.get("/posts") is None
+    assert cache.get("/categories") is not None
+
+    cache.invalidate_tags("categories")
+
+    assert cache.get("/categories") is None
+    assert cache.get("/health") is not None
+    assert len(cache) == 1
@@ -0,0 +1,47 @@
+import csv
+import io
+from typing import AsyncIterator
+
+import pytest
+
+from infrastructure.managers import stream_reader
+from infrastructure.managers.stream_reader import read_csv
+
+
+async def chunks(body: bytes, size: int = 7) -> AsyncIterator[bytes]:
+    for start in range(0, len(body), size):
+        yield body[start : start + size]
+
+
+async def records(body: str) -> list:
+    return [record async for record in read_csv(chunks(body.encode()))]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_csv_records_match_csv_module() -> None:
+    body = (
+        "title,body,category,author_email\n"
+        'TV 5" screen,b,c,a@x\n'
+        '"multi\nline ""quoted""",b,c,a@x\n'
+        'x,"a"b,c,a@x\n'
+        "last,b,c,a@x\n"
+    )
+
+    parsed = await records(body)
+
+    expected = list(csv.DictReader(io.StringIO(body)))
+    assert [data for _, data, _ in parsed] == expected
+    assert [number for number, _, _ in parsed] == [2, 3, 5, 6]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_unclosed_quote_is_capped_and_reported(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(stream_reader, "MAX_RECORD_CHARS", 20)
+    body = "title,body\n" '"open,b\n' + "filler line\n" * 5 + "after,b\n"
+
+    parsed = await records(body)
+
+    assert parsed[0][0] == 2 and "слишком длинная" in parsed[0][2]
+    assert parsed[-1] == (8, {"title": "after", "body": "b"}, None)
@@ -0,0 +1,90 @@
+import json
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+from infrastructure.middleware.sanitize_html import SanitizeHTMLMiddleware
+
+
+async def echo(request: Request) -> JSONResponse:
+    return JSONResponse(
+        {"body": await request.json(), "length": request.headers["content-length"]}
+    )
+
+
+@pytest.fixture()
+def echo_client() -> AsyncClient:
+    app = Starlette(routes=[Route("/echo", echo, methods=["POST"])])
+    app.add_middleware(SanitizeHTMLMiddleware)
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_sanitizes_nested_content_html(echo_client: AsyncClient) -> None:
+    payload = {"items": [{"content_html": "<p>ok</p><script>x()</script>"}]}
+
+    response = await echo_client.post("/echo", json=payload)
+
+    data = response.json()
+    assert data["body"] == {"items": [{"content_html": "<p>ok</p>x()"}]}
+    assert int(data["length"]) == len(json.dumps(data["body"]).encode())
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_passes_body_without_html_unchanged(echo_client: AsyncClient) -> None:
+    payload = {"title": "<b>kept</b>"}
+
+    response = await echo_client.post("/echo", json=payload)
+
+    assert response.json()["body"] == payload
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_sanitizes_key_written_with_unicode_escape(
+    echo_client: AsyncClient,
+) -> None:
+    body = b'{"content\\u005fhtml": "<p>ok</p><script>x()</script>"}'
+
+    response = await echo_client.post(
+        "/echo", content=body, headers={"Content-Type": "application/json"}
+    )
+
+    assert response.json()["body"] == {"content_html": "<p>ok</p>x()"}
+
+
+@pytest.mark.asyncio(loop_scope="session")
+@pytest.mark.parametrize("encoding", ["utf-16", "utf-16-le", "utf-32"])
+async def test_sanitizes_utf16_and_utf32_bodies(
+    echo_client: AsyncClient, encoding: str
+) -> None:
+    body = json.dumps({"content_html": "<p>ok</p><script>x()</script>"})
+
+    response = await echo_client.post(
+        "/echo",
+        content=body.encode(encoding),
+        headers={"Content-Type": "application/json"},
+    )
+
+    assert response.json()["body"] == {"content_html": "<p>ok</p>x()"}
+
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_passes_undecodable_body_unchanged() -> None:
+    async def raw(request: Request) -> Response:
+        return Response(await request.body())
+
+    app = Starlette(routes=[Route("/raw", raw, methods=["POST"])])
+    app.add_middleware(SanitizeHTMLMiddleware)
+    client = AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+    body = b'\x80{"content_html": "<script>x()</script>"}'
+
+    response = await client.post(
+        "/raw", content=body, headers={"Content-Type": "application/json"}
+    )
+
+    assert response.content == body
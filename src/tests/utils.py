@@ -1,5 +1,6 @@
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
+from typing import Any
 
 import jwt
 from alembic import command
@@ -83,13 +84,19 @@ def create_default_database_engine(settings: Settings) -> AsyncEngine:
     )
 
 
-def generate_jwt_token(settings: Settings) -> str:
+def generate_jwt_token(
+    settings: Settings,
+    user_id: int = DEFAULT_USER_ID,
+    email: str = DEFAULT_USER_EMAIL,
+    **claims: Any,
+) -> str:
     payload = {
         "token_type": "access",
         "role": RoleEnum.ADMIN,
-        "email": DEFAULT_USER_EMAIL,
-        "user_id": DEFAULT_USER_ID,
+        "email": email,
+        "user_id": user_id,
         "exp": datetime.now(tz=UTC) + timedelta(hours=1),
+        **claims,
     }
 
     return jwt.encode(